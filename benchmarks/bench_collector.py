@@ -0,0 +1,42 @@
+"""Benchmark the HTML collector on deeply nested and very large pages.
+
+Run with ``python benchmarks/bench_collector.py``. Each case reports the input
+size and how long a CSS extraction over the whole document takes; time should
+grow linearly with page size regardless of nesting depth.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sentrykit.verify.extract import extract_css  # noqa: E402
+
+
+def _nested(depth: int) -> str:
+    return "<div>" * depth + "<span class='pay'>$5,500</span> per month" + "</div>" * depth
+
+
+def _wide(rows: int) -> str:
+    row = "<div><p>Listing {} pays $5,500 per month</p></div>"
+    body = "".join(row.format(index) for index in range(rows))
+    return f"<html><body>{body}</body></html>"
+
+
+def main() -> None:
+    cases = [(f"nested depth={depth}", _nested(depth), "div") for depth in (100, 250, 500)]
+    cases += [(f"wide rows={rows}", _wide(rows), "body") for rows in (1_000, 10_000, 100_000)]
+    print(f"{'case':<22} {'size (KiB)':>11} {'extract (ms)':>13}")
+    for name, html, selector in cases:
+        started = time.perf_counter()
+        extract_css(html, selector, max_depth=1024)
+        elapsed = (time.perf_counter() - started) * 1e3
+        print(f"{name:<22} {len(html) / 1024:>11.1f} {elapsed:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark evidence corpus indexing and snippet queries.
+
+Run with ``python benchmarks/bench_corpus.py``. It indexes synthetic corpora of
+growing size in a temporary directory and compares the time to answer "which
+documents contain this snippet" through the trigram index with a linear scan
+over every document.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sentrykit.verify.corpus import EvidenceCorpus  # noqa: E402
+
+WORDS = [f"term{index}" for index in range(5_000)]
+
+
+def _document(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(300))
+
+
+def main() -> None:
+    rng = random.Random(7)
+    print(f"{'documents':>10} {'index (s)':>10} {'query (ms)':>11} {'scan (ms)':>10} {'hits':>5}")
+    for size in (1_000, 5_000, 20_000):
+        documents = [(f"https://ref.example.com/{index}", _document(rng)) for index in range(size)]
+        needle = documents[size // 2][1][40:80]
+        with tempfile.TemporaryDirectory() as directory:
+            started = time.perf_counter()
+            with EvidenceCorpus(directory) as corpus:
+                corpus.add_all(documents)
+            indexed = time.perf_counter() - started
+
+            with EvidenceCorpus(directory) as corpus:
+                started = time.perf_counter()
+                hits = corpus.search(needle)
+                query_ms = (time.perf_counter() - started) * 1e3
+
+            started = time.perf_counter()
+            scanned = [url for url, text in documents if needle in text.lower()]
+            scan_ms = (time.perf_counter() - started) * 1e3
+        assert hits == scanned
+        print(f"{size:>10} {indexed:>10.2f} {query_ms:>11.2f} {scan_ms:>10.2f} {len(hits):>5}")
+
+
+if __name__ == "__main__":
+    main()
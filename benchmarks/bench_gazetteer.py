@@ -0,0 +1,105 @@
+"""Benchmark loading and scanning a large location gazetteer.
+
+Run with ``python benchmarks/bench_gazetteer.py``. Builds a synthetic gazetteer
+of 10,000 metros with four more aliases and membership for one location in
+five (50,000 aliases in total), then times loading the file and scanning text
+for locations, against the substring test per alias that the drift checker
+used before.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sentrykit.utils.gazetteer import Gazetteer  # noqa: E402
+
+WORDS = (
+    "the contract renews in 2025 and covers 1200 seats across regions with a"
+    " quarterly review of usage metrics by the finance team"
+).split()
+SYLLABLES = "ba ca da fe ga hi jo ka lu ma ne po qui ra si tu vo wa xe yo zu".split()
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def _gazetteer(count: int) -> Dict[str, object]:
+    rng = random.Random(17)
+    names: List[str] = []
+    seen = set()
+    while len(names) < count:
+        name = " ".join(_word(rng) for _ in range(rng.randint(1, 2)))
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    locations = []
+    for index, name in enumerate(names):
+        entry: Dict[str, object] = {
+            "name": name,
+            "aliases": [f"{name} metro", f"{name}, tx", f"greater {name}", f"{name} {index}"],
+        }
+        if index % 5 and index > 5:
+            entry["metro"] = names[index - index % 5]
+        locations.append(entry)
+    return {"version": 1, "locations": locations}
+
+
+def _time(label: str, func):
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<18} {elapsed * 1e3:>9.1f} ms")
+    return result
+
+
+def main() -> None:
+    data = _gazetteer(10_000)
+    entries = data["locations"]
+    aliases = sum(1 + len(entry["aliases"]) for entry in entries)  # type: ignore[attr-defined]
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "locations.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        print(f"{aliases} aliases, {path.stat().st_size / 1024:.0f} KiB file")
+        gazetteer = _time("load", lambda: Gazetteer.load(path))
+
+    rng = random.Random(3)
+    names = [entry["name"] for entry in data["locations"]]  # type: ignore[index]
+
+    def sample_text(count: int, mentions: int) -> str:
+        words = [rng.choice(WORDS) for _ in range(count)]
+        for position in rng.sample(range(len(words)), mentions):
+            words[position] = f"{rng.choice(names)} metro"
+        return " ".join(words)
+
+    large = sample_text(200_000, 1_000)
+    print(f"{len(large) / 1024:.0f} KiB text")
+    _time("scan", lambda: gazetteer.find(large))
+    text = sample_text(2_000, 40)
+    print(f"{len(text) / 1024:.0f} KiB text")
+    found = _time("scan", lambda: gazetteer.find(text))
+
+    keyword_map = {
+        entry["name"]: {entry["name"], *entry["aliases"]}  # type: ignore[index]
+        for entry in data["locations"]  # type: ignore[union-attr]
+    }
+
+    def substring() -> set:
+        lowered = text.lower()
+        return {name for name, keys in keyword_map.items() if any(key in lowered for key in keys)}
+
+    _time("substring per alias", substring)
+    print(f"  {len(found)} locations found")
+
+
+if __name__ == "__main__":
+    main()
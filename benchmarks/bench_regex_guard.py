@@ -0,0 +1,56 @@
+"""Benchmark the regex guards against the pathological pattern corpus.
+
+Run with ``python benchmarks/bench_regex_guard.py``. For every pattern in
+``tests/fixtures/regex/pathological.txt`` it reports how long the static check
+takes to reject it and how long the sandbox takes to give up on it.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sentrykit.errors import ParseError  # noqa: E402
+from sentrykit.verify.safe_regex import RegexSandbox, check_pattern  # noqa: E402
+
+CORPUS = ROOT / "tests" / "fixtures" / "regex" / "pathological.txt"
+SUBJECT = "a" * 40 + "x" * 40 + " " * 40 + "!"
+
+
+def main() -> None:
+    patterns = [
+        line
+        for line in CORPUS.read_text(encoding="utf-8").splitlines()
+        if line and not line.startswith("#")
+    ]
+    sandbox = RegexSandbox(budget=0.25)
+    sandbox.search("warmup", "warmup")
+    print(f"{'pattern':<36} {'static (us)':>12} {'sandbox (ms)':>13}  outcome")
+    try:
+        for pattern in patterns:
+            started = time.perf_counter()
+            try:
+                check_pattern(pattern)
+                static = "accepted"
+            except ParseError:
+                static = "rejected"
+            static_us = (time.perf_counter() - started) * 1e6
+
+            started = time.perf_counter()
+            try:
+                sandbox.search(pattern, SUBJECT)
+                outcome = "completed"
+            except ParseError:
+                outcome = "timed out"
+            sandbox_ms = (time.perf_counter() - started) * 1e3
+            print(f"{pattern:<36} {static_us:>12.1f} {sandbox_ms:>13.1f}  {static}, {outcome}")
+    finally:
+        sandbox.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark NDJSON against the binary verdict format.
+
+Run with ``python benchmarks/bench_serialize.py``. The corpus mimics audit logs:
+verdicts with zero to four findings drawn from the built-in checkers, repeated
+reasons and details, and small evidence dictionaries. Decoding is timed twice:
+streamed, the way an audit log is usually consumed, and collected into a list,
+where the garbage collector's passes over the growing heap cost both formats
+alike and narrow the gap.
+"""
+
+from __future__ import annotations
+
+import io
+import random
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Iterable, List, TypeVar
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sentrykit.models import Finding, Verdict  # noqa: E402
+from sentrykit.report import serialize  # noqa: E402
+
+T = TypeVar("T")
+
+TEMPLATES = [
+    ("goal_drift", "high", "Output location mismatches goal", {"expected": "austin"}),
+    ("goal_drift", "medium", "Pay below minimum threshold", {"min_pay": 5000}),
+    ("data_leak", "high", "Secret pattern detected in output", {"pattern": "aws_access_key"}),
+    ("tool_firewall", "high", "Tool not on allow-list", {"tool": "shell"}),
+    ("context_poisoning", "medium", "Override phrase in context", {"source": "retriever"}),
+    ("hallucination", "high", "Claim lacks verifiable evidence", {"errors": ["fetch_error"]}),
+]
+
+
+def _corpus(size: int) -> List[Verdict]:
+    rng = random.Random(11)
+    verdicts = []
+    for _ in range(size):
+        picked = rng.sample(TEMPLATES, rng.randint(0, 4))
+        findings = [
+            Finding(kind, severity, details, dict(evidence))
+            for kind, severity, details, evidence in picked
+        ]
+        reason = "; ".join(sorted({finding.kind for finding in findings})) or "No findings"
+        score = rng.choice([0.0, 0.5, 1.0, 1.5])
+        verdicts.append(
+            Verdict(blocked=bool(findings), reason=reason, score=score, findings=findings)
+        )
+    return verdicts
+
+
+def _drain(verdicts: Iterable[Verdict]) -> None:
+    deque(verdicts, maxlen=0)
+
+
+def _time(label: str, func: Callable[[], T]) -> T:
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<16} {elapsed * 1e3:>9.1f} ms")
+    return result
+
+
+def main() -> None:
+    verdicts = _corpus(100_000)
+    print(f"{len(verdicts)} verdicts")
+
+    text = io.StringIO()
+    _time("ndjson encode", lambda: serialize.write_ndjson(verdicts, text))
+    ndjson = text.getvalue().encode("utf-8")
+    _time("ndjson stream", lambda: _drain(serialize.read_ndjson(io.StringIO(text.getvalue()))))
+    decoded = _time(
+        "ndjson decode", lambda: list(serialize.read_ndjson(io.StringIO(text.getvalue())))
+    )
+    assert decoded == verdicts
+
+    binary = io.BytesIO()
+    _time("binary encode", lambda: serialize.write_binary(verdicts, binary))
+    _time("binary stream", lambda: _drain(serialize.read_binary(io.BytesIO(binary.getvalue()))))
+    decoded = _time(
+        "binary decode", lambda: list(serialize.read_binary(io.BytesIO(binary.getvalue())))
+    )
+    assert decoded == verdicts
+
+    size = len(binary.getvalue())
+    print(
+        f"  ndjson {len(ndjson) / 1024:.0f} KiB, binary {size / 1024:.0f} KiB "
+        f"({len(ndjson) / size:.1f}x smaller)"
+    )
+
+
+if __name__ == "__main__":
+    main()
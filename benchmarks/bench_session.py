@@ -0,0 +1,90 @@
+"""Benchmark guarding a long conversation turn by turn.
+
+Run with ``python benchmarks/bench_session.py``. Plays a 200-turn conversation
+where every turn adds a user message, a retrieved context, a tool call and an
+assistant reply, and evaluates after each turn: once by rebuilding the whole
+``RunInput`` and calling ``GuardEngine.evaluate``, as the adapters used to, and
+once through a ``GuardSession`` that only checks the new content.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sentrykit import GuardEngine, GuardSession, Policy  # noqa: E402
+from sentrykit.models import ContextChunk, RunInput, RunOutput, ToolCall  # noqa: E402
+
+GOAL = "Find Austin internships for summer 2025 paying at least $4,000 per month"
+WORDS = (
+    "the team reviewed austin listings for summer 2025 and shared notes on pay"
+    " ranges benefits mentors and start dates with the candidate"
+).split()
+TURNS = 200
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _turns() -> List[Tuple[str, ContextChunk, ToolCall, str]]:
+    rng = random.Random(5)
+    return [
+        (
+            _text(rng, 30),
+            ContextChunk(f"https://jobs.example/{index}", _text(rng, 400)),
+            ToolCall("search", {"query": _text(rng, 6)}),
+            _text(rng, 80),
+        )
+        for index in range(TURNS)
+    ]
+
+
+def _time(label: str, func):
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<18} {elapsed * 1e3:>9.1f} ms")
+    return result
+
+
+def main() -> None:
+    turns = _turns()
+    policy = Policy(allowed_tool_names={"search"})
+    print(f"{TURNS} turns")
+
+    def rebuild() -> int:
+        engine = GuardEngine(policy)
+        run = RunInput(goal=GOAL, constraints=[], messages=[], contexts=[], tool_calls=[])
+        findings = 0
+        for question, context, call, reply in turns:
+            run.messages.extend([("user", question), ("assistant", reply)])
+            run.contexts.append(context)
+            run.tool_calls.append(call)
+            run.output = RunOutput(text=reply)
+            findings = len(engine.evaluate(run).findings)
+        return findings
+
+    def session() -> int:
+        guard = GuardSession(GuardEngine(policy), GOAL)
+        for question, context, call, reply in turns:
+            guard.update(
+                messages=[("user", question), ("assistant", reply)],
+                contexts=[context],
+                tool_calls=[call],
+                output=RunOutput(text=reply),
+            )
+        return len(guard.findings)
+
+    _time("rebuild + evaluate", rebuild)
+    _time("session", session)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,11 +14,23 @@ class BaseCallbackHandler:
     def on_chain_end(self, outputs: Dict[str, Any], **kwargs: Any) -> None:
         return None
 
+    def on_chain_error(self, error: BaseException, **kwargs: Any) -> None:
+        return None
+
+    def on_tool_start(self, serialized: Dict[str, Any], input_str: str, **kwargs: Any) -> None:
+        return None
+
+    def on_retriever_start(self, serialized: Dict[str, Any], query: str, **kwargs: Any) -> None:
+        return None
+
     def on_retriever_end(self, documents: List[Any], **kwargs: Any) -> None:
         return None
 
     def on_tool_end(self, output: Any, *, name: str | None = None, **kwargs: Any) -> None:
         return None
 
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], **kwargs: Any) -> None:
+        return None
+
     def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Dict[str, Any]]], **kwargs: Any) -> None:
         return None
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from .engine import GuardEngine
 from .policy import Policy
+from .session import GuardSession
 
-__all__ = ["GuardEngine", "Policy", "errors", "models"]
+__all__ = ["GuardEngine", "GuardSession", "Policy", "errors", "models"]
 
 from . import errors, models
 
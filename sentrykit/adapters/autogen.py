@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import importlib
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, List
 
 from ..engine import GuardEngine
 from ..errors import AdapterImportError, PolicyViolationError
-from ..models import ContextChunk, RunInput, RunOutput, ToolCall
+from ..models import ContextChunk, Finding, RunOutput, ToolCall
 from ..policy import Policy
+from ..session import GuardSession
 
 
 def _ensure_dependency() -> None:
@@ -17,7 +18,14 @@ def _ensure_dependency() -> None:
 
 
 def register_reply(agent: Any, policy: Policy, engine: GuardEngine | None = None) -> None:
-    """Register a reply interceptor for an AutoGen agent."""
+    """Register a reply interceptor for an AutoGen agent.
+
+    The conversation is tracked in a :class:`~sentrykit.session.GuardSession`, so
+    each reply only evaluates the reply itself and the goal, context and tool
+    calls that changed since the previous one. Findings from the goal, context
+    and tool calls are kept while those inputs stay in place, so every reply made
+    under them is judged on them just as the first one was.
+    """
 
     _ensure_dependency()
     engine = engine or GuardEngine(policy)
@@ -26,20 +34,44 @@ def register_reply(agent: Any, policy: Policy, engine: GuardEngine | None = None
     if original_reply is None:
         raise AdapterImportError("Agent does not expose a reply method for interception.")
 
+    session = GuardSession(engine)
+    seen: Dict[str, Any] = {"goal": None, "context": "", "tool_calls": 0}
+    # Findings from the agent's standing inputs, kept until the input is replaced.
+    standing: Dict[str, List[Finding]] = {"goal": [], "context": [], "tool_calls": []}
+
     def _wrapped_reply(*args: Any, **kwargs: Any) -> Any:
         result = original_reply(*args, **kwargs)
         message = result.get("content", "") if isinstance(result, dict) else str(result)
-        run = RunInput(
-            goal=str(getattr(agent, "goal", "")),
-            constraints=[],
-            messages=[("assistant", message)],
-            contexts=[ContextChunk(source="autogen", text=str(getattr(agent, "context", "")))],
-            tool_calls=[ToolCall(name=call.get("name", ""), args=dict(call.get("args", {}))) for call in getattr(agent, "tool_calls", [])],
-            output=RunOutput(text=message),
+        goal = str(getattr(agent, "goal", ""))
+        if goal != seen["goal"]:
+            session.goal = seen["goal"] = goal
+            standing["goal"] = session.update()
+        context = str(getattr(agent, "context", ""))
+        previous = seen["context"]
+        if context != previous:
+            # Context usually grows by appending; only the new suffix needs checking.
+            if not context.startswith(previous):
+                previous = ""
+                standing["context"] = []
+            if context[len(previous) :]:
+                chunk = ContextChunk(source="autogen", text=context[len(previous) :])
+                standing["context"] = standing["context"] + session.add_context(chunk)
+            seen["context"] = context
+        calls = getattr(agent, "tool_calls", [])[seen["tool_calls"] :]
+        if calls:
+            seen["tool_calls"] += len(calls)
+            standing["tool_calls"] = standing["tool_calls"] + session.update(
+                tool_calls=[
+                    ToolCall(name=call.get("name", ""), args=dict(call.get("args", {})))
+                    for call in calls
+                ]
+            )
+        findings = [finding for group in standing.values() for finding in group]
+        findings += session.update(
+            messages=[("assistant", message)], output=RunOutput(text=message)
         )
-        verdict = engine.evaluate(run)
-        if verdict.blocked:
-            raise PolicyViolationError(verdict.reason)
+        if engine.should_block(findings):
+            raise PolicyViolationError("; ".join(sorted({finding.kind for finding in findings})))
         return result
 
     setattr(agent, "reply", _wrapped_reply)
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import importlib
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, Final, List, Optional, Tuple
 
 from ..engine import GuardEngine
 from ..errors import AdapterImportError, PolicyViolationError
 from ..models import ContextChunk, RunInput, RunOutput, ToolCall
 from ..policy import Policy
+from ..verify.prefetch import EvidencePrefetcher
 
 try:  # pragma: no cover - import guard
     _LC_CALLBACKS = importlib.import_module("langchain_core.callbacks")
@@ -23,11 +27,47 @@ except Exception:  # pragma: no cover - compatibility fallback
         BaseCallbackHandler = object  # type: ignore[assignment]
         _LANGCHAIN_AVAILABLE = False
 
+_MISSING: Final = object()
+
+
+@dataclass(slots=True)
+class _RunState:
+    """What a root run and its nested runs have gathered so far."""
+
+    goal: str = ""
+    constraints: List[str] = field(default_factory=list)
+    messages: List[Tuple[str, str]] = field(default_factory=list)
+    contexts: List[ContextChunk] = field(default_factory=list)
+    tool_calls: List[ToolCall] = field(default_factory=list)
+    prefetches: List[Future[None]] = field(default_factory=list)
+    # Every run id mapped to this root, released together with it.
+    runs: List[Any] = field(default_factory=list)
+
 
 class SentryKitCallback(BaseCallbackHandler):
-    """LangChain callback handler that evaluates final outputs."""
+    """LangChain callback handler that evaluates final outputs.
 
-    def __init__(self, policy: Policy, engine: Optional[GuardEngine] = None) -> None:
+    State is kept per root run: nested chains, retrievers, tools, LLMs and chat models
+    are attributed to the root through their ``parent_run_id``, so concurrent
+    invocations sharing one handler do not mix. The run is evaluated when the
+    root chain ends, and its state is released then or when the root chain
+    fails. Events from runs the handler never saw start are ignored.
+
+    When a ``prefetcher`` is supplied, URLs on its allow-list seen in tool
+    inputs/outputs and retrieved document metadata are fetched in the background
+    so the final hallucination check mostly hits the cache. A root run waits only
+    for the prefetches of URLs its own events saw. The prefetcher should share
+    the engine's ``evidence_cache``.
+    """
+
+    def __init__(
+        self,
+        policy: Policy,
+        engine: Optional[GuardEngine] = None,
+        *,
+        prefetcher: Optional[EvidencePrefetcher] = None,
+        prefetch_wait: float = 2.0,
+    ) -> None:
         if not _LANGCHAIN_AVAILABLE:
             raise AdapterImportError(
                 "LangChain is not installed. Install sentrykit with the 'langchain' extra."
@@ -35,61 +75,218 @@ class SentryKitCallback(BaseCallbackHandler):
         super().__init__()
         self.policy = policy
         self.engine = engine or GuardEngine(policy)
-        self._contexts: List[ContextChunk] = []
-        self._tool_calls: List[ToolCall] = []
-        self._messages: List[tuple[str, str]] = []
-        self._goal: str = ""
-        self._constraints: List[str] = []
-
-    def on_chain_start(self, serialized: Dict[str, Any], inputs: Dict[str, Any], **kwargs: Any) -> None:  # noqa: D401
-        self._goal = str(inputs.get("goal") or inputs.get("question") or inputs.get("input") or "")
+        self.prefetcher = prefetcher
+        self.prefetch_wait = prefetch_wait
+        self._states: Dict[Any, _RunState] = {}  # root run id -> state
+        self._roots: Dict[Any, Any] = {}  # run id -> root run id
+        self._lock = threading.Lock()
+
+    def _enter(self, run_id: Any, parent_run_id: Any) -> _RunState:
+        """Attribute a starting run to its parent's root; a run without a known parent is a root."""
+
+        with self._lock:
+            root = self._roots.get(run_id, _MISSING)
+            if root is _MISSING:
+                root = self._roots.get(parent_run_id, _MISSING)
+                if root is _MISSING or parent_run_id is None:
+                    root = run_id
+                self._roots[run_id] = root
+                state = self._states.get(root)
+                if state is None:
+                    state = self._states[root] = _RunState()
+                state.runs.append(run_id)
+                return state
+            return self._states[root]
+
+    def _nest(self, run_id: Any, parent_run_id: Any) -> _RunState | None:
+        """Attribute a starting non-chain run to its parent's root, if that root is open.
+
+        Registering these runs lets chains started inside them, such as the chain
+        a multi-query retriever runs, be nested under the same root.
+        """
+
+        if parent_run_id is None or self._state(parent_run_id, None) is None:
+            return None
+        return self._enter(run_id, parent_run_id)
+
+    def _state(self, run_id: Any, parent_run_id: Any) -> _RunState | None:
+        """Return the state an ending run belongs to, if its root is still open."""
+
+        with self._lock:
+            root = self._roots.get(run_id, _MISSING)
+            if root is _MISSING:
+                root = self._roots.get(parent_run_id, _MISSING)
+            return None if root is _MISSING else self._states.get(root)
+
+    def _release(self, run_id: Any) -> _RunState | None:
+        """Forget a root run and every run mapped to it; ``None`` for nested runs."""
+
+        with self._lock:
+            if run_id not in self._states or self._roots.get(run_id, _MISSING) != run_id:
+                return None
+            state = self._states.pop(run_id)
+            for child in state.runs:
+                self._roots.pop(child, None)
+            return state
+
+    def on_chain_start(
+        self,
+        serialized: Dict[str, Any],
+        inputs: Dict[str, Any],
+        *,
+        run_id: Any = None,
+        parent_run_id: Any = None,
+        **kwargs: Any,
+    ) -> None:  # noqa: D401
+        state = self._enter(run_id, parent_run_id)
+        # The root chain's goal and constraints win over those of nested chains.
+        if not state.goal:
+            goal = inputs.get("goal") or inputs.get("question") or inputs.get("input")
+            state.goal = str(goal or "")
         constraint = inputs.get("constraints")
-        if isinstance(constraint, list):
-            self._constraints = [str(item) for item in constraint]
-        elif constraint:
-            self._constraints = [str(constraint)]
+        if isinstance(constraint, list) and not state.constraints:
+            state.constraints = [str(item) for item in constraint]
+        elif constraint and not state.constraints:
+            state.constraints = [str(constraint)]
         prompts = inputs.get("messages") or inputs.get("chat_history")
         if isinstance(prompts, list):
             for message in prompts:
                 role = str(message.get("type") or message.get("role") or "user")
                 content = str(message.get("content") or message.get("text") or "")
-                self._messages.append((role, content))
-        super().on_chain_start(serialized, inputs, **kwargs)
-
-    def on_retriever_end(self, documents: List[Any], **kwargs: Any) -> None:  # noqa: D401
-        for doc in documents:
-            metadata = getattr(doc, "metadata", {})
-            source = str(metadata.get("source", "retriever"))
-            text = str(getattr(doc, "page_content", ""))
-            self._contexts.append(ContextChunk(source=source, text=text))
-        super().on_retriever_end(documents, **kwargs)
-
-    def on_tool_end(self, output: Any, *, name: str | None = None, **kwargs: Any) -> None:  # noqa: D401
+                state.messages.append((role, content))
+        super().on_chain_start(
+            serialized, inputs, run_id=run_id, parent_run_id=parent_run_id, **kwargs
+        )
+
+    def on_retriever_start(
+        self,
+        serialized: Dict[str, Any],
+        query: str,
+        *,
+        run_id: Any = None,
+        parent_run_id: Any = None,
+        **kwargs: Any,
+    ) -> None:  # noqa: D401
+        self._nest(run_id, parent_run_id)
+        super().on_retriever_start(
+            serialized, query, run_id=run_id, parent_run_id=parent_run_id, **kwargs
+        )
+
+    def on_retriever_end(
+        self, documents: List[Any], *, run_id: Any = None, parent_run_id: Any = None, **kwargs: Any
+    ) -> None:  # noqa: D401
+        state = self._state(run_id, parent_run_id)
+        if state is not None:
+            for doc in documents:
+                metadata = getattr(doc, "metadata", {})
+                source = str(metadata.get("source", "retriever"))
+                text = str(getattr(doc, "page_content", ""))
+                state.contexts.append(ContextChunk(source=source, text=text))
+                if self.prefetcher is not None:
+                    state.prefetches.extend(self.prefetcher.track(metadata))
+        super().on_retriever_end(documents, run_id=run_id, parent_run_id=parent_run_id, **kwargs)
+
+    def on_tool_start(
+        self,
+        serialized: Dict[str, Any],
+        input_str: str,
+        *,
+        run_id: Any = None,
+        parent_run_id: Any = None,
+        **kwargs: Any,
+    ) -> None:  # noqa: D401
+        self._nest(run_id, parent_run_id)
+        super().on_tool_start(
+            serialized, input_str, run_id=run_id, parent_run_id=parent_run_id, **kwargs
+        )
+
+    def on_tool_end(
+        self,
+        output: Any,
+        *,
+        name: str | None = None,
+        run_id: Any = None,
+        parent_run_id: Any = None,
+        **kwargs: Any,
+    ) -> None:  # noqa: D401
+        state = self._state(run_id, parent_run_id)
         args = kwargs.get("inputs") or {}
-        if isinstance(args, dict):
-            self._tool_calls.append(ToolCall(name=name or "tool", args=dict(args)))
-        super().on_tool_end(output, name=name, **kwargs)
-
-    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Dict[str, Any]]], **kwargs: Any) -> None:  # noqa: D401,E501
-        for thread in messages:
-            for message in thread:
-                role = str(message.get("role", "user"))
-                content = str(message.get("content", ""))
-                self._messages.append((role, content))
-        super().on_chat_model_start(serialized, messages, **kwargs)
-
-    def on_chain_end(self, outputs: Dict[str, Any], **kwargs: Any) -> None:  # noqa: D401
-        text = str(outputs.get("output_text") or outputs.get("result") or outputs.get("text") or "")
+        if state is not None and isinstance(args, dict):
+            state.tool_calls.append(ToolCall(name=name or "tool", args=dict(args)))
+        if state is not None and self.prefetcher is not None:
+            state.prefetches.extend(self.prefetcher.track([args, output]))
+        super().on_tool_end(
+            output, name=name, run_id=run_id, parent_run_id=parent_run_id, **kwargs
+        )
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[Dict[str, Any]]],
+        *,
+        run_id: Any = None,
+        parent_run_id: Any = None,
+        **kwargs: Any,
+    ) -> None:  # noqa: D401
+        state = self._nest(run_id, parent_run_id)
+        if state is not None:
+            for thread in messages:
+                for message in thread:
+                    role = str(message.get("role", "user"))
+                    content = str(message.get("content", ""))
+                    state.messages.append((role, content))
+        super().on_chat_model_start(
+            serialized, messages, run_id=run_id, parent_run_id=parent_run_id, **kwargs
+        )
+
+    def on_llm_start(
+        self,
+        serialized: Dict[str, Any],
+        prompts: List[str],
+        *,
+        run_id: Any = None,
+        parent_run_id: Any = None,
+        **kwargs: Any,
+    ) -> None:  # noqa: D401
+        self._nest(run_id, parent_run_id)
+        super().on_llm_start(
+            serialized, prompts, run_id=run_id, parent_run_id=parent_run_id, **kwargs
+        )
+
+    def on_chain_error(
+        self, error: BaseException, *, run_id: Any = None, parent_run_id: Any = None, **kwargs: Any
+    ) -> None:  # noqa: D401
+        self._release(run_id)
+        super().on_chain_error(error, run_id=run_id, parent_run_id=parent_run_id, **kwargs)
+
+    def on_chain_end(
+        self,
+        outputs: Dict[str, Any],
+        *,
+        run_id: Any = None,
+        parent_run_id: Any = None,
+        **kwargs: Any,
+    ) -> None:  # noqa: D401
+        state = self._release(run_id)
+        if state is not None:
+            self._evaluate(state, outputs)
+        super().on_chain_end(outputs, run_id=run_id, parent_run_id=parent_run_id, **kwargs)
+
+    def _evaluate(self, state: _RunState, outputs: Dict[str, Any]) -> None:
+        text = str(
+            outputs.get("output_text") or outputs.get("result") or outputs.get("text") or ""
+        )
         claims = outputs.get("claims") or []
+        if self.prefetcher is not None:
+            self.prefetcher.wait(self.prefetch_wait, state.prefetches)
         run = RunInput(
-            goal=self._goal,
-            constraints=self._constraints,
-            messages=self._messages,
-            contexts=self._contexts,
-            tool_calls=self._tool_calls,
+            goal=state.goal,
+            constraints=state.constraints,
+            messages=state.messages,
+            contexts=state.contexts,
+            tool_calls=state.tool_calls,
             output=RunOutput(text=text, claims=claims),
         )
         verdict = self.engine.evaluate(run)
         if verdict.blocked:
             raise PolicyViolationError(verdict.reason)
-        super().on_chain_end(outputs, **kwargs)
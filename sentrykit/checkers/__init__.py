@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from . import drift, hallucination, jailbreak, leaks, poisoning, tool_firewall
+from . import drift, entropy, hallucination, jailbreak, leaks, poisoning, tool_firewall
 
 __all__ = [
     "drift",
+    "entropy",
     "hallucination",
     "jailbreak",
     "leaks",
@@ -2,22 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
 import re
-from typing import List, Optional, Set
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional, Sequence, Set, Tuple
 
 from ..models import Finding, RunInput
-
-_LOCATION_KEYWORDS: dict[str, Set[str]] = {
-    "austin": {"austin", "austin, tx", "austin texas", "atx", "austin metro"},
-    "dallas": {"dallas", "dallas, tx", "dfw", "dallas metro"},
-    "round rock": {"round rock"},
-    "cedar park": {"cedar park"},
-    "pflugerville": {"pflugerville"},
-    "leander": {"leander"},
-    "remote": {"remote", "work from anywhere"},
-}
-
-_AUSTIN_METRO = {"round rock", "cedar park", "pflugerville", "leander"}
+from ..utils.cache import CacheStats, LRUCache
+from ..utils.gazetteer import Gazetteer
 
 _SEASON_PATTERN = re.compile(r"(spring|summer|fall|autumn|winter)\s+(20\d{2})", re.I)
 _PAY_PATTERN = re.compile(
@@ -25,15 +17,108 @@ _PAY_PATTERN = re.compile(
     re.I,
 )
 _COMPANY_SIZE_PATTERN = re.compile(r"(\d{2,})\s*(?:\+\s*)?(?:employees|people|staff)\b", re.I)
+# The three patterns above in one alternation. The season branch consumes only
+# the season word and reads the year through a look-ahead, so a year can still
+# start a pay or size match; the branches cannot otherwise overlap, so one scan
+# finds exactly what the separate patterns find.
+_OUTPUT_PATTERN = re.compile(
+    r"(?P<season>spring|summer|fall|autumn|winter)\s+(?=(?P<year>20\d{2}))"
+    r"|\$?(?P<pay>[0-9]{1,3}(?:,[0-9]{3})*|[0-9]{4,})\s*(?:per\s*month|/month|monthly|a month)"
+    r"|(?P<size>\d{2,})\s*(?:\+\s*)?(?:employees|people|staff)\b",
+    re.I,
+)
+_DEFAULT_BASELINE_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True, slots=True)
+class DriftBaseline:
+    """What the goal and constraints ask for, parsed once per distinct goal."""
+
+    locations: FrozenSet[str]
+    timeframes: FrozenSet[str]
+    pay: Optional[int]
+    company_size: Optional[int]
+
+
+@dataclass(frozen=True, slots=True)
+class _OutputFeatures:
+    locations: Set[str]
+    timeframes: Set[str]
+    pay: Optional[int]
+    company_size: Optional[int]
+
+
+class BaselineCache:
+    """Bounded LRU of parsed baselines, keyed by a hash of the goal and constraints.
+
+    Keep one per session (the engine does) so a goal that stays the same across
+    evaluations is parsed once.
+    """
+
+    def __init__(self, maxsize: int = _DEFAULT_BASELINE_CACHE_SIZE) -> None:
+        self._cache: LRUCache[Tuple[bytes, int], Tuple[Gazetteer, DriftBaseline]] = LRUCache(
+            maxsize
+        )
 
+    def __len__(self) -> int:
+        return len(self._cache)
 
-def _extract_locations(text: str) -> Set[str]:
-    lowered = text.lower()
-    hits: Set[str] = set()
-    for canonical, keywords in _LOCATION_KEYWORDS.items():
-        if any(keyword in lowered for keyword in keywords):
-            hits.add(canonical)
-    return hits
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def get(self, goal: str, constraints: Sequence[str], gazetteer: Gazetteer) -> DriftBaseline:
+        key = (_baseline_key(goal, constraints), id(gazetteer))
+        entry = self._cache.get(key)
+        # The gazetteer is kept with the baseline so a reused id() cannot match.
+        if entry is not None and entry[0] is gazetteer:
+            return entry[1]
+        baseline = parse_baseline(goal, constraints, gazetteer)
+        self._cache.put(key, (gazetteer, baseline))
+        return baseline
+
+
+def _extract_locations(text: str, gazetteer: Gazetteer | None = None) -> Set[str]:
+    return (gazetteer or Gazetteer.default()).find(text)
+
+
+def _baseline_key(goal: str, constraints: Sequence[str]) -> bytes:
+    digest = hashlib.sha256()
+    for part in (goal, *constraints):
+        raw = part.encode("utf-8", "surrogatepass")
+        digest.update(len(raw).to_bytes(8, "little"))
+        digest.update(raw)
+    return digest.digest()
+
+
+def parse_baseline(
+    goal: str, constraints: Sequence[str], gazetteer: Gazetteer | None = None
+) -> DriftBaseline:
+    """Parse the locations, timeframes, pay and company size a goal asks for."""
+
+    text = " ".join([goal, *constraints])
+    return DriftBaseline(
+        locations=frozenset(_extract_locations(text, gazetteer)),
+        timeframes=frozenset(_extract_timeframes(text)),
+        pay=min_pay_threshold(text),
+        company_size=_extract_company_size(text),
+    )
+
+
+def _extract_output(text: str, gazetteer: Gazetteer) -> _OutputFeatures:
+    timeframes: Set[str] = set()
+    pay: Optional[int] = None
+    company_size: Optional[int] = None
+    for match in _OUTPUT_PATTERN.finditer(text):
+        if match.lastgroup == "pay":
+            if pay is None:
+                pay = int(match.group("pay").replace(",", ""))
+        elif match.lastgroup == "size":
+            if company_size is None:
+                company_size = int(match.group("size"))
+        else:
+            timeframes.add(f"{match.group('season')} {match.group('year')}".lower())
+    return _OutputFeatures(gazetteer.find(text), timeframes, pay, company_size)
 
 
 def _extract_timeframes(text: str) -> Set[str]:
@@ -59,24 +144,23 @@ def _extract_company_size(text: str) -> Optional[int]:
 
 
 def _classify_location(
-    desired: Set[str], observed: Set[str], *, treat_metro_minor: bool
+    desired: Set[str],
+    observed: Set[str],
+    *,
+    treat_metro_minor: bool,
+    gazetteer: Gazetteer | None = None,
 ) -> tuple[str, Set[str]] | None:
     if not desired or not observed:
         return None
 
+    places = gazetteer or Gazetteer.default()
     disallowed: Set[str] = set()
     minor_hits: Set[str] = set()
 
     for location in observed:
         if location in desired:
             continue
-        is_minor = False
-        if treat_metro_minor:
-            for target in desired:
-                if target == "austin" and location in _AUSTIN_METRO:
-                    is_minor = True
-                    break
-        if is_minor:
+        if treat_metro_minor and places.metro_of(location) in desired:
             minor_hits.add(location)
         else:
             disallowed.add(location)
@@ -98,18 +182,32 @@ def run(
     *,
     treat_metro_minor: bool = True,
     min_company_size: int | None = None,
+    gazetteer: Gazetteer | None = None,
+    baselines: BaselineCache | None = None,
 ) -> List[Finding]:
-    """Evaluate goal drift against the provided run."""
+    """Evaluate goal drift against the provided run.
+
+    Locations are looked up in ``gazetteer``, the bundled one by default. With
+    ``baselines``, the parsed goal and constraints are reused across runs that
+    share them, and only the output is parsed.
+    """
 
-    baseline_text = " ".join([run.goal, *run.constraints])
     output_text = run.output.text if run.output else ""
 
-    desired_locations = _extract_locations(baseline_text)
-    observed_locations = _extract_locations(output_text)
+    places = gazetteer or Gazetteer.default()
+    if baselines is not None:
+        baseline = baselines.get(run.goal, run.constraints, places)
+    else:
+        baseline = parse_baseline(run.goal, run.constraints, places)
+    observed = _extract_output(output_text, places)
+    desired_locations = set(baseline.locations)
+    observed_locations = observed.locations
 
     findings: List[Finding] = []
 
-    classification = _classify_location(desired_locations, observed_locations, treat_metro_minor=treat_metro_minor)
+    classification = _classify_location(
+        desired_locations, observed_locations, treat_metro_minor=treat_metro_minor, gazetteer=places
+    )
     if classification:
         label, offending = classification
         severity = "medium" if label == "minor" else "high"
@@ -127,9 +225,13 @@ def run(
             )
         )
 
-    desired_timeframes = _extract_timeframes(baseline_text)
-    observed_timeframes = _extract_timeframes(output_text)
-    if desired_timeframes and observed_timeframes and desired_timeframes.isdisjoint(observed_timeframes):
+    desired_timeframes = set(baseline.timeframes)
+    observed_timeframes = observed.timeframes
+    if (
+        desired_timeframes
+        and observed_timeframes
+        and desired_timeframes.isdisjoint(observed_timeframes)
+    ):
         findings.append(
             Finding(
                 kind="goal_drift",
@@ -143,8 +245,8 @@ def run(
             )
         )
 
-    effective_min_pay = min_pay or min_pay_threshold(baseline_text)
-    observed_pay = _extract_pay(output_text)
+    effective_min_pay = min_pay or baseline.pay
+    observed_pay = observed.pay
     if effective_min_pay and observed_pay and observed_pay < effective_min_pay:
         findings.append(
             Finding(
@@ -159,9 +261,13 @@ def run(
             )
         )
 
-    effective_company_size = min_company_size or _extract_company_size(baseline_text)
-    observed_company_size = _extract_company_size(output_text)
-    if effective_company_size and observed_company_size and observed_company_size < effective_company_size:
+    effective_company_size = min_company_size or baseline.company_size
+    observed_company_size = observed.company_size
+    if (
+        effective_company_size
+        and observed_company_size
+        and observed_company_size < effective_company_size
+    ):
         findings.append(
             Finding(
                 kind="goal_drift",
@@ -0,0 +1,174 @@
+"""High-entropy token detection for secrets without a known shape.
+
+Token-like runs (letters, digits and ``+_-``, optionally ending in ``=`` padding)
+that are at least one window long and contain a digit are scanned with a sliding
+window. The character counts of the window and ``sum(n * log2(n))`` over them
+are updated in O(1) as it moves, so a window's Shannon entropy is
+``log2(window) - sum / window`` without recounting. When NumPy is installed,
+long runs are scanned in vectorized blocks instead. A run is reported at its
+first window that reaches the threshold; runs already matched by the leak
+checker's known secret patterns are left to it. A message repeating the run's
+output is scanned once, as the output.
+"""
+
+from __future__ import annotations
+
+import importlib
+import math
+import re
+from functools import lru_cache
+from typing import Any, Final, Iterator, List, Sequence, Tuple
+
+from ..models import Finding, RunInput
+from ..utils.redact import redact_secrets
+
+try:  # pragma: no cover - optional dependency
+    _NUMPY: Any = importlib.import_module("numpy")
+except ImportError:  # pragma: no cover - optional dependency
+    _NUMPY = None
+
+_DEFAULT_THRESHOLD: Final[float] = 4.3
+_DEFAULT_WINDOW: Final[int] = 32
+_DIGIT = re.compile(r"[0-9]")
+# Runs at least this long use the NumPy path when it is available.
+_VECTOR_MIN: Final[int] = 4096
+_VECTOR_BLOCK: Final[int] = 8192
+_EPSILON: Final[float] = 1e-9
+
+
+@lru_cache(maxsize=8)
+def _token_pattern(window: int) -> re.Pattern[str]:
+    # Shorter runs can never fill a window, so the regex engine skips them.
+    return re.compile(rf"(?<![A-Za-z0-9+_-])[A-Za-z0-9+_-]{{{window},}}={{0,2}}")
+
+
+def _plogp_table(window: int) -> List[float]:
+    return [0.0] + [count * math.log2(count) for count in range(1, window + 1)]
+
+
+def _first_window(
+    token: str, window: int, limit: float, table: Sequence[float]
+) -> Tuple[int, float]:
+    """Return the first window start whose ``sum(n * log2(n))`` is at most ``limit``, or -1."""
+
+    counts: dict[str, int] = {}
+    total = 0.0
+    for char in token[:window]:
+        count = counts.get(char, 0)
+        total += table[count + 1] - table[count]
+        counts[char] = count + 1
+    if total <= limit:
+        return 0, total
+    for index in range(window, len(token)):
+        leaving = token[index - window]
+        entering = token[index]
+        if leaving == entering:
+            continue
+        count = counts[leaving]
+        total += table[count - 1] - table[count]
+        counts[leaving] = count - 1
+        count = counts.get(entering, 0)
+        total += table[count + 1] - table[count]
+        counts[entering] = count + 1
+        if total <= limit:
+            return index - window + 1, total
+    return -1, total
+
+
+def _first_window_vectorized(
+    token: str, window: int, limit: float, table: Sequence[float]
+) -> Tuple[int, float]:  # pragma: no cover - requires numpy
+    np = _NUMPY
+    codes = np.frombuffer(token.encode("ascii"), dtype=np.uint8)
+    _, symbols = np.unique(codes, return_inverse=True)
+    alphabet = int(symbols.max()) + 1
+    weights = np.asarray(table)
+    for start in range(0, len(symbols) - window + 1, _VECTOR_BLOCK):
+        part = symbols[start : start + _VECTOR_BLOCK + window - 1]
+        onehot = np.zeros((len(part) + 1, alphabet), dtype=np.int32)
+        onehot[np.arange(1, len(part) + 1), part] = 1
+        cumulative = np.cumsum(onehot, axis=0)
+        totals = weights[cumulative[window:] - cumulative[:-window]].sum(axis=1)
+        hits = np.flatnonzero(totals <= limit)
+        if hits.size:
+            return start + int(hits[0]), float(totals[hits[0]])
+    return -1, 0.0
+
+
+def _masked(value: str) -> str:
+    return "*" * (len(value) - 4) + value[-4:] if len(value) > 8 else "*" * len(value)
+
+
+def _sources(run: RunInput) -> Iterator[Tuple[str, str]]:
+    yield "goal", run.goal
+    for constraint in run.constraints:
+        yield "constraint", constraint
+    # Adapters often pass the final reply both as a message and as the output.
+    output = run.output.text if run.output else None
+    for role, message in run.messages:
+        if message != output:
+            yield f"message:{role}", message
+    for call in run.tool_calls:
+        for value in call.args.values() if isinstance(call.args, dict) else ():
+            if isinstance(value, str):
+                yield f"tool:{call.name}", value
+    if run.output:
+        yield "output", run.output.text
+        for claim in run.output.claims:
+            yield "claim", claim.statement
+    for chunk in run.contexts:
+        yield chunk.source, chunk.text
+
+
+def scan(
+    text: str, *, threshold: float = _DEFAULT_THRESHOLD, window: int = _DEFAULT_WINDOW
+) -> Iterator[Tuple[int, str, float]]:
+    """Yield ``(offset, window text, entropy)`` for each high-entropy token in ``text``."""
+
+    if window < 2:
+        raise ValueError("window must be at least 2")
+    table = _plogp_table(window)
+    bits = math.log2(window)
+    # entropy >= threshold  <=>  sum(n * log2(n)) <= window * (log2(window) - threshold)
+    limit = window * (bits - threshold) + _EPSILON
+    for match in _token_pattern(window).finditer(text):
+        token = match.group()
+        if _DIGIT.search(token) is None:
+            continue
+        if _NUMPY is not None and len(token) >= _VECTOR_MIN:
+            start, total = _first_window_vectorized(token, window, limit, table)
+        else:
+            start, total = _first_window(token, window, limit, table)
+        # Tokens holding a known secret shape are reported by the leak checker.
+        if start < 0 or redact_secrets(token) != token:
+            continue
+        yield match.start() + start, token[start : start + window], bits - total / window
+
+
+def run(
+    run: RunInput,
+    *,
+    threshold: float | None = _DEFAULT_THRESHOLD,
+    window: int = _DEFAULT_WINDOW,
+) -> List[Finding]:
+    """Flag high-entropy tokens anywhere in the run; ``threshold=None`` disables the scan."""
+
+    findings: List[Finding] = []
+    if threshold is None:
+        return findings
+    for source, text in _sources(run):
+        for offset, value, entropy in scan(text, threshold=threshold, window=window):
+            findings.append(
+                Finding(
+                    kind="high_entropy",
+                    severity="medium",
+                    details="Detected high-entropy token",
+                    evidence={
+                        "value": _masked(value),
+                        "entropy": round(entropy, 2),
+                        "source": source,
+                        "offset": offset,
+                    },
+                )
+            )
+    return findings
@@ -2,61 +2,180 @@
 
 from __future__ import annotations
 
-from typing import Callable, List
+from contextlib import closing
+from functools import partial
+from typing import Callable, Dict, Generator, Iterable, Iterator, List, Mapping, Tuple, Union
+from urllib.parse import urldefrag
 
-from ..errors import ParseError
-from ..models import Claim, Finding, RunInput
+from ..errors import NetworkError, ParseError
+from ..models import Claim, ContextChunk, Finding, RunInput
 from ..utils.logging import get_logger
 from ..utils.redact import redact_secrets
 from ..verify import extract
-from ..verify.web import fetch_text
+from ..verify.cache import CachedDocument, EvidenceCache
+from ..verify.corpus import EvidenceCorpus
+from ..verify.web import FetchLimits, fetch_text, stream_text
 
 _LOGGER = get_logger(__name__)
 
 Fetcher = Callable[[str], str]
+StreamFetcher = Callable[[str], Generator[str, None, None]]
+Evidence = Union[str, CachedDocument, Generator[str, None, None]]
 
+_STREAMABLE_KINDS = frozenset({"contains", "regex"})
 
-def _validate_contains(document: str, pattern: str, must_include: str | None) -> bool:
-    probe = must_include or pattern
-    return probe.lower() in document.lower()
-
-
-def _apply_extraction(claim: Claim, document: str) -> bool:
-    extraction = claim.extraction
-    if extraction.kind == "css":
-        text = extract.extract_css(document, extraction.pattern, extraction.must_include)
-        target = extraction.must_include or extraction.pattern
-        return target.lower() in text.lower()
-    if extraction.kind == "xpath":
-        text = extract.extract_xpath(document, extraction.pattern, extraction.must_include)
-        target = extraction.must_include or extraction.pattern
-        return target.lower() in text.lower()
-    if extraction.kind == "regex":
-        text = extract.extract_regex(document, extraction.pattern)
-        if extraction.must_include and extraction.must_include.lower() not in text.lower():
-            raise ParseError("Regex extraction missing required snippet")
-        return True
-    if extraction.kind == "contains":
-        return _validate_contains(document, extraction.pattern, extraction.must_include)
-    raise ParseError(f"Unsupported extraction kind: {extraction.kind}")
-
-
-def _verify_claim(claim: Claim, fetcher: Fetcher) -> tuple[bool, list[str]]:
+
+def _normalize_url(url: str) -> str:
+    return urldefrag(url.strip())[0].rstrip("/")
+
+
+class ContextIndex(Mapping[str, str]):
+    """Context text by normalized evidence URL, kept up to date as chunks arrive.
+
+    A source's chunks are joined on first lookup, so adding a chunk is O(1) and a
+    long conversation is never re-indexed. A URL mapped through ``source_map``
+    resolves to that source once it has text, and to a source of the same name
+    otherwise.
+    """
+
+    def __init__(
+        self, contexts: Iterable[ContextChunk] = (), source_map: Mapping[str, str] | None = None
+    ) -> None:
+        self._texts: Dict[str, List[str]] = {}
+        self._joined: Dict[str, str] = {}
+        self._sources: Dict[str, str] = {}  # normalized source -> source
+        self._mapped: Dict[str, List[str]] = {}  # normalized URL -> mapped sources
+        for url, source in (source_map or {}).items():
+            self._mapped.setdefault(_normalize_url(url), []).append(source)
+        for chunk in contexts:
+            self.add(chunk)
+
+    def add(self, chunk: ContextChunk) -> None:
+        texts = self._texts.get(chunk.source)
+        if texts is None:
+            texts = self._texts[chunk.source] = []
+            self._sources[_normalize_url(chunk.source)] = chunk.source
+        texts.append(chunk.text)
+        self._joined.pop(chunk.source, None)
+
+    def __getitem__(self, url: str) -> str:
+        source = self._source(url)
+        if source is None:
+            raise KeyError(url)
+        joined = self._joined.get(source)
+        if joined is None:
+            joined = self._joined[source] = "\n".join(self._texts[source])
+        return joined
+
+    def __iter__(self) -> Iterator[str]:
+        keys = dict.fromkeys([*self._sources, *self._mapped])
+        return (key for key in keys if self._source(key) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def _source(self, url: str) -> str | None:
+        for source in reversed(self._mapped.get(url, ())):
+            if source in self._texts:
+                return source
+        return self._sources.get(url)
+
+
+def _fetch_evidence(
+    claim: Claim,
+    url: str,
+    fetcher: Fetcher,
+    streamer: StreamFetcher | None,
+    cache: EvidenceCache | None,
+    contexts: Mapping[str, str],
+    corpus: EvidenceCorpus | None = None,
+) -> Tuple[Evidence, str]:
+    """Resolve evidence for ``url`` and name the path it came from."""
+
+    context = contexts.get(_normalize_url(url))
+    if context is not None:
+        return context, "context"
+    if corpus is not None:
+        document = corpus.get(url)
+        if document is not None:
+            return document, "corpus"
+    if cache is not None:
+        cached = cache.documents.get(url)
+        if cached is not None:
+            return cached, "cache"
+    if streamer is not None and claim.extraction.kind in _STREAMABLE_KINDS:
+        return streamer(url), "stream"
+    document = fetcher(url)
+    if cache is not None:
+        return cache.documents.put(url, document), "fetcher"
+    return document, "fetcher"
+
+
+def _apply_evidence(
+    plan: extract.CompiledExtraction, evidence: Evidence, cache: EvidenceCache | None
+) -> bool:
+    if isinstance(evidence, CachedDocument):
+        if cache is not None:
+            return cache.results.verify(evidence, plan)
+        return plan.verify(evidence.text)
+    if isinstance(evidence, str):
+        return plan.verify(evidence)
+    with closing(evidence):
+        return plan.verify_stream(evidence)
+
+
+def _verify_claim(
+    claim: Claim,
+    plan: extract.CompiledExtraction,
+    fetcher: Fetcher,
+    streamer: StreamFetcher | None = None,
+    cache: EvidenceCache | None = None,
+    contexts: Mapping[str, str] | None = None,
+    corpus: EvidenceCorpus | None = None,
+    corpus_search: bool = False,
+) -> tuple[bool, list[str], list[str]]:
+    valid, errors, paths = _verify_urls(claim, plan, fetcher, streamer, cache, contexts, corpus)
+    if valid or not corpus_search or corpus is None or plan.kind != "contains":
+        return valid, errors, paths
+    paths.append("corpus_search")
+    if corpus.contains(plan.probe):
+        return True, [], paths
+    return False, errors + ["corpus_miss"], paths
+
+
+def _verify_urls(
+    claim: Claim,
+    plan: extract.CompiledExtraction,
+    fetcher: Fetcher,
+    streamer: StreamFetcher | None,
+    cache: EvidenceCache | None,
+    contexts: Mapping[str, str] | None,
+    corpus: EvidenceCorpus | None,
+) -> tuple[bool, list[str], list[str]]:
     errors: list[str] = []
+    paths: list[str] = []
     urls = claim.evidence_urls or []
     if not urls:
-        return False, ["no_evidence_urls"]
+        return False, ["no_evidence_urls"], paths
     for url in urls:
         try:
-            document = fetcher(url)
+            evidence, path = _fetch_evidence(
+                claim, url, fetcher, streamer, cache, contexts or {}, corpus
+            )
         except Exception as exc:  # pragma: no cover - defensive logging
             message = f"fetch_error:{exc}"
             errors.append(message)
+            paths.append("fetcher")
             _LOGGER.debug("claim_fetch_error", extra={"_sk_url": url, "_sk_error": str(exc)})
             continue
+        paths.append(path)
         try:
-            if _apply_extraction(claim, document):
-                return True, []
+            if _apply_evidence(plan, evidence, cache):
+                return True, [], paths
+        except NetworkError as exc:
+            # Streamed evidence only reaches the network once it is consumed.
+            errors.append(f"fetch_error:{exc}")
+            _LOGGER.debug("claim_fetch_error", extra={"_sk_url": url, "_sk_error": str(exc)})
         except ParseError as exc:
             message = f"parse_error:{exc}"
             errors.append(message)
@@ -71,20 +190,73 @@ def _verify_claim(claim: Claim, fetcher: Fetcher) -> tuple[bool, list[str]]:
                 "claim_unexpected_error",
                 extra={"_sk_url": url, "_sk_error": str(exc), "_sk_pattern": claim.extraction.pattern},
             )
-    return False, errors
+    return False, errors, paths
+
 
+def run(
+    run: RunInput,
+    fetcher: Fetcher | None = None,
+    *,
+    stream: bool = False,
+    limits: FetchLimits | None = None,
+    cache: EvidenceCache | None = None,
+    use_contexts: bool = True,
+    context_sources: Mapping[str, str] | None = None,
+    regex_guard: extract.RegexGuard = "reject",
+    regex_budget: float = 1.0,
+    corpus: EvidenceCorpus | None = None,
+    corpus_search: bool = False,
+    context_index: ContextIndex | None = None,
+) -> List[Finding]:
+    """Verify output claims using deterministic extractors.
 
-def run(run: RunInput, fetcher: Fetcher | None = None) -> List[Finding]:
-    """Verify output claims using deterministic extractors."""
+    With ``stream`` enabled and the default fetcher, ``contains`` and ``regex``
+    claims are matched while the evidence downloads and the connection is closed
+    on the first hit. ``limits`` bounds every download made by the default fetcher.
+    A shared ``cache`` serves repeat URLs without refetching and repeat
+    extractions against unchanged content without re-parsing.
+
+    Before any of that, evidence URLs are looked up among the run's own
+    ``contexts`` by ``source`` (or through ``context_sources``, which maps an
+    evidence URL to a context source name), so retrieval-grounded claims are
+    verified without a network round-trip. Findings list the path used for each
+    URL under ``evidence_paths``. A prebuilt ``context_index`` is used instead of
+    indexing ``run.contexts``.
+
+    Claim-supplied regular expressions run under ``regex_guard`` (see
+    :func:`~sentrykit.verify.extract.compile_extraction`); rejected or
+    over-budget patterns surface as ``parse_error`` entries.
+
+    A local ``corpus`` of approved documents serves evidence URLs it holds
+    without a fetch. With ``corpus_search`` enabled, a ``contains`` claim whose
+    cited evidence does not support it is still verified when any corpus
+    document contains its snippet; that lookup is listed as ``corpus_search``.
+    """
 
     findings: List[Finding] = []
     output = run.output
     if not output or not output.claims:
         return findings
 
-    fetch = fetcher or fetch_text
+    fetch = fetcher or partial(fetch_text, limits=limits)
+    streamer = partial(stream_text, limits=limits) if stream and fetcher is None else None
+    contexts: Mapping[str, str] = {}
+    if use_contexts:
+        if context_index is None:
+            context_index = ContextIndex(run.contexts, context_sources)
+        contexts = context_index
     for claim in output.claims:
-        valid, errors = _verify_claim(claim, fetch)
+        paths: List[str]
+        try:
+            plan = extract.compile_extraction(
+                claim.extraction, regex_guard=regex_guard, regex_budget=regex_budget
+            )
+        except ParseError as exc:
+            valid, errors, paths = False, [f"parse_error:{exc}"], []
+        else:
+            valid, errors, paths = _verify_claim(
+                claim, plan, fetch, streamer, cache, contexts, corpus, corpus_search
+            )
         if not valid:
             findings.append(
                 Finding(
@@ -95,6 +267,7 @@ def run(run: RunInput, fetcher: Fetcher | None = None) -> List[Finding]:
                         "statement": redact_secrets(claim.statement),
                         "urls": claim.evidence_urls,
                         "errors": [redact_secrets(error) for error in errors[:3]],
+                        "evidence_paths": paths,
                     },
                 )
             )
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import heapq
 import math
 import re
-from typing import Iterable, List
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Final, Iterable, Iterator, List, Tuple
 
 from ..models import Finding, RunInput
+from ..utils.fingerprints import SecretFingerprints
 from ..utils.redact import redact_secrets
 
 _SECRET_REGEXES = [
@@ -23,31 +27,195 @@ _PII_REGEXES = [
 ]
 
 
+# Longest PEM block a window may cover before the END marker is given up on.
+_MAX_BLOCK: Final[int] = 64 * 1024
+_MAX_LOCAL_PART: Final[int] = 256
+_MAX_DOMAIN: Final[int] = 256
+_WINDOW: Final[int] = 1024 * 1024
+# A window is scanned once this much text follows it (the farthest any match
+# reaches past its anchor) and keeps this much before it (email local parts and
+# the character a word boundary looks behind at).
+_OVERLAP: Final[int] = _MAX_BLOCK
+_MARGIN: Final[int] = _MAX_LOCAL_PART + 1
+PII_DETAILS: Final[str] = "Detected potential PII"
+_PII_SAMPLES: Final[int] = 5
+
+
+@dataclass(frozen=True, slots=True)
+class _Rule:
+    """A leak pattern, the literals every match contains and how far around them it may reach.
+
+    A rule without anchors has no literal to look for and scans the whole text.
+    """
+
+    pattern: re.Pattern[str]
+    secret: bool
+    anchors: Tuple[str, ...] = ()
+    before: int = 0
+    after: int = _MAX_BLOCK
+
+
+_RULES: Tuple[_Rule, ...] = (
+    _Rule(_SECRET_REGEXES[0], secret=True, anchors=("sk-", "sK-", "Sk-", "SK-")),
+    _Rule(_SECRET_REGEXES[1], secret=True, anchors=("AKIA",)),
+    _Rule(_SECRET_REGEXES[2], secret=True, anchors=("ASIA",)),
+    _Rule(_SECRET_REGEXES[3], secret=True, anchors=("ssh-rsa ",)),
+    _Rule(_SECRET_REGEXES[4], secret=True, anchors=("-----BEGIN ",)),
+    _Rule(
+        _PII_REGEXES[0],
+        secret=False,
+        anchors=("@",),
+        before=_MAX_LOCAL_PART,
+        after=_MAX_DOMAIN,
+    ),
+    _Rule(_PII_REGEXES[1], secret=False),
+)
+
+
 def _shannon_entropy(value: str) -> float:
-    frequencies = {ch: value.count(ch) for ch in set(value)}
     length = len(value)
-    return -sum((freq / length) * math.log2(freq / length) for freq in frequencies.values())
+    return -sum((freq / length) * math.log2(freq / length) for freq in Counter(value).values())
 
 
-def _scan(text: str, patterns: Iterable[re.Pattern[str]]) -> List[str]:
-    matches: List[str] = []
-    for pattern in patterns:
-        matches.extend(pattern.findall(text))
-    return matches
+def _anchor_positions(text: str, anchors: Tuple[str, ...], lo: int, hi: int) -> Iterator[int]:
+    """Yield positions in ``[lo, hi)`` where an anchor starts, in ascending order."""
 
+    streams = []
+    for anchor in anchors:
+        positions = []
+        limit = hi + len(anchor) - 1
+        position = text.find(anchor, lo, limit)
+        while position >= 0:
+            positions.append(position)
+            position = text.find(anchor, position + 1, limit)
+        streams.append(positions)
+    return heapq.merge(*streams)
 
-def run(run: RunInput) -> List[Finding]:
-    findings: List[Finding] = []
-    texts = []
+
+class _Scanner:
+    """Find rule matches in text that arrives in pieces, holding a bounded tail.
+
+    Matches are reported once, with their offset in the whole text, exactly as
+    ``pattern.findall`` over the whole text would find them. Text is scanned in
+    windows of ``window`` characters; each window is only scanned once enough
+    text follows it for any match starting inside to be complete.
+    """
+
+    def __init__(self, window: int) -> None:
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self._buffer = ""
+        self._base = 0  # offset of the buffer in the whole text
+        self._done = 0  # matches starting before this offset have been reported
+        self._resume = [0] * len(_RULES)
+
+    def feed(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Add ``text`` and yield ``(rule, offset, match)`` for every settled match."""
+
+        self._buffer += text
+        while self._base + len(self._buffer) - self._done >= self.window + _OVERLAP:
+            yield from self._scan(self._done + self.window, final=False)
+
+    def close(self) -> Iterator[Tuple[int, int, str]]:
+        yield from self._scan(self._base + len(self._buffer), final=True)
+        self._buffer = ""
+
+    def _scan(self, hi: int, *, final: bool) -> Iterator[Tuple[int, int, str]]:
+        buffer, base, lo = self._buffer, self._base, self._done
+        size = base + len(buffer)
+        match: re.Match[str] | None
+        for index, rule in enumerate(_RULES):
+            resume = self._resume[index] - base
+            if not rule.anchors:
+                for match in rule.pattern.finditer(buffer, max(resume, lo - base)):
+                    if not final and match.start() >= hi - base:
+                        break
+                    yield index, base + match.start(), match.group()
+                    resume = match.end()
+                self._resume[index] = max(base + resume, hi)
+                continue
+            for start in _anchor_positions(buffer, rule.anchors, lo - base, hi - base):
+                if start < resume:
+                    continue
+                end = min(size, base + start + rule.after) - base
+                if rule.before:
+                    match = rule.pattern.search(buffer, max(resume, start - rule.before), end)
+                else:
+                    match = rule.pattern.match(buffer, start, end)
+                if match is not None and match.start() <= start < match.end():
+                    yield index, base + match.start(), match.group()
+                    resume = match.end()
+            self._resume[index] = base + resume
+        self._done = hi
+        # Keep enough text before the next window for look-behind and email local parts.
+        keep = max(base, hi - _MARGIN)
+        self._buffer = buffer[keep - base :]
+        self._base = keep
+
+
+def scan_chunks(
+    chunks: Iterable[str], *, window: int = _WINDOW
+) -> Iterator[Tuple[int, int, str]]:
+    """Yield ``(rule, offset, match)`` for the text formed by ``chunks``.
+
+    At most about ``window`` plus a fixed overlap of characters are held at once,
+    on top of the current chunk.
+    """
+
+    scanner = _Scanner(window)
+    for chunk in chunks:
+        yield from scanner.feed(chunk)
+    yield from scanner.close()
+
+
+def _pieces(text: str, size: int) -> Iterator[str]:
+    for start in range(0, len(text), size):
+        yield text[start : start + size]
+
+
+def _sources(run: RunInput) -> Iterator[Tuple[str, str]]:
     if run.output:
-        texts.append(run.output.text)
+        yield "output", run.output.text
         for claim in run.output.claims:
-            texts.append(claim.statement)
+            yield "claim", claim.statement
     for chunk in run.contexts:
-        texts.append(chunk.text)
+        yield chunk.source, chunk.text
+
+
+def run(
+    run: RunInput,
+    *,
+    window: int = _WINDOW,
+    fingerprints: SecretFingerprints | None = None,
+) -> List[Finding]:
+    """Scan the output, claims and contexts for secrets and PII.
+
+    Each source is scanned on its own in windows of ``window`` characters, so a
+    huge context is never copied whole; findings carry the source and offset of
+    each match. With ``fingerprints``, exact occurrences of those known secrets
+    are reported by fingerprint id alone.
+    """
 
-    blob = "\n".join(texts)
-    for match in _scan(blob, _SECRET_REGEXES):
+    findings: List[Finding] = []
+    secrets: List[List[Tuple[str, int, str]]] = [[] for _ in _RULES]
+    pii: List[List[Tuple[str, int, str]]] = [[] for _ in _RULES]
+    for source, text in _sources(run):
+        for index, offset, match in scan_chunks(_pieces(text, window), window=window):
+            bucket = secrets if _RULES[index].secret else pii
+            bucket[index].append((source, offset, match))
+        if fingerprints is not None:
+            for fingerprint, offset in fingerprints.scan(text):
+                findings.append(
+                    Finding(
+                        kind="data_leak",
+                        severity="high",
+                        details="Detected known secret",
+                        evidence={"fingerprint": fingerprint, "source": source, "offset": offset},
+                    )
+                )
+
+    for source, offset, match in (hit for hits in secrets for hit in hits):
         if _shannon_entropy(match) < 3.5:
             continue
         findings.append(
@@ -55,19 +223,35 @@ def run(run: RunInput) -> List[Finding]:
                 kind="data_leak",
                 severity="high",
                 details="Detected potential secret in output",
-                evidence={"value": redact_secrets(match)},
+                evidence={"value": redact_secrets(match), "source": source, "offset": offset},
             )
         )
 
-    pii_hits = _scan(blob, _PII_REGEXES)
-    if pii_hits:
+    shown = [hit for hits in pii for hit in hits][:_PII_SAMPLES]
+    if shown:
         findings.append(
-            Finding(
-                kind="data_leak",
-                severity="medium",
-                details="Detected potential PII",
-                evidence={"samples": [redact_secrets(hit) for hit in pii_hits[:5]]},
+            _pii_finding(
+                [redact_secrets(match) for _, _, match in shown],
+                [{"source": source, "offset": offset} for source, offset, _ in shown],
             )
         )
 
     return findings
+
+
+def _pii_finding(samples: List[str], locations: List[Dict[str, Any]]) -> Finding:
+    return Finding(
+        kind="data_leak",
+        severity="medium",
+        details=PII_DETAILS,
+        evidence={"samples": samples, "locations": locations},
+    )
+
+
+def merge_pii(first: Finding, second: Finding) -> Finding:
+    """Combine PII findings from two runs as if their text had been scanned in one."""
+
+    return _pii_finding(
+        (first.evidence["samples"] + second.evidence["samples"])[:_PII_SAMPLES],
+        (first.evidence["locations"] + second.evidence["locations"])[:_PII_SAMPLES],
+    )
@@ -2,25 +2,89 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, List, Sequence
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence
 
 from . import checkers
+from .checkers.drift import BaselineCache
+from .checkers.hallucination import ContextIndex
 from .models import Finding, RunInput, Verdict
 from .policy import Policy
 from .report import html as html_report
+from .utils.fingerprints import SecretFingerprints
+from .utils.gazetteer import Gazetteer
 from .utils.logging import get_logger
+from .verify.cache import EvidenceCache
+from .verify.corpus import EvidenceCorpus
+from .verify.web import FetchLimits
 
 _LOGGER = get_logger(__name__)
 
 _SEVERITY_SCORES = {"low": 0.2, "medium": 0.5, "high": 1.0}
+_SEVERITY_ORDER = {"low": 0, "medium": 1, "high": 2}
 
 Checker = Callable[..., List[Finding]]
 
 
+def _aggregate(kind: str, group: Sequence[Finding], samples: int) -> Finding:
+    shown = group[:samples]
+    severities = Counter(finding.severity for finding in group)
+    severity = max(severities, key=lambda name: _SEVERITY_ORDER.get(name, -1))
+    return Finding(
+        kind=kind,
+        severity=severity,
+        details=f"{len(group)} {kind} findings; showing the first {len(shown)}",
+        evidence={
+            "count": len(group),
+            "by_severity": dict(severities),
+            "samples": [
+                {
+                    "severity": finding.severity,
+                    "details": finding.details,
+                    "evidence": finding.evidence,
+                }
+                for finding in shown
+            ],
+            "overflow": len(group) - len(shown),
+        },
+    )
+
+
+def _cap_findings(findings: List[Finding], limit: int | None, samples: int) -> List[Finding]:
+    """Replace the findings of each kind with more than ``limit`` by one aggregate finding.
+
+    The aggregate takes the place of the kind's first finding and keeps the
+    highest severity, the count, the first ``samples`` findings and how many
+    were left out.
+    """
+
+    if limit is None:
+        return findings
+    groups: Dict[str, List[Finding]] = {}
+    for finding in findings:
+        groups.setdefault(finding.kind, []).append(finding)
+    if all(len(group) <= limit for group in groups.values()):
+        return findings
+    capped: List[Finding] = []
+    for finding in findings:
+        group = groups[finding.kind]
+        if len(group) <= limit:
+            capped.append(finding)
+        elif finding is group[0]:
+            capped.append(_aggregate(finding.kind, group, samples))
+    return capped
+
+
 @dataclass(slots=True)
 class GuardEngine:
     policy: Policy
+    evidence_cache: EvidenceCache | None = None
+    evidence_fetcher: Callable[[str], str] | None = None
+    evidence_corpus: EvidenceCorpus | None = None
+    secret_fingerprints: SecretFingerprints | None = None
+    gazetteer: Gazetteer | None = None
+    drift_baselines: BaselineCache = field(default_factory=BaselineCache)
 
     def _run_checker(self, func: Checker, *args, **kwargs) -> List[Finding]:
         try:
@@ -37,12 +101,34 @@ class GuardEngine:
             ]
 
     def evaluate(self, run: RunInput) -> Verdict:
-        findings: List[Finding] = []
+        return self.verdict_for(self.check_content(run) + self.check_output(run))
+
+    def check_content(self, run: RunInput) -> List[Finding]:
+        """Run the checkers that look at each message, context and tool call on its own."""
 
+        findings: List[Finding] = []
         findings.extend(self._run_checker(checkers.tool_firewall.run, run, self.policy))
         findings.extend(self._run_checker(checkers.poisoning.run, run, self.policy))
         findings.extend(self._run_checker(checkers.jailbreak.run, run))
-        findings.extend(self._run_checker(checkers.leaks.run, run))
+        findings.extend(
+            self._run_checker(checkers.leaks.run, run, fingerprints=self.secret_fingerprints)
+        )
+        findings.extend(
+            self._run_checker(
+                checkers.entropy.run,
+                run,
+                threshold=self.policy.entropy_threshold,
+                window=self.policy.entropy_window,
+            )
+        )
+        return findings
+
+    def check_output(
+        self, run: RunInput, context_index: ContextIndex | None = None
+    ) -> List[Finding]:
+        """Run the checkers that judge the output against the goal and gathered contexts."""
+
+        findings: List[Finding] = []
         findings.extend(
             self._run_checker(
                 checkers.drift.run,
@@ -50,20 +136,57 @@ class GuardEngine:
                 min_pay=self.policy.min_pay_threshold,
                 treat_metro_minor=self.policy.treat_metro_as_minor,
                 min_company_size=self.policy.min_company_size,
+                gazetteer=self.gazetteer,
+                baselines=self.drift_baselines,
+            )
+        )
+        findings.extend(
+            self._run_checker(
+                checkers.hallucination.run,
+                run,
+                self.evidence_fetcher,
+                stream=self.policy.stream_evidence,
+                limits=self._fetch_limits(),
+                cache=self.evidence_cache,
+                use_contexts=self.policy.verify_from_contexts,
+                context_sources=self.policy.evidence_source_map,
+                regex_guard=self.policy.regex_guard,
+                regex_budget=self.policy.regex_budget_seconds,
+                corpus=self.evidence_corpus,
+                corpus_search=self.policy.corpus_search,
+                context_index=context_index,
             )
         )
-        findings.extend(self._run_checker(checkers.hallucination.run, run))
+        return findings
+
+    def verdict_for(self, findings: List[Finding]) -> Verdict:
+        """Build a verdict, with its report, over ``findings``."""
 
         score = sum(_SEVERITY_SCORES.get(finding.severity, 0.0) for finding in findings)
 
-        blocked = self._should_block(findings)
-        reason = "; ".join(sorted({finding.kind for finding in findings})) if findings else "No findings"
+        blocked = self.should_block(findings)
+        kinds = sorted({finding.kind for finding in findings})
+        reason = "; ".join(kinds) if kinds else "No findings"
+        # Score and block decision above see every finding; the verdict keeps the capped list.
+        findings = _cap_findings(
+            findings, self.policy.max_findings_per_kind, self.policy.finding_samples
+        )
 
         verdict = Verdict(blocked=blocked, reason=reason, score=score, findings=findings)
         verdict.report = html_report.render(verdict)
         return verdict
 
-    def _should_block(self, findings: Sequence[Finding]) -> bool:
+    def _fetch_limits(self) -> FetchLimits:
+        defaults = FetchLimits()
+        content_types = tuple(sorted(self.policy.evidence_content_types))
+        return FetchLimits(
+            max_bytes=self.policy.max_evidence_bytes or defaults.max_bytes,
+            content_types=content_types or defaults.content_types,
+        )
+
+    def should_block(self, findings: Sequence[Finding]) -> bool:
+        """Whether any of ``findings`` matches the policy's ``block_on`` rules."""
+
         if not self.policy.block_on:
             return False
         for finding in findings:
@@ -15,9 +15,20 @@ class NetworkError(SentryKitError):
     """Raised when an outbound network call fails."""
 
 
+class CircuitOpenError(NetworkError):
+    """Raised when a fetch is short-circuited by the host circuit breaker."""
+
+
 class ParseError(SentryKitError):
     """Raised when parsing of a payload or document fails."""
 
 
+class SandboxError(ParseError):
+    """Raised when a sandboxed regex search times out or its worker fails.
+
+    Unlike other parse errors the outcome depends on load, so it is never cached.
+    """
+
+
 class AdapterImportError(SentryKitError):
     """Raised when an adapter dependency is missing."""
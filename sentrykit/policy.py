@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict
+from typing import Any, Dict, Literal
 
 
 @dataclass(slots=True)
@@ -17,6 +17,18 @@ class Policy:
     min_company_size: int | None = None
     min_pay_threshold: int | None = None
     treat_metro_as_minor: bool = True
+    stream_evidence: bool = False
+    max_evidence_bytes: int | None = None
+    evidence_content_types: set[str] = field(default_factory=set)
+    verify_from_contexts: bool = True
+    evidence_source_map: dict[str, str] = field(default_factory=dict)
+    corpus_search: bool = False
+    regex_guard: Literal["reject", "sandbox", "off"] = "reject"
+    regex_budget_seconds: float = 1.0
+    entropy_threshold: float | None = None
+    entropy_window: int = 32
+    max_findings_per_kind: int | None = 100
+    finding_samples: int = 5
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the policy to a JSON-friendly dict."""
@@ -29,12 +41,29 @@ class Policy:
             "min_company_size": self.min_company_size,
             "min_pay_threshold": self.min_pay_threshold,
             "treat_metro_as_minor": self.treat_metro_as_minor,
+            "stream_evidence": self.stream_evidence,
+            "max_evidence_bytes": self.max_evidence_bytes,
+            "evidence_content_types": sorted(self.evidence_content_types),
+            "verify_from_contexts": self.verify_from_contexts,
+            "evidence_source_map": dict(self.evidence_source_map),
+            "corpus_search": self.corpus_search,
+            "regex_guard": self.regex_guard,
+            "regex_budget_seconds": self.regex_budget_seconds,
+            "entropy_threshold": self.entropy_threshold,
+            "entropy_window": self.entropy_window,
+            "max_findings_per_kind": self.max_findings_per_kind,
+            "finding_samples": self.finding_samples,
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Policy":
         """Create a policy from a dictionary."""
 
+        max_findings = data.get("max_findings_per_kind", 100)
+        if max_findings is not None:
+            max_findings = int(max_findings)
+            if max_findings < 1:
+                raise ValueError("max_findings_per_kind must be at least 1")
         return cls(
             allowed_tool_names=set(data.get("allowed_tool_names", [])),
             allowed_url_domains=set(data.get("allowed_url_domains", [])),
@@ -43,6 +72,18 @@ class Policy:
             min_company_size=data.get("min_company_size"),
             min_pay_threshold=data.get("min_pay_threshold"),
             treat_metro_as_minor=bool(data.get("treat_metro_as_minor", True)),
+            stream_evidence=bool(data.get("stream_evidence", False)),
+            max_evidence_bytes=data.get("max_evidence_bytes"),
+            evidence_content_types=set(data.get("evidence_content_types", [])),
+            verify_from_contexts=bool(data.get("verify_from_contexts", True)),
+            evidence_source_map=dict(data.get("evidence_source_map", {})),
+            corpus_search=bool(data.get("corpus_search", False)),
+            regex_guard=data.get("regex_guard", "reject"),
+            regex_budget_seconds=float(data.get("regex_budget_seconds", 1.0)),
+            entropy_threshold=data.get("entropy_threshold"),
+            entropy_window=int(data.get("entropy_window", 32)),
+            max_findings_per_kind=max_findings,
+            finding_samples=int(data.get("finding_samples", 5)),
         )
 
     def copy(self) -> "Policy":
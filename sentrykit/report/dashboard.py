@@ -0,0 +1,174 @@
+"""Aggregate HTML dashboard over many verdicts, rendered in one streaming pass.
+
+Runs are written as paginated tables in the order they arrive; each row embeds
+its findings as compact JSON (``[kind, severity, details, evidence]`` arrays)
+that the page only expands into a table when the row is clicked. Aggregates are
+updated incrementally and written after the last page; the stylesheet moves
+them to the top of the rendered page. Memory is bounded by the number of
+distinct finding kinds and ``top`` offenders, not by the number of verdicts.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from html import escape
+from typing import Any, Iterable, Iterator, List, Tuple
+
+from ..models import Verdict
+from ..utils.redact import redact_secrets
+from .html import Target, _load_template, _sanitize_value, _write_chunks
+
+__all__ = ["DashboardStats", "iter_dashboard", "write_dashboard"]
+
+_DEFAULT_PAGE_SIZE = 100
+_DEFAULT_TOP = 10
+_SEVERITIES = ("high", "medium", "low")
+_RUN_HEAD = (
+    "<table><thead><tr><th>Run</th><th>Status</th><th>Score</th><th>Reason</th>"
+    "<th>Findings</th></tr></thead><tbody>"
+)
+# Keep embedded JSON inert inside a <script> element.
+_JSON_ESCAPES = str.maketrans({"<": "\\u003c", ">": "\\u003e", "&": "\\u0026"})
+
+
+@dataclass(slots=True)
+class DashboardStats:
+    """Running aggregates over the verdicts rendered so far."""
+
+    top: int = _DEFAULT_TOP
+    runs: int = 0
+    blocked: int = 0
+    findings: int = 0
+    by_kind: Counter[str] = field(default_factory=Counter)
+    by_severity: Counter[str] = field(default_factory=Counter)
+    offenders: List[Tuple[float, int, int, str]] = field(default_factory=list)
+
+    def add(self, number: int, verdict: Verdict) -> None:
+        self.runs += 1
+        self.blocked += verdict.blocked
+        self.findings += len(verdict.findings)
+        for finding in verdict.findings:
+            self.by_kind[finding.kind] += 1
+            self.by_severity[finding.severity] += 1
+        # Min-heap of the highest scores; earlier runs win ties.
+        entry = (verdict.score, -number, len(verdict.findings), verdict.reason)
+        if len(self.offenders) < self.top:
+            heapq.heappush(self.offenders, entry)
+        elif entry > self.offenders[0]:
+            heapq.heapreplace(self.offenders, entry)
+
+    def top_offenders(self) -> List[Tuple[int, float, int, str]]:
+        ranked = sorted(self.offenders, reverse=True)
+        return [(-number, score, count, reason) for score, number, count, reason in ranked]
+
+
+def _findings_json(verdict: Verdict) -> str:
+    payload = [
+        [
+            finding.kind,
+            finding.severity,
+            redact_secrets(finding.details),
+            _sanitize_value(finding.evidence),
+        ]
+        for finding in verdict.findings
+    ]
+    text = json.dumps(payload, separators=(",", ":"), default=str)
+    return text.translate(_JSON_ESCAPES)
+
+
+def _run_row(number: int, verdict: Verdict) -> str:
+    status = "blocked" if verdict.blocked else "allowed"
+    return (
+        "<tr class='run'>"
+        f"<td>{number}</td>"
+        f"<td class='{status}'>{status.title()}</td>"
+        f"<td>{verdict.score:.2f}</td>"
+        f"<td>{escape(redact_secrets(verdict.reason))}</td>"
+        f"<td>{len(verdict.findings)}"
+        f"<script type='application/json'>{_findings_json(verdict)}</script></td>"
+        "</tr>"
+    )
+
+
+def _iter_pages(
+    verdicts: Iterable[Verdict], stats: DashboardStats, page_size: int
+) -> Iterator[str]:
+    rows = 0
+    for number, verdict in enumerate(verdicts, start=1):
+        stats.add(number, verdict)
+        if rows == page_size:
+            yield "</tbody></table></section>"
+            rows = 0
+        if rows == 0:
+            hidden = "" if number == 1 else " hidden"
+            yield f"<section class='page'{hidden}>{_RUN_HEAD}"
+        yield _run_row(number, verdict)
+        rows += 1
+    if stats.runs:
+        yield "</tbody></table></section>"
+    else:
+        yield "<section class='page'><p>No runs.</p></section>"
+
+
+def _count_table(title: str, counts: Iterable[Tuple[str, int]]) -> str:
+    rows = "".join(f"<tr><td>{escape(name)}</td><td>{count}</td></tr>" for name, count in counts)
+    return f"<table><thead><tr><th>{escape(title)}</th><th>Findings</th></tr></thead>{rows}</table>"
+
+
+def _summary(stats: DashboardStats) -> str:
+    severities = [(name, stats.by_severity[name]) for name in _SEVERITIES]
+    severities += sorted(
+        (name, count) for name, count in stats.by_severity.items() if name not in _SEVERITIES
+    )
+    offenders = "".join(
+        "<tr>"
+        f"<td>{number}</td><td>{score:.2f}</td><td>{count}</td>"
+        f"<td>{escape(redact_secrets(reason))}</td>"
+        "</tr>"
+        for number, score, count, reason in stats.top_offenders()
+    )
+    return (
+        "<div class='summary'>"
+        f"<p>Runs: {stats.runs} &middot; Blocked: {stats.blocked} "
+        f"&middot; Findings: {stats.findings}</p>"
+        f"{_count_table('Kind', stats.by_kind.most_common())}"
+        f"{_count_table('Severity', severities)}"
+        "<table><thead><tr><th>Top run</th><th>Score</th><th>Findings</th><th>Reason</th>"
+        f"</tr></thead>{offenders}</table>"
+        "</div>"
+    )
+
+
+def iter_dashboard(
+    verdicts: Iterable[Verdict],
+    *,
+    title: str = "SentryKit Dashboard",
+    page_size: int = _DEFAULT_PAGE_SIZE,
+    top: int = _DEFAULT_TOP,
+    stats: DashboardStats | None = None,
+) -> Iterator[str]:
+    """Yield a paginated dashboard for ``verdicts``, consuming them once.
+
+    Pass a ``stats`` instance to read the aggregates once the output is exhausted.
+    """
+
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    totals = stats if stats is not None else DashboardStats(top=top)
+    for literal, name in _load_template("dashboard.html.j2"):
+        yield literal
+        if name == "TITLE":
+            yield escape(title)
+        elif name == "PAGES":
+            yield from _iter_pages(verdicts, totals, page_size)
+        elif name == "SUMMARY":
+            yield _summary(totals)
+
+
+def write_dashboard(verdicts: Iterable[Verdict], target: Target, **options: Any) -> None:
+    """Stream the dashboard for ``verdicts`` to a path or text stream."""
+
+    _write_chunks(iter_dashboard(verdicts, **options), target)
@@ -1,19 +1,45 @@
-"""HTML reporting helpers leveraging a lightweight template."""
+"""HTML reporting helpers leveraging a lightweight template.
+
+The template is read and split at its ``{{PLACEHOLDER}}`` markers once per
+process. :func:`iter_html` then yields the report piece by piece, one findings
+row at a time, and :func:`write` sends those pieces straight to a file or
+stream, so writing a report never holds more than one row in memory.
+"""
 
 from __future__ import annotations
 
+import os
+import re
+from functools import lru_cache
 from html import escape
 from importlib import resources
-from typing import Any, Dict, List
+from typing import IO, Any, Dict, Iterator, List, Tuple, Union
 
 from ..models import Finding, Report, Verdict
 from ..utils.redact import redact_secrets
 
-_TEMPLATE_PATH = resources.files(__package__) / "templates" / "report.html.j2"
+__all__ = ["iter_html", "render", "write"]
+
+_TEMPLATES = resources.files(__package__) / "templates"
+_PLACEHOLDER = re.compile(r"\{\{([A-Z_]+)\}\}")
+_TABLE_HEAD = (
+    "<table>"
+    "<thead><tr><th>Kind</th><th>Severity</th><th>Details</th><th>Evidence</th></tr></thead>"
+    "<tbody>"
+)
+_TABLE_TAIL = "</tbody></table>"
+
+Target = Union[str, "os.PathLike[str]", IO[str]]
+
 
+@lru_cache(maxsize=4)
+def _load_template(name: str = "report.html.j2") -> Tuple[Tuple[str, str | None], ...]:
+    """Return a template as ``(literal, placeholder)`` pairs; the last placeholder is None."""
 
-def _load_template() -> str:
-    return _TEMPLATE_PATH.read_text(encoding="utf-8")
+    text = (_TEMPLATES / name).read_text(encoding="utf-8")
+    parts = _PLACEHOLDER.split(text)
+    names: List[str | None] = list(parts[1::2])
+    return tuple(zip(parts[0::2], names + [None]))
 
 
 def _sanitize_value(value: Any) -> Any:
@@ -34,19 +60,17 @@ def _stringify(value: Any) -> str:
     return str(value)
 
 
+def _serialize_finding(finding: Finding) -> Dict[str, Any]:
+    return {
+        "kind": finding.kind,
+        "severity": finding.severity,
+        "details": redact_secrets(finding.details),
+        "evidence": _sanitize_value(finding.evidence),
+    }
+
+
 def _serialize_findings(findings: List[Finding]) -> List[Dict[str, Any]]:
-    serialized: List[Dict[str, Any]] = []
-    for finding in findings:
-        sanitized_evidence = _sanitize_value(finding.evidence)
-        serialized.append(
-            {
-                "kind": finding.kind,
-                "severity": finding.severity,
-                "details": redact_secrets(finding.details),
-                "evidence": sanitized_evidence,
-            }
-        )
-    return serialized
+    return [_serialize_finding(finding) for finding in findings]
 
 
 def _serialize_verdict(verdict: Verdict) -> Dict[str, Any]:
@@ -58,47 +82,68 @@ def _serialize_verdict(verdict: Verdict) -> Dict[str, Any]:
     }
 
 
-def _build_findings_section(data: Dict[str, Any]) -> str:
-    findings: List[Dict[str, Any]] = data["findings"]
+def _finding_row(finding: Dict[str, Any]) -> str:
+    evidence_items = "".join(
+        f"<li><strong>{escape(str(key))}:</strong> {escape(_stringify(value))}</li>"
+        for key, value in finding["evidence"].items()
+    )
+    severity = escape(finding["severity"])
+    return (
+        "<tr>"
+        f"<td>{escape(finding['kind'])}</td>"
+        f"<td class='severity-{severity}'>{escape(finding['severity'].title())}</td>"
+        f"<td>{escape(finding['details'])}</td>"
+        f"<td><ul>{evidence_items}</ul></td>"
+        "</tr>"
+    )
+
+
+def _iter_findings_section(findings: List[Finding]) -> Iterator[str]:
     if not findings:
-        return "<p>No findings.</p>"
-    rows: List[str] = []
+        yield "<p>No findings.</p>"
+        return
+    yield _TABLE_HEAD
     for finding in findings:
-        evidence_items = "".join(
-            f"<li><strong>{escape(str(key))}:</strong> {escape(_stringify(value))}</li>"
-            for key, value in finding["evidence"].items()
-        )
-        rows.append(
-            "<tr>"
-            f"<td>{escape(finding['kind'])}</td>"
-            f"<td class='severity-{escape(finding['severity'])}'>{escape(finding['severity'].title())}</td>"
-            f"<td>{escape(finding['details'])}</td>"
-            f"<td><ul>{evidence_items}</ul></td>"
-            "</tr>"
-        )
-    table = (
-        "<table>"
-        "<thead><tr><th>Kind</th><th>Severity</th><th>Details</th><th>Evidence</th></tr></thead>"
-        f"<tbody>{''.join(rows)}</tbody>"
-        "</table>"
-    )
-    return table
+        yield _finding_row(_serialize_finding(finding))
+    yield _TABLE_TAIL
+
+
+def iter_html(verdict: Verdict) -> Iterator[str]:
+    """Yield the HTML report for ``verdict`` in template order, one findings row at a time."""
+
+    fields = {
+        "STATUS_CLASS": "blocked" if verdict.blocked else "allowed",
+        "STATUS_TEXT": "Blocked" if verdict.blocked else "Allowed",
+        "REASON": redact_secrets(verdict.reason),
+    }
+    for literal, name in _load_template():
+        yield literal
+        if name == "FINDINGS_SECTION":
+            yield from _iter_findings_section(verdict.findings)
+        elif name == "SCORE":
+            yield f"{verdict.score:.2f}"
+        elif name is not None:
+            yield escape(fields[name])
+
+
+def write(verdict: Verdict, target: Target) -> None:
+    """Write the HTML report to a path or text stream without building it in memory.
+
+    For a socket, pass ``sock.makefile("w", encoding="utf-8")``.
+    """
+
+    _write_chunks(iter_html(verdict), target)
+
+
+def _write_chunks(chunks: Iterator[str], target: Target) -> None:
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "w", encoding="utf-8") as handle:
+            handle.writelines(chunks)
+        return
+    target.writelines(chunks)
 
 
 def render(verdict: Verdict) -> Report:
     """Render a structured HTML report for a verdict."""
 
-    data = _serialize_verdict(verdict)
-    template = _load_template()
-    status_class = "blocked" if data["blocked"] else "allowed"
-    status_text = "Blocked" if data["blocked"] else "Allowed"
-    findings_section = _build_findings_section(data)
-    html = (
-        template
-        .replace("{{STATUS_CLASS}}", escape(status_class))
-        .replace("{{STATUS_TEXT}}", escape(status_text))
-        .replace("{{SCORE}}", f"{data['score']:.2f}")
-        .replace("{{REASON}}", escape(data["reason"]))
-        .replace("{{FINDINGS_SECTION}}", findings_section)
-    )
-    return Report(html=html, data=data)
+    return Report(html="".join(iter_html(verdict)), data=_serialize_verdict(verdict))
@@ -0,0 +1,337 @@
+"""Machine-readable verdict serialization: NDJSON and a compact binary format.
+
+NDJSON holds one verdict object per line, using the same field names as
+:attr:`Report.data`.
+
+The binary format starts with the magic ``b"SKVD\\x01"`` and stores each verdict
+as a ``u32`` little-endian payload length followed by the payload::
+
+    flags:u8 score:f64 reason:str findings:varint finding*
+    finding = tag:varint [kind:str severity:u8 details:str evidence:str]
+
+Every ``str`` field begins with a varint tag. Tag ``0`` introduces a new string
+(varint byte length plus UTF-8 bytes) that both ends append to a per-stream
+intern table, tag ``1`` a string that is not interned, and any larger tag refers
+to table entry ``tag - 2``. The table is seeded with the built-in finding kinds,
+so kinds, repeated reasons, details and evidence cost one or two bytes after
+their first occurrence. Evidence is stored as compact JSON, empty when absent.
+
+Findings are tagged the same way against a second table: a finding whose
+evidence holds only strings, integers and ``None`` is interned whole, so a
+repeat costs one varint and skips JSON entirely on both ends.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import struct
+from typing import IO, Any, Dict, Final, Iterable, Iterator, List, Tuple, Union
+
+from ..errors import ParseError
+from ..models import Finding, Verdict
+
+__all__ = [
+    "BinaryReader",
+    "BinaryWriter",
+    "finding_from_dict",
+    "finding_to_dict",
+    "read_binary",
+    "read_ndjson",
+    "verdict_from_dict",
+    "verdict_to_dict",
+    "write_binary",
+    "write_ndjson",
+]
+
+_MAGIC: Final[bytes] = b"SKVD\x01"
+_RECORD_LENGTH: Final[struct.Struct] = struct.Struct("<I")
+_HEAD: Final[struct.Struct] = struct.Struct("<Bd")
+_KNOWN_KINDS: Final[Tuple[str, ...]] = (
+    "hallucination",
+    "goal_drift",
+    "context_poisoning",
+    "jailbreak",
+    "tool_firewall",
+    "data_leak",
+    "internal_error",
+)
+_SEVERITIES: Final[Tuple[str, ...]] = ("low", "medium", "high")
+_SEVERITY_CODES: Final[Dict[str, int]] = {name: code for code, name in enumerate(_SEVERITIES)}
+_MAX_INTERNED: Final[int] = 16384
+_MAX_INTERNED_LENGTH: Final[int] = 256
+_SHAREABLE: Final = (str, int, type(None))
+_SMALL_VARINTS: Final[Tuple[bytes, ...]] = tuple(bytes((value,)) for value in range(128))
+
+TextTarget = Union[str, "os.PathLike[str]", IO[str]]
+BinaryTarget = Union[str, "os.PathLike[str]", IO[bytes]]
+
+
+def finding_to_dict(finding: Finding) -> Dict[str, Any]:
+    return {
+        "kind": finding.kind,
+        "severity": finding.severity,
+        "details": finding.details,
+        "evidence": finding.evidence,
+    }
+
+
+def finding_from_dict(data: Dict[str, Any]) -> Finding:
+    return Finding(
+        kind=data["kind"],
+        severity=data["severity"],
+        details=data["details"],
+        evidence=data.get("evidence") or {},
+    )
+
+
+def verdict_to_dict(verdict: Verdict) -> Dict[str, Any]:
+    return {
+        "blocked": verdict.blocked,
+        "score": verdict.score,
+        "reason": verdict.reason,
+        "findings": [finding_to_dict(finding) for finding in verdict.findings],
+    }
+
+
+def verdict_from_dict(data: Dict[str, Any]) -> Verdict:
+    return Verdict(
+        blocked=bool(data["blocked"]),
+        reason=data["reason"],
+        score=float(data["score"]),
+        findings=[finding_from_dict(item) for item in data.get("findings", [])],
+    )
+
+
+def write_ndjson(verdicts: Iterable[Verdict], target: TextTarget) -> int:
+    """Write one JSON object per verdict; return how many were written."""
+
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "w", encoding="utf-8") as handle:
+            return write_ndjson(verdicts, handle)
+    encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str).encode
+    count = 0
+    for verdict in verdicts:
+        target.write(encode(verdict_to_dict(verdict)) + "\n")
+        count += 1
+    return count
+
+
+def read_ndjson(source: TextTarget) -> Iterator[Verdict]:
+    """Yield verdicts from NDJSON, skipping blank lines."""
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "r", encoding="utf-8") as handle:
+            yield from read_ndjson(handle)
+        return
+    for number, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield verdict_from_dict(json.loads(line))
+        except (ValueError, KeyError, TypeError) as exc:
+            raise ParseError(f"Invalid verdict on NDJSON line {number}: {exc}") from exc
+
+
+def _varint(value: int) -> bytes:
+    if value < 128:
+        return _SMALL_VARINTS[value]
+    out = bytearray()
+    while value >= 128:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+class BinaryWriter:
+    """Append verdicts to a binary stream, interning repeated strings."""
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        self._stream = stream
+        self._table: Dict[str, bytes] = {
+            kind: _varint(code + 2) for code, kind in enumerate(_KNOWN_KINDS)
+        }
+        self._findings: Dict[Tuple[Any, ...], bytes] = {}
+        self._encode_json = json.JSONEncoder(
+            separators=(",", ":"), ensure_ascii=False, default=str
+        ).encode
+        stream.write(_MAGIC)
+
+    def write(self, verdict: Verdict) -> None:
+        parts: List[bytes] = [_HEAD.pack(verdict.blocked, verdict.score)]
+        text = self._text
+        interned = self._findings
+        text(parts, verdict.reason)
+        parts.append(_varint(len(verdict.findings)))
+        for finding in verdict.findings:
+            key = _finding_key(finding)
+            reference = interned.get(key) if key is not None else None
+            if reference is not None:
+                parts.append(reference)
+                continue
+            if key is not None and len(interned) < _MAX_INTERNED:
+                interned[key] = _varint(len(interned) + 2)
+                parts.append(_SMALL_VARINTS[0])
+            else:
+                parts.append(_SMALL_VARINTS[1])
+            text(parts, finding.kind)
+            parts.append(_SMALL_VARINTS[_SEVERITY_CODES[finding.severity]])
+            text(parts, finding.details)
+            text(parts, self._encode_json(finding.evidence) if finding.evidence else "")
+        payload = b"".join(parts)
+        self._stream.write(_RECORD_LENGTH.pack(len(payload)) + payload)
+
+    def write_all(self, verdicts: Iterable[Verdict]) -> int:
+        count = 0
+        for verdict in verdicts:
+            self.write(verdict)
+            count += 1
+        return count
+
+    def _text(self, parts: List[bytes], value: str) -> None:
+        reference = self._table.get(value)
+        if reference is not None:
+            parts.append(reference)
+            return
+        raw = value.encode("utf-8", "surrogatepass")
+        if len(value) <= _MAX_INTERNED_LENGTH and len(self._table) < _MAX_INTERNED:
+            self._table[value] = _varint(len(self._table) + 2)
+            parts.append(_SMALL_VARINTS[0])
+        else:
+            parts.append(_SMALL_VARINTS[1])
+        parts.append(_varint(len(raw)))
+        parts.append(raw)
+
+
+class BinaryReader:
+    """Iterate verdicts from a stream written by :class:`BinaryWriter`."""
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        self._stream = stream
+        self._table: List[str] = list(_KNOWN_KINDS)
+        self._findings: List[Tuple[str, Any, str, Dict[str, Any], bool]] = []
+        self._decode_json = json.JSONDecoder().raw_decode
+        if stream.read(len(_MAGIC)) != _MAGIC:
+            raise ParseError("Not a SentryKit binary verdict stream")
+
+    def __iter__(self) -> Iterator[Verdict]:
+        read = self._stream.read
+        while True:
+            prefix = read(_RECORD_LENGTH.size)
+            if not prefix:
+                return
+            if len(prefix) != _RECORD_LENGTH.size:
+                raise ParseError("Truncated binary verdict record")
+            (length,) = _RECORD_LENGTH.unpack(prefix)
+            payload = read(length)
+            if len(payload) != length:
+                raise ParseError("Truncated binary verdict record")
+            try:
+                yield self._decode(payload)
+            except (IndexError, ValueError, struct.error) as exc:
+                raise ParseError(f"Corrupt binary verdict record: {exc}") from exc
+
+    def _decode(self, payload: bytes) -> Verdict:
+        flags, score = _HEAD.unpack_from(payload, 0)
+        text = self._text
+        interned = self._findings
+        reason, position = text(payload, _HEAD.size)
+        count, position = _read_varint(payload, position)
+        findings: List[Finding] = []
+        severity: Any
+        for _ in range(count):
+            tag = payload[position]
+            if tag < 128:
+                position += 1
+            else:
+                tag, position = _read_varint(payload, position)
+            if tag >= 2:
+                kind, severity, details, evidence, shareable = interned[tag - 2]
+                # Shared evidence from a well-formed stream holds only immutable values.
+                evidence = dict(evidence) if shareable else copy.deepcopy(evidence)
+                findings.append(Finding(kind, severity, details, evidence))
+                continue
+            kind, position = text(payload, position)
+            severity = _SEVERITIES[payload[position]]
+            details, position = text(payload, position + 1)
+            raw, position = text(payload, position)
+            evidence = self._decode_json(raw)[0] if raw else {}
+            if not isinstance(evidence, dict):
+                raise ValueError("evidence is not an object")
+            if tag == 0:
+                shareable = all(isinstance(value, _SHAREABLE) for value in evidence.values())
+                interned.append((kind, severity, details, evidence, shareable))
+                evidence = dict(evidence) if shareable else copy.deepcopy(evidence)
+            findings.append(Finding(kind, severity, details, evidence))
+        if position != len(payload):
+            raise ValueError("trailing bytes")
+        return Verdict(bool(flags & 1), reason, score, findings)
+
+    def _text(self, payload: bytes, position: int) -> Tuple[str, int]:
+        """Return the string at ``position`` and the position after it."""
+
+        tag = payload[position]
+        if tag < 128:
+            position += 1
+        else:
+            tag, position = _read_varint(payload, position)
+        if tag >= 2:
+            return self._table[tag - 2], position
+        length = payload[position]
+        if length < 128:
+            position += 1
+        else:
+            length, position = _read_varint(payload, position)
+        end = position + length
+        if end > len(payload):
+            raise ValueError("string runs past end of record")
+        value = payload[position:end].decode("utf-8", "surrogatepass")
+        if tag == 0:
+            self._table.append(value)
+        return value, end
+
+
+def _finding_key(finding: Finding) -> Tuple[Any, ...] | None:
+    """Return a hashable key for ``finding``, or ``None`` when it should not be interned."""
+
+    # Exact types keep keys distinct where equality is loose (``1 == 1.0 == True``).
+    for value in finding.evidence.values():
+        if type(value) not in _SHAREABLE:
+            return None
+    return (finding.kind, finding.severity, finding.details, *finding.evidence.items())
+
+
+def _read_varint(payload: bytes, position: int) -> Tuple[int, int]:
+    byte = payload[position]
+    if byte < 128:
+        return byte, position + 1
+    value = 0
+    shift = 0
+    while True:
+        byte = payload[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 128:
+            return value, position
+        shift += 7
+
+
+def write_binary(verdicts: Iterable[Verdict], target: BinaryTarget) -> int:
+    """Write verdicts in the binary format; return how many were written."""
+
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as handle:
+            return BinaryWriter(handle).write_all(verdicts)
+    return BinaryWriter(target).write_all(verdicts)
+
+
+def read_binary(source: BinaryTarget) -> Iterator[Verdict]:
+    """Yield verdicts from a binary stream or file."""
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as handle:
+            yield from BinaryReader(handle)
+        return
+    yield from BinaryReader(source)
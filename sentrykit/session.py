@@ -0,0 +1,129 @@
+"""Incremental evaluation of a conversation as it grows.
+
+A :class:`GuardSession` holds the state of one conversation. Messages, contexts,
+tool calls and outputs are added as they arrive, and only the new content is
+handed to the checkers, so a turn costs time in proportion to what it added
+rather than to the whole transcript. The goal and constraints are scanned on the
+first update and again whenever they are changed; each output is checked for
+drift against them and its claims verified against every context gathered so far.
+
+Findings accumulate across updates. Findings that summarize a whole run are
+kept once: a jailbreak phrase is reported the first time it appears, and PII
+hits from every update share a single finding holding the first samples.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from .checkers.hallucination import ContextIndex
+from .checkers.leaks import PII_DETAILS, merge_pii
+from .engine import GuardEngine
+from .models import ContextChunk, Finding, RunInput, RunOutput, ToolCall, Verdict
+
+__all__ = ["GuardSession"]
+
+
+def _summary_key(finding: Finding) -> Tuple[str, str] | None:
+    if finding.kind == "jailbreak":
+        return finding.kind, str(finding.evidence.get("phrase"))
+    if finding.kind == "data_leak" and finding.details == PII_DETAILS:
+        return finding.kind, finding.details
+    return None
+
+
+class GuardSession:
+    """Per-conversation state for evaluating new content as it arrives."""
+
+    def __init__(
+        self, engine: GuardEngine, goal: str = "", constraints: Sequence[str] = ()
+    ) -> None:
+        self.engine = engine
+        self.goal = goal
+        self.constraints = list(constraints)
+        self._findings: List[Finding] = []
+        # Summary finding key -> its index in ``_findings``.
+        self._summaries: Dict[Tuple[str, str], int] = {}
+        self._contexts = ContextIndex(source_map=engine.policy.evidence_source_map)
+        self._kinds: Set[str] = set()
+        self._blocked = False
+        # The goal and constraints as of the last scan, or None before the first update.
+        self._scanned: Tuple[str, List[str]] | None = None
+
+    @property
+    def findings(self) -> List[Finding]:
+        """Every finding so far, in the order it was first reported."""
+
+        return list(self._findings)
+
+    @property
+    def blocked(self) -> bool:
+        """Whether any finding so far matches the policy's ``block_on`` rules."""
+
+        return self._blocked
+
+    @property
+    def reason(self) -> str:
+        return "; ".join(sorted(self._kinds)) if self._kinds else "No findings"
+
+    def update(
+        self,
+        *,
+        messages: Iterable[Tuple[str, str]] = (),
+        contexts: Iterable[ContextChunk] = (),
+        tool_calls: Iterable[ToolCall] = (),
+        output: RunOutput | None = None,
+    ) -> List[Finding]:
+        """Evaluate new content and return the findings it produced."""
+
+        scan = self._scanned != (self.goal, self.constraints)
+        self._scanned = (self.goal, list(self.constraints))
+        delta = RunInput(
+            goal=self.goal if scan else "",
+            constraints=list(self.constraints) if scan else [],
+            messages=list(messages),
+            contexts=list(contexts),
+            tool_calls=list(tool_calls),
+            output=output,
+        )
+        for chunk in delta.contexts:
+            self._contexts.add(chunk)
+        findings = self.engine.check_content(delta)
+        if output is not None:
+            judged = RunInput(self.goal, self.constraints, [], [], [], output)
+            findings.extend(self.engine.check_output(judged, self._contexts))
+        return self._record(findings)
+
+    def add_message(self, role: str, text: str) -> List[Finding]:
+        return self.update(messages=[(role, text)])
+
+    def add_context(self, chunk: ContextChunk) -> List[Finding]:
+        return self.update(contexts=[chunk])
+
+    def add_tool_call(self, call: ToolCall) -> List[Finding]:
+        return self.update(tool_calls=[call])
+
+    def add_output(self, output: RunOutput) -> List[Finding]:
+        return self.update(output=output)
+
+    def verdict(self) -> Verdict:
+        """Build a verdict, with its report, over every finding so far."""
+
+        return self.engine.verdict_for(list(self._findings))
+
+    def _record(self, findings: List[Finding]) -> List[Finding]:
+        for finding in findings:
+            key = _summary_key(finding)
+            index = self._summaries.get(key) if key is not None else None
+            if index is not None:
+                # A repeated jailbreak phrase is still returned, but kept only once.
+                if finding.kind != "jailbreak":
+                    self._findings[index] = merge_pii(self._findings[index], finding)
+            else:
+                if key is not None:
+                    self._summaries[key] = len(self._findings)
+                self._findings.append(finding)
+            self._kinds.add(finding.kind)
+            if not self._blocked and self.engine.should_block([finding]):
+                self._blocked = True
+        return findings
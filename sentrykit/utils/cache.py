@@ -0,0 +1,90 @@
+"""Bounded in-memory caches with optional TTL and hit statistics."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Tuple, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe least-recently-used cache.
+
+    Entries older than ``ttl`` seconds are dropped on access.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        *,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and self.ttl is not None and self._clock() - entry[0] >= self.ttl:
+                del self._data[key]
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def peek(self, key: K) -> V | None:
+        """Return the entry for ``key`` without touching recency or statistics."""
+
+        with self._lock:
+            entry = self._data.get(key)
+        return entry[1] if entry is not None else None
+
+    def put(self, key: K, value: V) -> V:
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (self._clock(), value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.stats.evictions += 1
+        return value
+
+    def pop(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
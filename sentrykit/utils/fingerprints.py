@@ -0,0 +1,196 @@
+"""Fingerprints of known secrets, matched without holding their plaintext.
+
+Each secret is stored as its length, a Rabin-Karp hash of its characters and an
+HMAC-SHA256 digest, both keyed by a random per-file salt; the polynomial base of
+the rolling hash is derived from the salt too. Scanning text runs one rolling
+hash per distinct secret length, so the cost is linear in the text for each
+length, and confirms every rolling-hash candidate with the HMAC digest before
+reporting it. The rolling hash is only 31 bits, so it narrows candidates down
+without identifying a secret on its own. Fingerprints also record whether the
+secret contains whitespace; lengths whose secrets never do are only hashed
+inside runs of non-whitespace at least that long, which skips ordinary prose.
+
+The file is JSON::
+
+    {"version": 1, "salt": "<hex>", "fingerprints": [
+        {"id": "...", "length": 32, "rolling": 123456789, "digest": "<hex>",
+         "spaced": false}, ...]}
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+import re
+import secrets as _random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Final, Iterable, Iterator, List, Mapping, Tuple
+
+from ..errors import ParseError
+
+__all__ = ["Fingerprint", "SecretFingerprints"]
+
+_VERSION: Final[int] = 1
+_MODULUS: Final[int] = (1 << 31) - 1
+_SALT_BYTES: Final[int] = 32
+# Characters whose codes are materialized at once while hashing.
+_CHUNK: Final[int] = 64 * 1024
+_WHITESPACE = re.compile(r"\s")
+
+
+@dataclass(frozen=True, slots=True)
+class Fingerprint:
+    id: str
+    length: int
+    rolling: int
+    digest: str
+    spaced: bool = False
+
+
+def _base(salt: bytes) -> int:
+    seed = hashlib.sha256(salt + b"rolling-base").digest()
+    return int.from_bytes(seed[:8], "big") % (_MODULUS - 256) + 256
+
+
+@lru_cache(maxsize=64)
+def _run_pattern(length: int) -> re.Pattern[str]:
+    return re.compile(r"\S{%d,}" % length)
+
+
+def _rolling(codes: Iterable[int], base: int) -> int:
+    value = 0
+    for code in codes:
+        value = (value * base + code) % _MODULUS
+    return value
+
+
+class SecretFingerprints:
+    """A set of secret fingerprints that can be scanned for in text."""
+
+    def __init__(self, salt: bytes, fingerprints: Iterable[Fingerprint] = ()) -> None:
+        if not salt:
+            raise ValueError("salt must not be empty")
+        self.salt = salt
+        self._base = _base(salt)
+        self._fingerprints: List[Fingerprint] = []
+        # length -> rolling hash -> fingerprints sharing it
+        self._by_length: Dict[int, Dict[int, List[Fingerprint]]] = {}
+        for fingerprint in fingerprints:
+            self._add(fingerprint)
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    @classmethod
+    def from_secrets(
+        cls, secrets: Mapping[str, str], *, salt: bytes | None = None
+    ) -> "SecretFingerprints":
+        """Fingerprint ``secrets`` (id to plaintext) under ``salt``, random by default."""
+
+        result = cls(salt or _random.token_bytes(_SALT_BYTES))
+        for identifier, secret in secrets.items():
+            if not secret:
+                raise ValueError(f"secret {identifier!r} is empty")
+            result._add(
+                Fingerprint(
+                    id=identifier,
+                    length=len(secret),
+                    rolling=_rolling(map(ord, secret), result._base),
+                    digest=result._digest(secret),
+                    spaced=_WHITESPACE.search(secret) is not None,
+                )
+            )
+        return result
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> "SecretFingerprints":
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            if data.get("version") != _VERSION:
+                raise ValueError(f"unsupported version {data.get('version')!r}")
+            fingerprints = [
+                Fingerprint(
+                    id=str(item["id"]),
+                    length=int(item["length"]),
+                    rolling=int(item["rolling"]),
+                    digest=str(item["digest"]),
+                    spaced=bool(item.get("spaced", False)),
+                )
+                for item in data["fingerprints"]
+            ]
+            return cls(bytes.fromhex(data["salt"]), fingerprints)
+        except (ValueError, KeyError, TypeError) as exc:
+            raise ParseError(f"Invalid secret fingerprint file {path}: {exc}") from exc
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        data = {
+            "version": _VERSION,
+            "salt": self.salt.hex(),
+            "fingerprints": [
+                {
+                    "id": item.id,
+                    "length": item.length,
+                    "rolling": item.rolling,
+                    "digest": item.digest,
+                    "spaced": item.spaced,
+                }
+                for item in self._fingerprints
+            ],
+        }
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(data, handle, indent=2)
+
+    def scan(self, text: str) -> Iterator[Tuple[str, int]]:
+        """Yield ``(fingerprint id, offset)`` for every known secret in ``text``."""
+
+        runs: List[Tuple[int, int]] | None = None
+        for length, table in sorted(self._by_length.items()):
+            if any(item.spaced for items in table.values() for item in items):
+                spans: Iterable[Tuple[int, int]] = [(0, len(text))]
+            else:
+                if runs is None:
+                    # Lengths ascend, so runs long enough for this one suit later ones too.
+                    runs = [match.span() for match in _run_pattern(length).finditer(text)]
+                spans = [(begin, end) for begin, end in runs if end - begin >= length]
+            for begin, end in spans:
+                for offset, fingerprint in self._scan_span(text, begin, end, length, table):
+                    yield fingerprint.id, offset
+
+    def _scan_span(
+        self, text: str, begin: int, end: int, length: int, table: Dict[int, List[Fingerprint]]
+    ) -> Iterator[Tuple[int, Fingerprint]]:
+        base = self._base
+        modulus = _MODULUS
+        drop = pow(base, length - 1, modulus)
+        for start in range(begin, end - length + 1, _CHUNK):
+            # Windows starting in this chunk need ``length - 1`` characters past it.
+            codes = list(map(ord, text[start : min(end, start + _CHUNK + length - 1)]))
+            value = _rolling(codes[:length], base)
+            if value in table:
+                yield from self._confirm(text, start, length, table[value])
+            pairs = zip(codes, codes[length:])
+            for index, (leaving, entering) in enumerate(pairs, start + 1):
+                value = ((value - leaving * drop) * base + entering) % modulus
+                if value in table:
+                    yield from self._confirm(text, index, length, table[value])
+
+    def _confirm(
+        self, text: str, offset: int, length: int, candidates: List[Fingerprint]
+    ) -> Iterator[Tuple[int, Fingerprint]]:
+        digest = self._digest(text[offset : offset + length])
+        for fingerprint in candidates:
+            if hmac.compare_digest(digest, fingerprint.digest):
+                yield offset, fingerprint
+
+    def _digest(self, value: str) -> str:
+        raw = value.encode("utf-8", "surrogatepass")
+        return hmac.new(self.salt, raw, hashlib.sha256).hexdigest()
+
+    def _add(self, fingerprint: Fingerprint) -> None:
+        self._fingerprints.append(fingerprint)
+        table = self._by_length.setdefault(fingerprint.length, {})
+        table.setdefault(fingerprint.rolling, []).append(fingerprint)
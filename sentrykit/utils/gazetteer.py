@@ -0,0 +1,153 @@
+"""Location gazetteer used by the goal drift checker.
+
+A gazetteer file is JSON::
+
+    {"version": 1, "locations": [
+        {"name": "austin", "aliases": ["austin, tx", "atx"]},
+        {"name": "round rock", "metro": "austin"}, ...]}
+
+``name`` is the canonical name reported in findings and is itself an alias;
+``metro`` names another location whose metro area this one belongs to. Names
+and aliases are matched case-insensitively on whole words, with punctuation and
+spacing between words ignored, so ``"austin, tx"`` also matches ``"Austin TX"``
+but ``"austin"`` does not match inside ``"Austinite"``.
+
+Aliases compile into a trie keyed by word. :meth:`Gazetteer.find` splits the
+text into words once and walks the trie from each word, taking the longest alias
+that starts there, so ``"new york"`` wins over a separate ``"york"``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import resources
+from typing import Any, Dict, Final, Iterable, Set, Tuple
+
+from ..errors import ParseError
+
+__all__ = ["Gazetteer", "Location"]
+
+_VERSION: Final[int] = 1
+_WORD = re.compile(r"[^\W_]+")
+# Trie nodes map words to child nodes; this key holds the name an alias ends at.
+_END: Final[str] = ""
+_DEFAULT: Final = resources.files(__package__) / "data" / "locations.json"
+
+_Node = Dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class Location:
+    name: str
+    aliases: Tuple[str, ...] = ()
+    metro: str | None = None
+
+
+def _words(text: str) -> Tuple[str, ...]:
+    return tuple(_WORD.findall(text.lower()))
+
+
+class Gazetteer:
+    """Canonical locations, their aliases and metro membership, compiled for matching."""
+
+    def __init__(self, locations: Iterable[Location]) -> None:
+        self.locations: Dict[str, Location] = {}
+        self._trie: _Node = {}
+        for location in locations:
+            name = location.name.lower()
+            if name in self.locations:
+                raise ValueError(f"duplicate location {name!r}")
+            self.locations[name] = location
+            for alias in (name, *location.aliases):
+                self._insert(alias, name)
+        self._metro: Dict[str, str] = {}
+        for name, location in self.locations.items():
+            if location.metro is None:
+                continue
+            metro = location.metro.lower()
+            if metro not in self.locations:
+                raise ValueError(f"location {name!r} is in unknown metro {metro!r}")
+            self._metro[name] = metro
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Gazetteer":
+        if data.get("version") != _VERSION:
+            raise ValueError(f"unsupported version {data.get('version')!r}")
+        return cls(
+            Location(
+                name=str(item["name"]),
+                aliases=tuple(str(alias) for alias in item.get("aliases", ())),
+                metro=item.get("metro"),
+            )
+            for item in data["locations"]
+        )
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> "Gazetteer":
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                return cls.from_dict(json.load(handle))
+        except (ValueError, KeyError, TypeError) as exc:
+            raise ParseError(f"Invalid gazetteer file {path}: {exc}") from exc
+
+    @classmethod
+    def default(cls) -> "Gazetteer":
+        """Return the gazetteer bundled with SentryKit."""
+
+        return _default()
+
+    def find(self, text: str) -> Set[str]:
+        """Return the canonical names of every location mentioned in ``text``."""
+
+        words = _WORD.findall(text.lower())
+        found: Set[str] = set()
+        root = self._trie
+        count = len(words)
+        index = 0
+        while index < count:
+            node = root.get(words[index])
+            best: str | None = None
+            end = index + 1
+            position = index
+            while node is not None:
+                position += 1
+                name = node.get(_END)
+                if name is not None:
+                    best, end = name, position
+                if position == count:
+                    break
+                node = node.get(words[position])
+            if best is not None:
+                found.add(best)
+            index = end
+        return found
+
+    def metro_of(self, name: str) -> str | None:
+        """Return the metro ``name`` belongs to, if any."""
+
+        return self._metro.get(name)
+
+    def _insert(self, alias: str, name: str) -> None:
+        words = _words(alias)
+        if not words:
+            raise ValueError(f"alias {alias!r} of {name!r} has no words")
+        node = self._trie
+        for word in words:
+            node = node.setdefault(word, {})
+        existing = node.get(_END)
+        if existing is not None and existing != name:
+            raise ValueError(f"alias {alias!r} names both {existing!r} and {name!r}")
+        node[_END] = name
+
+
+@lru_cache(maxsize=1)
+def _default() -> Gazetteer:
+    return Gazetteer.from_dict(json.loads(_DEFAULT.read_text(encoding="utf-8")))
+
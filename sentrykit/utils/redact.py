@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+from typing import Final, List
 
 _SECRET_PATTERNS = [
     re.compile(r"(sk-[a-z0-9]{16,})", re.IGNORECASE),
@@ -11,6 +13,19 @@ _SECRET_PATTERNS = [
     re.compile(r"(ssh-rsa [A-Za-z0-9+/=]+)"),
     re.compile(r"(-----BEGIN [A-Z ]+PRIVATE KEY-----[\s\S]+?-----END [A-Z ]+PRIVATE KEY-----)", re.MULTILINE),
 ]
+_COMBINED = re.compile(
+    "|".join(
+        f"(?i:{pattern.pattern})" if pattern.flags & re.IGNORECASE else pattern.pattern
+        for pattern in _SECRET_PATTERNS
+    )
+)
+# Literal prefixes of the patterns above; one starting inside a match means the
+# patterns interact and the sequential algorithm must decide the output.
+_PREFIXES = re.compile(r"sk-|AKIA|ASIA|ssh-rsa |-----BEGIN ", re.IGNORECASE)
+_PREFIX_STARTS = re.compile(f"(?={_PREFIXES.pattern})", re.IGNORECASE)
+_LONGEST_PREFIX: Final[int] = len("-----BEGIN ")
+_MEMO_SIZE: Final[int] = 4096
+_MEMO_MAX_LENGTH: Final[int] = 4096
 
 
 def _mask(value: str) -> str:
@@ -19,9 +34,7 @@ def _mask(value: str) -> str:
     return f"{'*' * (len(value) - 4)}{value[-4:]}"
 
 
-def redact_secrets(text: str) -> str:
-    """Mask known secrets inside text."""
-
+def _redact_sequential(text: str) -> str:
     redacted = text
     for pattern in _SECRET_PATTERNS:
         matches = list(pattern.finditer(redacted))
@@ -30,3 +43,51 @@ def redact_secrets(text: str) -> str:
             redacted_val = _mask(full)
             redacted = redacted.replace(full, redacted_val)
     return redacted
+
+
+def _interacts(text: str, matches: List[re.Match[str]]) -> bool:
+    for match in matches:
+        start, end = match.span()
+        prefix = _PREFIXES.search(text, start + 1, end + _LONGEST_PREFIX)
+        if prefix is not None and prefix.start() < end:
+            return True
+    # Every occurrence of a matched value starts with a pattern prefix, so one scan
+    # of those positions finds any value occurring other than where it was matched.
+    starts = {match.start(): match.group() for match in matches}
+    values = set(starts.values())
+    lengths = {len(value) for value in values}
+    for candidate in _PREFIX_STARTS.finditer(text):
+        position = candidate.start()
+        for length in lengths:
+            value = text[position : position + length]
+            if value in values and starts.get(position) != value:
+                return True
+    return False
+
+
+def _redact(text: str) -> str:
+    matches = list(_COMBINED.finditer(text))
+    if not matches:
+        return text
+    if _interacts(text, matches):
+        return _redact_sequential(text)
+    pieces: List[str] = []
+    position = 0
+    for match in matches:
+        start, end = match.span()
+        pieces.append(text[position:start])
+        pieces.append(_mask(match.group()))
+        position = end
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+
+_redact_memo = lru_cache(maxsize=_MEMO_SIZE)(_redact)
+
+
+def redact_secrets(text: str) -> str:
+    """Mask known secrets inside text."""
+
+    if len(text) <= _MEMO_MAX_LENGTH:
+        return _redact_memo(text)
+    return _redact(text)
@@ -0,0 +1,161 @@
+"""Append-only evidence archive for reproducible, offline claim verification.
+
+The archive is a single file: an 8-byte magic header followed by records of the
+form ``<url length:u32><body length:u32><body crc32:u32><url utf-8><body utf-8>``.
+Re-recording a URL appends a new record and the latest one wins. On open the
+record headers are scanned once to build a URL to offset index; bodies are read
+through a memory map and only decoded when requested.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Callable, Dict, Final, Iterator, Tuple
+
+from ..errors import NetworkError, ParseError
+from .web import fetch_text
+
+__all__ = ["EvidenceArchive"]
+
+_MAGIC: Final[bytes] = b"SKEVAR01"
+_HEADER: Final[struct.Struct] = struct.Struct("<III")
+
+
+class EvidenceArchive:
+    """Record fetched evidence to disk and replay it without network access."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._index: Dict[str, Tuple[int, int, int]] = {}
+        self._handle = open(self.path, "a+b")
+        self._map: mmap.mmap | None = None
+        self._handle.seek(0, os.SEEK_END)
+        if self._handle.tell() == 0:
+            self._handle.write(_MAGIC)
+            self._handle.flush()
+        self._load_index()
+
+    def __enter__(self) -> "EvidenceArchive":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, url: object) -> bool:
+        return url in self._index
+
+    def urls(self) -> Iterator[str]:
+        return iter(list(self._index))
+
+    def end_offset(self) -> int:
+        """Return the offset the next record will be written at."""
+
+        with self._lock:
+            self._handle.seek(0, os.SEEK_END)
+            return self._handle.tell()
+
+    def urls_since(self, offset: int) -> Iterator[str]:
+        """Yield URLs whose latest record was written at or after ``offset``, oldest first."""
+
+        with self._lock:
+            recent = sorted(
+                (body, url) for url, (body, _, _) in self._index.items() if body >= offset
+            )
+        return iter([url for _, url in recent])
+
+    def close(self) -> None:
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._handle.close()
+
+    def record(self, url: str, text: str) -> None:
+        """Append ``text`` as the archived body for ``url``."""
+
+        raw_url = url.encode("utf-8")
+        body = text.encode("utf-8", errors="surrogatepass")
+        checksum = zlib.crc32(body)
+        header = _HEADER.pack(len(raw_url), len(body), checksum)
+        with self._lock:
+            self._handle.seek(0, os.SEEK_END)
+            offset = self._handle.tell() + _HEADER.size + len(raw_url)
+            self._handle.write(header + raw_url + body)
+            self._handle.flush()
+            self._index[url] = (offset, len(body), checksum)
+
+    def get(self, url: str) -> str | None:
+        """Return the latest archived body for ``url``, or ``None``."""
+
+        with self._lock:
+            location = self._index.get(url)
+            if location is None:
+                return None
+            offset, length, checksum = location
+            view = self._mapped(offset + length)
+            body = view[offset : offset + length]
+        if zlib.crc32(body) != checksum:
+            raise ParseError(f"Corrupt archive record for {url} in {self.path}")
+        return body.decode("utf-8", errors="surrogatepass")
+
+    def recorder(self, fetcher: Callable[[str], str] | None = None) -> Callable[[str], str]:
+        """Return a fetcher that delegates to ``fetcher`` and archives every document."""
+
+        fetch = fetcher or fetch_text
+
+        def _record(url: str) -> str:
+            text = fetch(url)
+            self.record(url, text)
+            return text
+
+        return _record
+
+    def replayer(self) -> Callable[[str], str]:
+        """Return a fetcher that serves archived documents and never touches the network."""
+
+        def _replay(url: str) -> str:
+            text = self.get(url)
+            if text is None:
+                raise NetworkError(f"{url} is not in evidence archive {self.path}")
+            return text
+
+        return _replay
+
+    def _mapped(self, end: int) -> mmap.mmap:
+        if self._map is None or len(self._map) < end:
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _load_index(self) -> None:
+        view = self._mapped(len(_MAGIC))
+        if view[: len(_MAGIC)] != _MAGIC:
+            self.close()
+            raise ParseError(f"{self.path} is not a SentryKit evidence archive")
+        position = len(_MAGIC)
+        size = len(view)
+        while position + _HEADER.size <= size:
+            url_length, body_length, checksum = _HEADER.unpack_from(view, position)
+            url_start = position + _HEADER.size
+            body_start = url_start + url_length
+            end = body_start + body_length
+            if end > size:
+                break
+            url = view[url_start:body_start].decode("utf-8")
+            self._index[url] = (body_start, body_length, checksum)
+            position = end
+        if position < size:
+            # Drop a torn trailing record left by an interrupted write so new
+            # appends stay reachable by the next index scan.
+            view.close()
+            self._map = None
+            self._handle.truncate(position)
@@ -0,0 +1,118 @@
+"""Per-host circuit breaker and negative cache for evidence fetches."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Final
+
+from ..errors import CircuitOpenError
+from ..utils.urls import domain_of
+
+__all__ = ["CircuitBreaker", "DEFAULT_BREAKER"]
+
+_DEFAULT_FAILURE_THRESHOLD: Final[int] = 5
+_DEFAULT_COOLDOWN: Final[float] = 30.0
+_DEFAULT_NEGATIVE_TTL: Final[float] = 60.0
+_DEFAULT_NEGATIVE_ENTRIES: Final[int] = 4096
+
+
+@dataclass(slots=True)
+class _HostState:
+    failures: int = 0
+    opened_at: float | None = None
+    probing: bool = False
+
+
+class CircuitBreaker:
+    """Shared host health tracker consulted before every evidence fetch.
+
+    A host opens after ``failure_threshold`` consecutive failed attempts. Once
+    ``cooldown`` seconds have passed a single half-open probe is let through; its
+    success closes the circuit and its failure re-opens it. URLs that answered
+    with a 4xx status are remembered for ``negative_ttl`` seconds so repeat
+    requests fail immediately without touching the network.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = _DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = _DEFAULT_COOLDOWN,
+        negative_ttl: float = _DEFAULT_NEGATIVE_TTL,
+        max_negative_entries: int = _DEFAULT_NEGATIVE_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.negative_ttl = negative_ttl
+        self.max_negative_entries = max_negative_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, _HostState] = {}
+        self._negative: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def check(self, url: str) -> None:
+        """Raise :class:`CircuitOpenError` if ``url`` must not be fetched right now."""
+
+        now = self._clock()
+        host = domain_of(url)
+        with self._lock:
+            cached = self._negative.get(url)
+            if cached is not None:
+                expires_at, reason = cached
+                if now < expires_at:
+                    raise CircuitOpenError(f"circuit_open: {url} recently failed with {reason}")
+                del self._negative[url]
+            state = self._hosts.get(host)
+            if state is None or state.opened_at is None:
+                return
+            if state.probing or now - state.opened_at < self.cooldown:
+                raise CircuitOpenError(f"circuit_open: host {host} is failing")
+            state.probing = True
+
+    def record_success(self, url: str) -> None:
+        with self._lock:
+            self._hosts.pop(domain_of(url), None)
+
+    def record_failure(self, url: str) -> None:
+        host = domain_of(url)
+        with self._lock:
+            state = self._hosts.setdefault(host, _HostState())
+            state.failures += 1
+            if state.probing or state.failures >= self.failure_threshold:
+                state.opened_at = self._clock()
+                state.probing = False
+
+    def end_probe(self, url: str) -> None:
+        """Let another half-open probe through if this one ended without an outcome."""
+
+        with self._lock:
+            state = self._hosts.get(domain_of(url))
+            if state is not None:
+                state.probing = False
+
+    def record_client_error(self, url: str, reason: str) -> None:
+        """Remember a 4xx answer for ``url``; the host itself is healthy."""
+
+        with self._lock:
+            self._hosts.pop(domain_of(url), None)
+            self._negative[url] = (self._clock() + self.negative_ttl, reason)
+            self._negative.move_to_end(url)
+            while len(self._negative) > self.max_negative_entries:
+                self._negative.popitem(last=False)
+
+    def is_open(self, url: str) -> bool:
+        with self._lock:
+            state = self._hosts.get(domain_of(url))
+            return state is not None and state.opened_at is not None
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+            self._negative.clear()
+
+
+DEFAULT_BREAKER = CircuitBreaker()
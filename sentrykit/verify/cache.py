@@ -0,0 +1,138 @@
+"""Evidence document and claim verification caches."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Final, Optional, Tuple
+
+from ..errors import ParseError, SandboxError
+from ..utils.cache import CacheStats, LRUCache
+from .extract import CompiledExtraction
+
+__all__ = [
+    "CachedDocument",
+    "DocumentCache",
+    "EvidenceCache",
+    "VerificationCache",
+    "content_digest",
+]
+
+_DEFAULT_MAX_DOCUMENTS: Final[int] = 256
+_DEFAULT_DOCUMENT_TTL: Final[float] = 300.0
+_DEFAULT_MAX_RESULTS: Final[int] = 65536
+_DEFAULT_RESULT_TTL: Final[float] = 3600.0
+
+# (verified, parse error message) for one document/extraction pair.
+Outcome = Tuple[bool, Optional[str]]
+ResultKey = Tuple[str, CompiledExtraction]
+
+
+def content_digest(text: str) -> str:
+    """Return a stable content hash for a fetched document."""
+
+    return hashlib.blake2b(text.encode("utf-8", errors="surrogatepass"), digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedDocument:
+    url: str
+    text: str
+    digest: str
+
+
+class DocumentCache:
+    """URL to document cache."""
+
+    def __init__(
+        self,
+        maxsize: int = _DEFAULT_MAX_DOCUMENTS,
+        *,
+        ttl: float | None = _DEFAULT_DOCUMENT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._entries: LRUCache[str, CachedDocument] = LRUCache(maxsize, ttl=ttl, clock=clock)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._entries.stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, url: str) -> CachedDocument | None:
+        return self._entries.get(url)
+
+    def peek(self, url: str) -> CachedDocument | None:
+        return self._entries.peek(url)
+
+    def put(self, url: str, text: str) -> CachedDocument:
+        document = CachedDocument(url=url, text=text, digest=content_digest(text))
+        return self._entries.put(url, document)
+
+
+class VerificationCache:
+    """Caches claim outcomes keyed by ``(document digest, compiled extraction)``.
+
+    A digest names the exact content an outcome was computed on, so outcomes
+    never go stale and are only dropped by capacity or their own ``ttl``.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = _DEFAULT_MAX_RESULTS,
+        *,
+        ttl: float | None = _DEFAULT_RESULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._entries: LRUCache[ResultKey, Outcome] = LRUCache(maxsize, ttl=ttl, clock=clock)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._entries.stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def verify(self, document: CachedDocument, plan: CompiledExtraction) -> bool:
+        """Return the cached outcome for ``plan`` on ``document``, computing it on a miss.
+
+        Extraction failures are cached too and re-raised as ``ParseError``, except
+        sandbox timeouts and worker failures, which may not recur and propagate
+        uncached.
+        """
+
+        key = (document.digest, plan)
+        outcome = self._entries.get(key)
+        if outcome is None:
+            try:
+                outcome = (plan.verify(document.text), None)
+            except SandboxError:
+                raise
+            except ParseError as exc:
+                outcome = (False, str(exc))
+            self._entries.put(key, outcome)
+        verified, error = outcome
+        if error is not None:
+            raise ParseError(error)
+        return verified
+
+
+class EvidenceCache:
+    """Document cache and verification cache shared by claim verification."""
+
+    def __init__(
+        self,
+        *,
+        max_documents: int = _DEFAULT_MAX_DOCUMENTS,
+        document_ttl: float | None = _DEFAULT_DOCUMENT_TTL,
+        max_results: int = _DEFAULT_MAX_RESULTS,
+        result_ttl: float | None = _DEFAULT_RESULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.documents = DocumentCache(max_documents, ttl=document_ttl, clock=clock)
+        self.results = VerificationCache(max_results, ttl=result_ttl, clock=clock)
+
+    def stats(self) -> Dict[str, CacheStats]:
+        return {"documents": self.documents.stats, "results": self.results.stats}
@@ -0,0 +1,304 @@
+"""Local evidence corpus with an on-disk trigram index.
+
+A corpus is a directory holding an :class:`~.archive.EvidenceArchive` of document
+bodies, a ``manifest.json`` and immutable index segments. Each :meth:`commit`
+writes the trigrams of newly added documents to a new segment::
+
+    <magic:8><gram count:u32><posting count:u32>
+    <gram hashes:u32 * grams, sorted><posting offsets:u32 * (grams + 1)>
+    <document ids:u32 * postings>
+
+Segments are memory-mapped and binary-searched, so answering "which documents
+contain this snippet" reads only the posting lists of the snippet's trigrams and
+the candidate documents they leave, never the whole corpus. Gram hashes may
+collide, so every candidate is confirmed against the document text. Segments use
+the host byte order and are rejected on a host with a different one.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Callable, Dict, Final, Iterable, List, Set
+
+from ..errors import NetworkError, ParseError
+from .archive import EvidenceArchive
+
+__all__ = ["EvidenceCorpus"]
+
+_MANIFEST: Final[str] = "manifest.json"
+_DOCUMENTS: Final[str] = "documents.skar"
+_SEGMENT_MAGIC: Final[bytes] = b"SKNGR" + sys.byteorder[0].upper().encode() + b"01"
+_SEGMENT_HEADER: Final[struct.Struct] = struct.Struct("=II")
+_GRAM: Final[int] = 3
+_CONFIRM_LIMIT: Final[int] = 32
+
+
+def _grams(text: str) -> Set[int]:
+    windows = {text[index : index + _GRAM] for index in range(len(text) - _GRAM + 1)}
+    return {zlib.crc32(gram.encode("utf-8", "surrogatepass")) for gram in windows}
+
+
+def _write_segment(path: Path, postings: Dict[int, List[int]]) -> None:
+    grams = array("I", sorted(postings))
+    offsets = array("I", [0])
+    ids = array("I")
+    for gram in grams:
+        ids.extend(postings[gram])
+        offsets.append(len(ids))
+    temporary = path.with_suffix(".tmp")
+    with open(temporary, "wb") as handle:
+        handle.write(_SEGMENT_MAGIC + _SEGMENT_HEADER.pack(len(grams), len(ids)))
+        handle.write(grams.tobytes() + offsets.tobytes() + ids.tobytes())
+    os.replace(temporary, path)
+
+
+class _Segment:
+    """A memory-mapped, read-only index segment."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with open(path, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(_SEGMENT_MAGIC)] != _SEGMENT_MAGIC:
+            self._map.close()
+            raise ParseError(f"{path} is not an index segment for this host")
+        count, total = _SEGMENT_HEADER.unpack_from(self._map, len(_SEGMENT_MAGIC))
+        view = memoryview(self._map)
+        start = len(_SEGMENT_MAGIC) + _SEGMENT_HEADER.size
+        self._views = [view]
+        self._grams = self._slice(view, start, count)
+        self._offsets = self._slice(view, start + 4 * count, count + 1)
+        self._ids = self._slice(view, start + 4 * (2 * count + 1), total)
+
+    def _slice(self, view: memoryview, start: int, count: int) -> memoryview:
+        part = view[start : start + 4 * count].cast("I")
+        self._views.append(part)
+        return part
+
+    def _find(self, gram: int) -> int:
+        index = bisect_left(self._grams, gram)
+        if index == len(self._grams) or self._grams[index] != gram:
+            return -1
+        return index
+
+    def count(self, gram: int) -> int:
+        index = self._find(gram)
+        return 0 if index < 0 else self._offsets[index + 1] - self._offsets[index]
+
+    def postings(self, gram: int) -> memoryview:
+        index = self._find(gram)
+        if index < 0:
+            return self._ids[0:0]
+        return self._ids[self._offsets[index] : self._offsets[index + 1]]
+
+    def grams(self) -> Iterable[int]:
+        return iter(self._grams)
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._map.close()
+
+
+class EvidenceCorpus:
+    """An incrementally built local corpus of approved evidence documents.
+
+    :meth:`add` stores a document immediately; its trigrams stay in memory until
+    :meth:`commit` (or closing the corpus) writes them out as a new segment.
+    Documents are searchable as soon as they are added. Re-adding a URL replaces
+    its document. :meth:`compact` merges all segments into one.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._archive = EvidenceArchive(self.directory / _DOCUMENTS)
+        manifest = self._read_manifest()
+        self._documents: List[str] = list(manifest.get("documents", []))
+        self._latest: Dict[str, int] = {url: doc for doc, url in enumerate(self._documents)}
+        self._next_segment = int(manifest.get("next_segment", 0))
+        names = manifest.get("segments", [])
+        self._segments = [_Segment(self.directory / name) for name in names]
+        self._pending: Dict[int, List[int]] = {}
+        # Re-index documents archived after the last commit, e.g. before a crash,
+        # including replacements of documents the manifest already lists.
+        committed = manifest.get("archive_offset")
+        if committed is None:
+            recent = [url for url in self._archive.urls() if url not in self._latest]
+        else:
+            recent = list(self._archive.urls_since(int(committed)))
+        for url in recent:
+            text = self._archive.get(url)
+            if text is not None:
+                self._index(url, text)
+
+    def __enter__(self) -> "EvidenceCorpus":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+    def __contains__(self, url: object) -> bool:
+        return url in self._latest
+
+    def add(self, url: str, text: str) -> None:
+        """Store ``text`` as the document for ``url`` and index it."""
+
+        with self._lock:
+            self._archive.record(url, text)
+            self._index(url, text)
+
+    def add_all(self, documents: Iterable[tuple[str, str]]) -> None:
+        for url, text in documents:
+            self.add(url, text)
+
+    def get(self, url: str) -> str | None:
+        """Return the stored document for ``url``, or ``None``."""
+
+        return self._archive.get(url) if url in self._latest else None
+
+    def search(self, snippet: str, *, limit: int | None = None) -> List[str]:
+        """Return URLs of documents containing ``snippet`` (case-insensitive), oldest first."""
+
+        needle = snippet.lower()
+        found: List[str] = []
+        with self._lock:
+            candidates = self._candidates(needle)
+        for doc in candidates:
+            url = self._documents[doc]
+            text = self._archive.get(url)
+            if text is not None and needle in text.lower():
+                found.append(url)
+                if limit is not None and len(found) >= limit:
+                    break
+        return found
+
+    def contains(self, snippet: str) -> bool:
+        return bool(self.search(snippet, limit=1))
+
+    def fetcher(self) -> Callable[[str], str]:
+        """Return a fetcher that serves corpus documents and never touches the network."""
+
+        def _fetch(url: str) -> str:
+            text = self.get(url)
+            if text is None:
+                raise NetworkError(f"{url} is not in evidence corpus {self.directory}")
+            return text
+
+        return _fetch
+
+    def commit(self) -> None:
+        """Write pending trigrams to a new segment and persist the manifest."""
+
+        with self._lock:
+            if not self._pending:
+                return
+            self._segments.append(self._new_segment(self._pending))
+            self._pending = {}
+            self._write_manifest()
+
+    def compact(self) -> None:
+        """Merge every segment into one, dropping replaced documents."""
+
+        with self._lock:
+            live = set(self._latest.values())
+            merged: Dict[int, Set[int]] = {}
+            for segment in self._segments:
+                for gram in segment.grams():
+                    ids = [doc for doc in segment.postings(gram) if doc in live]
+                    if ids:
+                        merged.setdefault(gram, set()).update(ids)
+            for gram, ids in self._pending.items():
+                merged.setdefault(gram, set()).update(doc for doc in ids if doc in live)
+            old = self._segments
+            postings = {gram: sorted(ids) for gram, ids in merged.items() if ids}
+            self._segments = [self._new_segment(postings)] if postings else []
+            self._pending = {}
+            self._write_manifest()
+            for segment in old:
+                segment.close()
+                segment.path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        self.commit()
+        with self._lock:
+            for segment in self._segments:
+                segment.close()
+            self._segments = []
+            self._archive.close()
+
+    def _index(self, url: str, text: str) -> None:
+        doc = len(self._documents)
+        self._documents.append(url)
+        self._latest[url] = doc
+        for gram in _grams(text.lower()):
+            self._pending.setdefault(gram, []).append(doc)
+
+    def _candidates(self, needle: str) -> List[int]:
+        live = self._latest.values()
+        if len(needle) < _GRAM:
+            return sorted(live)
+        candidates: Set[int] | None = None
+        # Intersect the shortest posting lists first and stop once few candidates
+        # remain; confirming those against their text is cheaper than reading
+        # the long posting lists of common trigrams.
+        for gram in sorted(_grams(needle), key=self._frequency):
+            if candidates is not None and len(candidates) <= _CONFIRM_LIMIT:
+                break
+            ids = self._postings(gram)
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+        latest = self._latest
+        return sorted(doc for doc in candidates or () if latest[self._documents[doc]] == doc)
+
+    def _frequency(self, gram: int) -> int:
+        pending = len(self._pending.get(gram, ()))
+        return pending + sum(segment.count(gram) for segment in self._segments)
+
+    def _postings(self, gram: int) -> Set[int]:
+        ids: Set[int] = set(self._pending.get(gram, ()))
+        for segment in self._segments:
+            ids.update(segment.postings(gram))
+        return ids
+
+    def _new_segment(self, postings: Dict[int, List[int]]) -> _Segment:
+        path = self.directory / f"segment-{self._next_segment:06d}.idx"
+        self._next_segment += 1
+        _write_segment(path, postings)
+        return _Segment(path)
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        path = self.directory / _MANIFEST
+        if not path.exists():
+            return {}
+        try:
+            manifest: Dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        except ValueError as exc:
+            raise ParseError(f"Corrupt corpus manifest {path}: {exc}") from exc
+        return manifest
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "documents": self._documents,
+            "next_segment": self._next_segment,
+            "segments": [segment.path.name for segment in self._segments],
+            "archive_offset": self._archive.end_offset(),
+        }
+        path = self.directory / _MANIFEST
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(temporary, path)
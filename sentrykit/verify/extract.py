@@ -3,106 +3,168 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
 from html.parser import HTMLParser
-from typing import Any, Callable, Dict, List
+from typing import Callable, Dict, Final, Iterable, List, Literal, Optional, Tuple
 
 from ..errors import ParseError
+from ..models import Extraction
+from . import safe_regex
+from .selectors import Frame, Selector, compile_css, compile_xpath
 
-__all__ = ["extract_css", "extract_xpath", "extract_regex"]
+__all__ = [
+    "CompiledExtraction",
+    "compile_extraction",
+    "extract_css",
+    "extract_xpath",
+    "extract_regex",
+    "extract_regex_stream",
+    "contains_stream",
+]
+
+_STREAM_OVERLAP: Final[int] = 4096
+_PLAN_CACHE_SIZE: Final[int] = 4096
+_REGEX_BUDGET: Final[float] = 1.0
+_MAX_DEPTH: Final[int] = 512
+_MAX_TEXT: Final[int] = 16 * 1024 * 1024
+_VOID_ELEMENTS: Final[frozenset[str]] = frozenset(
+    {
+        "area", "base", "br", "col", "embed", "hr", "img", "input",
+        "link", "meta", "param", "source", "track", "wbr",
+    }
+)
+
+Span = Tuple[int, int]
+Locator = Callable[[str], Optional[Span]]
+RegexGuard = Literal["reject", "sandbox", "off"]
 
 
 class _Collector(HTMLParser):
-    def __init__(self, matcher: Callable[[str, Dict[str, str]], bool]) -> None:
+    """Collect the text of elements matching a compiled selector in a single pass.
+
+    Each open element carries its selector :class:`~.selectors.Frame`, so memory
+    is proportional to nesting depth. Stripped text inside matching elements is
+    appended once to a shared buffer; a matching element remembers the buffer
+    offset where its text starts and records a ``(start, end)`` span when it
+    closes, so nesting depth never causes text to be copied more than once.
+    """
+
+    def __init__(self, selector: Selector, *, max_depth: int, max_text: int) -> None:
         super().__init__(convert_charrefs=True)
-        self._matcher = matcher
-        self._stack: List[Dict[str, Any]] = []
-        self.matches: List[str] = []
+        self._selector = selector
+        self._max_depth = max_depth
+        self._max_text = max_text
+        self._root = selector.root()
+        self._parts: List[str] = []
+        self._length = 0
+        self._stack: List[Tuple[str, Frame, bool, int]] = []
+        self._open: Counter[str] = Counter()
+        self._capturing = 0
+        self._pending: List[str] = []
+        self._pending_length = 0
+        self._spans: List[Span] = []
+
+    @property
+    def matches(self) -> List[str]:
+        buffer = "".join(self._parts)
+        texts = (buffer[start:end] for start, end in self._spans)
+        return [text for text in texts if self._selector.accepts_text(text)]
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        attr_map = {name: (value or "") for name, value in attrs}
-        node = {"tag": tag, "attrs": attr_map, "text": [], "match": self._matcher(tag, attr_map)}
-        self._stack.append(node)
+        if tag in _VOID_ELEMENTS:
+            self.handle_startendtag(tag, attrs)
+            return
+        self._flush()
+        if len(self._stack) >= self._max_depth:
+            raise ParseError(f"Document nesting exceeds {self._max_depth} levels")
+        frame = self._selector.enter(self._parent(), tag, _attr_map(attrs))
+        matched = self._selector.matches(frame)
+        self._stack.append((tag, frame, matched, self._length))
+        self._open[tag] += 1
+        self._capturing += matched
 
     def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        self.handle_starttag(tag, attrs)
-        self.handle_endtag(tag)
+        # Empty elements hold no text and can never produce a match, but they
+        # still count towards the positions of their matching siblings.
+        self._flush()
+        self._selector.enter(self._parent(), tag, _attr_map(attrs))
 
     def handle_data(self, data: str) -> None:
-        if self._stack:
-            self._stack[-1]["text"].append(data)
+        # A text node may arrive in several calls when the document is fed in
+        # chunks, so pieces are only stripped once the next tag ends the node.
+        if not self._capturing:
+            return
+        self._pending.append(data)
+        self._pending_length += len(data)
+        if self._length + self._pending_length > self._max_text:
+            raise ParseError(f"Matched text exceeds {self._max_text} characters")
 
     def handle_endtag(self, tag: str) -> None:
-        if not self._stack:
+        self._flush()
+        if not self._open[tag]:
             return
-        node = self._stack.pop()
-        text = " ".join(part.strip() for part in node["text"] if part.strip())
-        if node["match"] and text:
-            self.matches.append(text.strip())
-        if self._stack and text:
-            self._stack[-1]["text"].append(text)
-
-
-def _normalize(selector: str) -> str:
-    return selector.strip()
-
-
-def _css_matcher(selector: str) -> Callable[[str, Dict[str, str]], bool]:
-    tokens = re.findall(r"([#.])?([a-zA-Z0-9_-]+)", _normalize(selector))
-    tag: str | None = None
-    classes: set[str] = set()
-    element_id: str | None = None
-    for prefix, value in tokens:
-        if not prefix and not tag:
-            tag = value.lower()
-        elif prefix == ".":
-            classes.add(value.lower())
-        elif prefix == "#":
-            element_id = value.lower()
-        elif not prefix and tag:
-            classes.add(value.lower())
-    if not tokens and selector:
-        tag = selector.lower()
-
-    def matcher(tag_name: str, attrs: Dict[str, str]) -> bool:
-        if tag and tag_name.lower() != tag:
-            return False
-        if element_id and attrs.get("id", "").lower() != element_id:
-            return False
-        if classes:
-            attr_classes = {part.lower() for part in attrs.get("class", "").split()}
-            if not classes.issubset(attr_classes):
-                return False
-        return True
+        while self._stack:
+            name = self._pop()
+            if name == tag:
+                return
 
-    return matcher
+    def close(self) -> None:
+        super().close()
+        self._flush()
+        while self._stack:
+            self._pop()
 
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        piece = "".join(self._pending).strip()
+        self._pending.clear()
+        self._pending_length = 0
+        if not piece:
+            return
+        if self._length:
+            self._parts.append(" ")
+            self._length += 1
+        self._parts.append(piece)
+        self._length += len(piece)
+        if self._length > self._max_text:
+            raise ParseError(f"Matched text exceeds {self._max_text} characters")
 
-def _xpath_matcher(expression: str) -> Callable[[str, Dict[str, str]], bool]:
-    xp = _normalize(expression)
-    match = re.fullmatch(r"//([a-zA-Z0-9_-]+)(?:\[@([a-zA-Z0-9_-]+)='([^']*)'\])?", xp)
-    if not match:
-        raise ParseError(f"Unsupported XPath expression: {expression}")
-    tag = match.group(1).lower()
-    attr_name = match.group(2)
-    attr_value = match.group(3)
+    def _parent(self) -> Frame:
+        return self._stack[-1][1] if self._stack else self._root
+
+    def _pop(self) -> str:
+        name, _, matched, start = self._stack.pop()
+        self._open[name] -= 1
+        self._capturing -= matched
+        if matched and self._length > start:
+            # The element's first piece sits after the separator written at ``start``.
+            self._spans.append((start + 1 if start else 0, self._length))
+        return name
 
-    def matcher(tag_name: str, attrs: Dict[str, str]) -> bool:
-        if tag_name.lower() != tag:
-            return False
-        if attr_name:
-            return attrs.get(attr_name, "") == (attr_value or "")
-        return True
 
-    return matcher
+def _attr_map(attrs: list[tuple[str, str | None]]) -> Dict[str, str]:
+    return {name: (value or "") for name, value in attrs}
 
 
-def _collect(document: str, matcher: Callable[[str, Dict[str, str]], bool], must_include: str | None) -> str:
-    parser = _Collector(matcher)
-    parser.feed(document)
+def _collect(
+    chunks: Iterable[str],
+    selector: Selector,
+    must_include: str | None,
+    *,
+    max_depth: int = _MAX_DEPTH,
+    max_text: int = _MAX_TEXT,
+) -> str:
+    parser = _Collector(selector, max_depth=max_depth, max_text=max_text)
+    for chunk in chunks:
+        parser.feed(chunk)
     parser.close()
-    if not parser.matches:
+    matches = parser.matches
+    if not matches:
         raise ParseError("No elements matched selector")
-    text = " ".join(parser.matches).strip()
+    text = " ".join(matches).strip()
     if not text:
         raise ParseError("Matched elements contained no text")
     if must_include and must_include.lower() not in text.lower():
@@ -110,26 +172,222 @@ def _collect(document: str, matcher: Callable[[str, Dict[str, str]], bool], must
     return text
 
 
-def extract_css(html: str, selector: str, must_include: str | None = None) -> str:
-    """Extract text content from HTML using a limited CSS selector."""
+def extract_css(
+    html: str,
+    selector: str,
+    must_include: str | None = None,
+    *,
+    max_depth: int = _MAX_DEPTH,
+    max_text: int = _MAX_TEXT,
+) -> str:
+    """Extract text content from HTML matching a CSS selector (see :mod:`.selectors`)."""
 
-    return _collect(html, _css_matcher(selector), must_include)
+    return _collect(
+        (html,), compile_css(selector), must_include, max_depth=max_depth, max_text=max_text
+    )
 
 
-def extract_xpath(html: str, xp: str, must_include: str | None = None) -> str:
-    """Extract text content from HTML using a limited XPath expression."""
+def extract_xpath(
+    html: str,
+    xp: str,
+    must_include: str | None = None,
+    *,
+    max_depth: int = _MAX_DEPTH,
+    max_text: int = _MAX_TEXT,
+) -> str:
+    """Extract text content from HTML matching an XPath expression (see :mod:`.selectors`)."""
 
-    return _collect(html, _xpath_matcher(xp), must_include)
+    return _collect(
+        (html,), compile_xpath(xp), must_include, max_depth=max_depth, max_text=max_text
+    )
 
 
-def extract_regex(text: str, pattern: str, flags: int = re.IGNORECASE) -> str:
-    """Extract a substring using a compiled regular expression."""
-
+@lru_cache(maxsize=_PLAN_CACHE_SIZE)
+def _compile_regex(pattern: str, flags: int) -> re.Pattern[str]:
     try:
-        compiled = re.compile(pattern, flags)
+        return re.compile(pattern, flags)
     except re.error as exc:  # pragma: no cover - invalid pattern handled defensively
         raise ParseError(f"Invalid regular expression '{pattern}': {exc}") from exc
-    match = compiled.search(text)
-    if not match:
+
+
+def _normalize_text(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _local_locator(compiled: re.Pattern[str]) -> Locator:
+    def locate(text: str) -> Span | None:
+        match = compiled.search(text)
+        return match.span() if match else None
+
+    return locate
+
+
+def _sandboxed_locator(pattern: str, budget: float) -> Locator:
+    sandbox = safe_regex.default_sandbox()
+
+    def locate(text: str) -> Span | None:
+        return sandbox.search(pattern, text, budget=budget)
+
+    return locate
+
+
+def _search(locate: Locator, text: str, pattern: str) -> str:
+    span = locate(text)
+    if span is None:
         raise ParseError(f"Regex '{pattern}' not found in corpus")
-    return re.sub(r"\s+", " ", match.group(0)).strip()
+    return _normalize_text(text[span[0] : span[1]])
+
+
+def _search_stream(locate: Locator, chunks: Iterable[str], overlap: int, pattern: str) -> str:
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        span = locate(buffer)
+        if span and (span[1] < len(buffer) or span[1] - span[0] >= overlap):
+            return _normalize_text(buffer[span[0] : span[1]])
+        start = len(buffer) - overlap
+        if span:
+            start = min(start, span[0])
+        buffer = buffer[max(start, 0) :]
+    return _search(locate, buffer, pattern)
+
+
+def extract_regex(text: str, pattern: str, flags: int = re.IGNORECASE) -> str:
+    """Extract a substring using a compiled regular expression."""
+
+    return _search(_local_locator(_compile_regex(pattern, flags)), text, pattern)
+
+
+def extract_regex_stream(
+    chunks: Iterable[str],
+    pattern: str,
+    flags: int = re.IGNORECASE,
+    *,
+    overlap: int = _STREAM_OVERLAP,
+) -> str:
+    """Search text chunks incrementally and return as soon as a match is settled.
+
+    The last ``overlap`` characters of each window are carried into the next one,
+    so matches spanning a chunk boundary are found as long as they fit in the
+    overlap. A match that touches the end of the window is held back until more
+    text arrives, unless it is already longer than the overlap.
+    """
+
+    return _search_stream(_local_locator(_compile_regex(pattern, flags)), chunks, overlap, pattern)
+
+
+def contains_stream(chunks: Iterable[str], probe: str) -> bool:
+    """Return whether ``probe`` occurs (case-insensitively) anywhere in the chunks.
+
+    Stops consuming ``chunks`` at the first hit.
+    """
+
+    needle = probe.lower()
+    if not needle:
+        return True
+    keep = len(needle) - 1
+    tail = ""
+    for chunk in chunks:
+        window = tail + chunk.lower()
+        if needle in window:
+            return True
+        tail = window[-keep:] if keep else ""
+    return False
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledExtraction:
+    """A claim extraction with its selector or pattern compiled once.
+
+    Instances hash and compare on ``(kind, pattern, must_include)`` and, for regex
+    plans, the guard and time budget the pattern runs under, so they can key
+    caches; the compiled selector is carried along but ignored for equality.
+    """
+
+    kind: str
+    pattern: str
+    must_include: str | None
+    guard: RegexGuard | None = None
+    budget: float | None = None
+    selector: Selector | None = field(default=None, compare=False, repr=False)
+    locate: Locator | None = field(default=None, compare=False, repr=False)
+
+    @property
+    def probe(self) -> str:
+        return (self.must_include or self.pattern).lower()
+
+    def verify(self, document: str) -> bool:
+        """Return whether ``document`` supports the claim.
+
+        Raises ``ParseError`` when the extraction fails.
+        """
+
+        if self.locate is not None:
+            return self._check_regex(_search(self.locate, document, self.pattern))
+        if self.selector is not None:
+            text = _collect((document,), self.selector, self.must_include)
+            return self.probe in text.lower()
+        return self.probe in document.lower()
+
+    def verify_stream(self, chunks: Iterable[str], *, overlap: int = _STREAM_OVERLAP) -> bool:
+        """Like :meth:`verify`, consuming ``chunks`` only until the outcome is known."""
+
+        if self.locate is not None:
+            return self._check_regex(_search_stream(self.locate, chunks, overlap, self.pattern))
+        if self.selector is not None:
+            text = _collect(chunks, self.selector, self.must_include)
+            return self.probe in text.lower()
+        return contains_stream(chunks, self.probe)
+
+    def _check_regex(self, text: str) -> bool:
+        if self.must_include and self.must_include.lower() not in text.lower():
+            raise ParseError("Regex extraction missing required snippet")
+        return True
+
+
+def _regex_locator(pattern: str, guard: RegexGuard, budget: float) -> Locator:
+    if guard == "sandbox":
+        _compile_regex(pattern, re.IGNORECASE)
+        return _sandboxed_locator(pattern, budget)
+    if guard == "reject":
+        safe_regex.check_pattern(pattern, re.IGNORECASE)
+    elif guard != "off":
+        raise ParseError(f"Unsupported regex guard: {guard}")
+    return _local_locator(_compile_regex(pattern, re.IGNORECASE))
+
+
+@lru_cache(maxsize=_PLAN_CACHE_SIZE)
+def _compile_plan(
+    kind: str, pattern: str, must_include: str | None, guard: RegexGuard, budget: float
+) -> CompiledExtraction:
+    if kind == "css":
+        return CompiledExtraction(kind, pattern, must_include, selector=compile_css(pattern))
+    if kind == "xpath":
+        return CompiledExtraction(kind, pattern, must_include, selector=compile_xpath(pattern))
+    if kind == "regex":
+        locate = _regex_locator(pattern, guard, budget)
+        return CompiledExtraction(
+            kind, pattern, must_include, guard=guard, budget=budget, locate=locate
+        )
+    if kind == "contains":
+        return CompiledExtraction(kind, pattern, must_include)
+    raise ParseError(f"Unsupported extraction kind: {kind}")
+
+
+def compile_extraction(
+    extraction: Extraction,
+    *,
+    regex_guard: RegexGuard = "reject",
+    regex_budget: float = _REGEX_BUDGET,
+) -> CompiledExtraction:
+    """Compile a claim extraction, reusing the plan from a bounded process-wide cache.
+
+    ``regex_guard`` controls how claim-supplied regular expressions run:
+    ``"reject"`` refuses patterns prone to catastrophic backtracking, ``"sandbox"``
+    runs any pattern in a worker process killed after ``regex_budget`` seconds,
+    and ``"off"`` runs patterns unguarded. Violations raise ``ParseError``.
+    """
+
+    return _compile_plan(
+        extraction.kind, extraction.pattern, extraction.must_include, regex_guard, regex_budget
+    )
@@ -0,0 +1,139 @@
+"""Background evidence prefetching that warms an :class:`EvidenceCache`."""
+
+from __future__ import annotations
+
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Final, Iterable, Iterator, List, Tuple
+
+from ..utils.logging import get_logger
+from ..utils.urls import domain_of
+from .cache import EvidenceCache
+from .web import FetchLimits, fetch_text
+
+__all__ = ["EvidencePrefetcher", "find_urls"]
+
+_LOGGER = get_logger(__name__)
+
+_URL_PATTERN = re.compile(r"https?://[^\s\"'<>()\[\]{}]+", re.I)
+_DEFAULT_WORKERS: Final[int] = 4
+_DEFAULT_MAX_PENDING: Final[int] = 32
+_DEFAULT_PREFETCH_BYTES: Final[int] = 2 * 1024 * 1024
+
+
+def find_urls(value: Any) -> Iterator[str]:
+    """Yield http(s) URLs found in strings nested anywhere inside ``value``."""
+
+    if isinstance(value, str):
+        for match in _URL_PATTERN.finditer(value):
+            yield match.group(0).rstrip(".,;:")
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from find_urls(item)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            yield from find_urls(item)
+
+
+class EvidencePrefetcher:
+    """Fetch evidence URLs in the background as soon as an adapter observes them.
+
+    At most ``max_workers`` downloads run at once and at most ``max_pending``
+    URLs are queued; further submissions are dropped rather than buffered. Each
+    download is bounded by ``limits``. Only hosts listed in ``allowed_domains``
+    are fetched, so a prefetcher without an allow-list never makes a request:
+    URLs come from tool output and retrieved documents, which the agent does not
+    control.
+    """
+
+    def __init__(
+        self,
+        cache: EvidenceCache,
+        *,
+        fetcher: Callable[[str], str] | None = None,
+        max_workers: int = _DEFAULT_WORKERS,
+        max_pending: int = _DEFAULT_MAX_PENDING,
+        limits: FetchLimits | None = None,
+        allowed_domains: Iterable[str] = (),
+    ) -> None:
+        self.cache = cache
+        self.limits = limits or FetchLimits(max_bytes=_DEFAULT_PREFETCH_BYTES)
+        self.max_pending = max_pending
+        self.allowed_domains = {domain.lower() for domain in allowed_domains}
+        self._fetch = fetcher or (lambda url: fetch_text(url, limits=self.limits))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="sentrykit-prefetch"
+        )
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future[None]] = {}
+        self.dropped = 0
+
+    def submit(self, url: str) -> bool:
+        """Queue ``url`` for prefetch; return whether it was accepted."""
+
+        return self._submit(url)[1]
+
+    def submit_all(self, value: Any) -> int:
+        """Submit every URL found inside ``value``; return how many were accepted."""
+
+        return sum(self.submit(url) for url in dict.fromkeys(find_urls(value)))
+
+    def track(self, value: Any) -> List[Future[None]]:
+        """Submit every URL inside ``value`` and return the prefetches to wait on.
+
+        URLs already being fetched, for this caller or another, are included so
+        a caller can wait for exactly the evidence it saw.
+        """
+
+        futures: List[Future[None]] = []
+        for url in dict.fromkeys(find_urls(value)):
+            future = self._submit(url)[0]
+            if future is not None:
+                futures.append(future)
+        return futures
+
+    def wait(
+        self, timeout: float | None = None, futures: Iterable[Future[None]] | None = None
+    ) -> None:
+        """Block until ``futures`` finish or ``timeout`` elapses.
+
+        Without ``futures``, waits for every in-flight prefetch.
+        """
+
+        if futures is None:
+            with self._lock:
+                futures = list(self._inflight.values())
+        pending = [future for future in futures if not future.done()]
+        if pending:
+            wait(pending, timeout=timeout)
+
+    def _submit(self, url: str) -> Tuple[Future[None] | None, bool]:
+        if domain_of(url) not in self.allowed_domains:
+            return None, False
+        if self.cache.documents.peek(url) is not None:
+            return None, False
+        with self._lock:
+            inflight = self._inflight.get(url)
+            if inflight is not None:
+                return inflight, False
+            if len(self._inflight) >= self.max_pending:
+                self.dropped += 1
+                return None, False
+            future = self._executor.submit(self._prefetch, url)
+            self._inflight[url] = future
+        future.add_done_callback(lambda _: self._done(url))
+        return future, True
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _prefetch(self, url: str) -> None:
+        try:
+            self.cache.documents.put(url, self._fetch(url))
+        except Exception as exc:  # pragma: no cover - prefetch is best effort
+            _LOGGER.debug("evidence_prefetch_failed", extra={"_sk_url": url, "_sk_error": str(exc)})
+
+    def _done(self, url: str) -> None:
+        with self._lock:
+            self._inflight.pop(url, None)
@@ -0,0 +1,336 @@
+"""Guards for running claim-supplied regular expressions.
+
+Claim patterns come from LLM output, so a single catastrophic pattern could pin
+a worker for minutes inside Python's backtracking engine. Two guards exist:
+
+* :func:`check_pattern` statically rejects the constructs behind exponential
+  backtracking: backreferences, nested unbounded quantifiers, unbounded
+  quantifiers over alternations whose branches can start with the same
+  character, and unbounded quantifiers inside lookarounds. A repeated group
+  that starts or ends with a literal none of its unbounded quantifiers can
+  match, such as ``(\\d+,)*``, splits the text one way only and is allowed.
+* :class:`RegexSandbox` runs searches in a separate worker process and kills it
+  when a search exceeds its time budget. This also bounds the polynomial
+  blowups (``a.*b`` over a long line of ``a``) that no static check can rule out.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import re
+import threading
+from typing import Any, Callable, Dict, Final, Tuple
+
+from ..errors import ParseError, SandboxError
+
+# The static check walks CPython's private regex parse tree, whose layout is the
+# one shipped since 3.11, the oldest Python this package supports.
+try:
+    import re._constants as _sre
+    import re._parser as _sre_parse
+except ImportError as exc:  # pragma: no cover - depends on the interpreter
+    raise ImportError("sentrykit's regex guard needs CPython 3.11 or newer") from exc
+
+__all__ = ["RegexSandbox", "check_pattern", "default_sandbox"]
+
+_MAX_PATTERN_LENGTH: Final[int] = 1024
+# Repeats with a larger upper bound are treated as unbounded when nested.
+_LARGE_REPEAT: Final[int] = 32
+_DEFAULT_BUDGET: Final[float] = 1.0
+# Spawning a worker imports a fresh interpreter; this bounds it separately from
+# the search budget.
+_STARTUP_TIMEOUT: Final[float] = 30.0
+_READY: Final[str] = "ready"
+_REPEATS = (_sre.MAX_REPEAT, _sre.MIN_REPEAT)
+_LOOKAROUNDS = (_sre.ASSERT, _sre.ASSERT_NOT)
+_BACKREFERENCES = (_sre.GROUPREF, _sre.GROUPREF_EXISTS)
+
+_CATEGORIES: Dict[Any, Callable[[str], bool]] = {
+    _sre.CATEGORY_DIGIT: str.isdecimal,
+    _sre.CATEGORY_NOT_DIGIT: lambda char: not char.isdecimal(),
+    _sre.CATEGORY_SPACE: str.isspace,
+    _sre.CATEGORY_NOT_SPACE: lambda char: not char.isspace(),
+    _sre.CATEGORY_WORD: lambda char: char.isalnum() or char == "_",
+    _sre.CATEGORY_NOT_WORD: lambda char: not (char.isalnum() or char == "_"),
+}
+
+Span = Tuple[int, int]
+
+
+def _is_unbounded(maximum: int) -> bool:
+    return maximum > _LARGE_REPEAT
+
+
+def _contains_unbounded(items: Any) -> bool:
+    for op, av in items:
+        if op in _REPEATS or op is _sre.POSSESSIVE_REPEAT:
+            if _is_unbounded(av[1]) or _contains_unbounded(av[2]):
+                return True
+        elif op is _sre.SUBPATTERN and _contains_unbounded(av[3]):
+            return True
+        elif op is _sre.BRANCH and any(_contains_unbounded(alt) for alt in av[1]):
+            return True
+        elif op in _LOOKAROUNDS and _contains_unbounded(av[1]):
+            return True
+        elif op is _sre.ATOMIC_GROUP and _contains_unbounded(av):
+            return True
+    return False
+
+
+def _first_literal(items: Any, ignore_case: bool) -> int | None:
+    for op, av in items:
+        if op is _sre.SUBPATTERN:
+            return _first_literal(av[3], ignore_case)
+        if op is _sre.LITERAL:
+            return ord(chr(av).lower()) if ignore_case else av
+        return None
+    return None
+
+
+def _in_set(items: Any, char: str) -> bool:
+    negate = False
+    for op, av in items:
+        if op is _sre.NEGATE:
+            negate = True
+        elif op is _sre.LITERAL:
+            if chr(av) == char:
+                return not negate
+        elif op is _sre.RANGE:
+            if av[0] <= ord(char) <= av[1]:
+                return not negate
+        elif op is _sre.CATEGORY:
+            predicate = _CATEGORIES.get(av)
+            if predicate is None or predicate(char):
+                return not negate
+        else:
+            return True
+    return negate
+
+
+def _can_match(items: Any, char: str, ignore_case: bool) -> bool:
+    """Whether any part of ``items`` might consume ``char``; unknown constructs say yes."""
+
+    variants = {char, char.lower(), char.upper()} if ignore_case else {char}
+    for op, av in items:
+        if op in (_sre.AT, *_LOOKAROUNDS):
+            continue
+        if op is _sre.LITERAL:
+            if chr(av) in variants:
+                return True
+        elif op is _sre.NOT_LITERAL:
+            if variants != {chr(av)}:
+                return True
+        elif op is _sre.IN:
+            if any(_in_set(av, variant) for variant in variants):
+                return True
+        elif op in _REPEATS or op is _sre.POSSESSIVE_REPEAT:
+            if _can_match(av[2], char, ignore_case):
+                return True
+        elif op is _sre.SUBPATTERN:
+            if _can_match(av[3], char, ignore_case):
+                return True
+        elif op is _sre.BRANCH:
+            if any(_can_match(alternative, char, ignore_case) for alternative in av[1]):
+                return True
+        else:
+            return True
+    return False
+
+
+def _unbounded_bodies(items: Any) -> list[Any]:
+    bodies = []
+    for op, av in items:
+        if op in _REPEATS or op is _sre.POSSESSIVE_REPEAT:
+            if _is_unbounded(av[1]):
+                bodies.append(av[2])
+            bodies.extend(_unbounded_bodies(av[2]))
+        elif op is _sre.SUBPATTERN:
+            bodies.extend(_unbounded_bodies(av[3]))
+        elif op is _sre.BRANCH:
+            for alternative in av[1]:
+                bodies.extend(_unbounded_bodies(alternative))
+    return bodies
+
+
+def _is_delimited(body: Any, ignore_case: bool) -> bool:
+    """Whether ``body`` starts or ends with a literal its unbounded quantifiers cannot match.
+
+    Each repetition then has to consume that literal, so the text splits into
+    repetitions in only one way, e.g. ``(\\d+,)*`` or ``(?: [A-Z][a-z]+)*``.
+    """
+
+    items = list(body)
+    while len(items) == 1 and items[0][0] is _sre.SUBPATTERN:
+        items = list(items[0][1][3])
+    inner = _unbounded_bodies(items)
+    for op, av in (items[:1] + items[-1:]):
+        if op is _sre.LITERAL and not any(
+            _can_match(part, chr(av), ignore_case) for part in inner
+        ):
+            return True
+    return False
+
+
+def _has_ambiguous_branch(items: Any, ignore_case: bool) -> bool:
+    for op, av in items:
+        if op is _sre.BRANCH:
+            firsts = [_first_literal(alt, ignore_case) for alt in av[1]]
+            if None in firsts or len(set(firsts)) != len(firsts):
+                return True
+            if any(_has_ambiguous_branch(alt, ignore_case) for alt in av[1]):
+                return True
+        elif op is _sre.SUBPATTERN and _has_ambiguous_branch(av[3], ignore_case):
+            return True
+    return False
+
+
+def _walk(items: Any, pattern: str, ignore_case: bool, in_repeat: bool) -> None:
+    for op, av in items:
+        if op in _BACKREFERENCES:
+            raise ParseError(
+                f"Unsafe regular expression '{pattern}': backreferences are not allowed"
+            )
+        if op in _REPEATS:
+            _, maximum, body = av
+            unbounded = _is_unbounded(maximum)
+            if unbounded and in_repeat:
+                raise ParseError(
+                    f"Unsafe regular expression '{pattern}': nested unbounded quantifiers"
+                )
+            if unbounded and _has_ambiguous_branch(body, ignore_case):
+                raise ParseError(
+                    f"Unsafe regular expression '{pattern}': "
+                    "quantified alternation with overlapping branches"
+                )
+            # Any repeat that can run its body more than once multiplies the
+            # backtracking of unbounded quantifiers inside it, e.g. ``(.*a){20}``,
+            # unless a delimiter fixes where each repetition ends.
+            repeated = maximum > 1 and not _is_delimited(body, ignore_case)
+            _walk(body, pattern, ignore_case, in_repeat or repeated)
+        elif op is _sre.POSSESSIVE_REPEAT:
+            _walk(av[2], pattern, ignore_case, in_repeat)
+        elif op is _sre.SUBPATTERN:
+            _walk(av[3], pattern, ignore_case, in_repeat)
+        elif op is _sre.ATOMIC_GROUP:
+            _walk(av, pattern, ignore_case, in_repeat)
+        elif op is _sre.BRANCH:
+            for alternative in av[1]:
+                _walk(alternative, pattern, ignore_case, in_repeat)
+        elif op in _LOOKAROUNDS:
+            if _contains_unbounded(av[1]):
+                raise ParseError(
+                    f"Unsafe regular expression '{pattern}': unbounded quantifier in lookaround"
+                )
+            _walk(av[1], pattern, ignore_case, in_repeat)
+
+
+def check_pattern(pattern: str, flags: int = re.IGNORECASE) -> None:
+    """Raise ``ParseError`` unless ``pattern`` avoids exponential-backtracking constructs."""
+
+    if len(pattern) > _MAX_PATTERN_LENGTH:
+        raise ParseError(f"Regular expression longer than {_MAX_PATTERN_LENGTH} characters")
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except re.error as exc:
+        raise ParseError(f"Invalid regular expression '{pattern}': {exc}") from exc
+    _walk(parsed, pattern, bool(parsed.state.flags & re.IGNORECASE), False)
+
+
+def _serve(conn: Any) -> None:
+    compiled: dict[tuple[str, int], re.Pattern[str]] = {}
+    conn.send((_READY, None))
+    while True:
+        try:
+            pattern, flags, text = conn.recv()
+        except EOFError:
+            return
+        try:
+            regex = compiled.get((pattern, flags))
+            if regex is None:
+                if len(compiled) >= 256:
+                    compiled.clear()
+                regex = compiled[(pattern, flags)] = re.compile(pattern, flags)
+            match = regex.search(text)
+            conn.send(("ok", match.span() if match else None))
+        except re.error as exc:
+            conn.send(("error", f"Invalid regular expression '{pattern}': {exc}"))
+
+
+class RegexSandbox:
+    """Run regex searches in a worker process that is killed when over budget.
+
+    Calls are serialized; the worker is started lazily and restarted after a
+    timeout kills it. The budget only starts once the worker has reported that
+    it is ready, so interpreter startup never counts against a search. Timeouts
+    and worker failures raise :class:`~sentrykit.errors.SandboxError`.
+    """
+
+    def __init__(self, budget: float = _DEFAULT_BUDGET) -> None:
+        self.budget = budget
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._process: Any = None
+        self._conn: Any = None
+
+    def search(
+        self, pattern: str, text: str, flags: int = re.IGNORECASE, *, budget: float | None = None
+    ) -> Span | None:
+        """Return the span of the first match, or ``None``; raise ``ParseError`` on timeout."""
+
+        limit = self.budget if budget is None else budget
+        with self._lock:
+            conn = self._ensure_worker()
+            try:
+                conn.send((pattern, flags, text))
+                if not conn.poll(limit):
+                    self._stop_worker()
+                    raise SandboxError(f"Regex '{pattern}' exceeded {limit:.2f}s time budget")
+                status, payload = conn.recv()
+            except (EOFError, OSError) as exc:
+                self._stop_worker()
+                raise SandboxError(f"Regex sandbox worker failed: {exc}") from exc
+        if status == "error":
+            raise ParseError(payload)
+        return None if payload is None else (payload[0], payload[1])
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop_worker()
+
+    def _ensure_worker(self) -> Any:
+        if self._process is None or not self._process.is_alive():
+            parent, child = self._context.Pipe()
+            process = self._context.Process(target=_serve, args=(child,), daemon=True)
+            process.start()
+            child.close()
+            self._process, self._conn = process, parent
+            try:
+                ready = parent.poll(_STARTUP_TIMEOUT) and parent.recv()[0] == _READY
+            except (EOFError, OSError):
+                ready = False
+            if not ready:
+                self._stop_worker()
+                raise SandboxError("Regex sandbox worker failed to start")
+        return self._conn
+
+    def _stop_worker(self) -> None:
+        if self._process is not None:
+            self._process.kill()
+            self._process.join()
+            self._conn.close()
+        self._process = None
+        self._conn = None
+
+
+_SANDBOX_LOCK = threading.Lock()
+_SANDBOX: RegexSandbox | None = None
+
+
+def default_sandbox() -> RegexSandbox:
+    """Return the process-wide sandbox shared by compiled extractions."""
+
+    global _SANDBOX
+    with _SANDBOX_LOCK:
+        if _SANDBOX is None:
+            _SANDBOX = RegexSandbox()
+        return _SANDBOX
@@ -0,0 +1,265 @@
+"""Compiled CSS and XPath selectors evaluated during a streaming HTML parse.
+
+A selector compiles into a sequence of :class:`Step` objects, one per compound
+selector or location step. The parser keeps one :class:`Frame` per open element
+holding two bitmasks: ``active`` marks the steps the element itself satisfies and
+``inherited`` the steps satisfied by the element or any ancestor. Bit ``0``
+stands for the document root, so step ``k`` accepts an element when bit ``k`` is
+set in its parent's ``active`` mask (child axis) or ``inherited`` mask
+(descendant axis). No tree is built; memory is proportional to nesting depth.
+
+Supported CSS: type and universal selectors, ``.class``, ``#id``, attribute
+presence ``[a]`` and the ``=``, ``~=``, ``^=``, ``$=`` and ``*=`` operators,
+joined by descendant (whitespace) and child (``>``) combinators.
+
+Supported XPath: ``/`` and ``//`` steps with a name test or ``*`` and any number
+of predicates: ``[@a]``, ``[@a='v']``, ``[contains(@a, 'v')]``,
+``[starts-with(@a, 'v')]``, positions such as ``[2]``, and on the final step
+``[contains(., 'v')]`` or ``[contains(text(), 'v')]``, which test the element's
+collected text.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Final, List, Literal, Optional, Tuple
+
+from ..errors import ParseError
+
+__all__ = ["Frame", "Predicate", "Selector", "Step", "compile_css", "compile_xpath"]
+
+_SELECTOR_CACHE_SIZE: Final[int] = 4096
+
+Operator = Literal["exists", "=", "~=", "^=", "$=", "*=", "position"]
+
+_CSS_TOKEN = re.compile(
+    r"""
+    (?P<child>\s*>\s*)
+    | (?P<space>\s+)
+    | (?P<tag>\*|[a-zA-Z][\w-]*)
+    | \.(?P<cls>[\w-]+)
+    | \#(?P<id>[\w-]+)
+    | \[\s*(?P<attr>[\w:-]+)\s*
+      (?:(?P<op>[~^$*]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[\w-]+))\s*)?\]
+    """,
+    re.VERBOSE,
+)
+_XPATH_STEP = re.compile(r"(?P<axis>//?)(?P<tag>\*|[a-zA-Z][\w-]*)")
+_XPATH_PREDICATE = re.compile(
+    r"""
+    \[\s*(?:
+        (?P<position>\d+)
+      | @(?P<attr>[\w:-]+)\s*(?:=\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'))?
+      | (?P<func>contains|starts-with)\(\s*(?:@(?P<fattr>[\w:-]+)|(?P<text>\.|text\(\)))\s*,
+        \s*(?:"(?P<fdq>[^"]*)"|'(?P<fsq>[^']*)')\s*\)
+    )\s*\]
+    """,
+    re.VERBOSE,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Predicate:
+    """A test on one attribute, or a 1-based position among matching siblings."""
+
+    op: Operator
+    name: str = ""
+    value: str = ""
+    fold: bool = False
+
+    def test(self, attrs: Dict[str, str]) -> bool:
+        actual = attrs.get(self.name)
+        if actual is None:
+            return False
+        if self.op == "exists":
+            return True
+        value = self.value
+        if self.fold:
+            actual, value = actual.lower(), value.lower()
+        if self.op == "=":
+            return actual == value
+        if self.op == "~=":
+            return value in actual.split()
+        if self.op == "^=":
+            return bool(value) and actual.startswith(value)
+        if self.op == "$=":
+            return bool(value) and actual.endswith(value)
+        return bool(value) and value in actual
+
+
+@dataclass(frozen=True, slots=True)
+class Step:
+    """One compound selector or location step and the axis linking it to the previous one."""
+
+    child: bool
+    tag: str | None
+    predicates: Tuple[Predicate, ...] = ()
+
+
+@dataclass(slots=True)
+class Frame:
+    """Per-element parser state: matched step bitmasks and sibling position counters."""
+
+    active: int
+    inherited: int
+    counts: Dict[Tuple[int, int], int] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Selector:
+    """A compiled selector; ``text_contains`` snippets must appear in a match's text."""
+
+    steps: Tuple[Step, ...]
+    text_contains: Tuple[str, ...] = ()
+
+    def root(self) -> Frame:
+        return Frame(active=1, inherited=1)
+
+    def enter(self, parent: Frame, tag: str, attrs: Dict[str, str]) -> Frame:
+        """Return the frame for an element opened inside ``parent``."""
+
+        tag = tag.lower()
+        active = 0
+        for index, step in enumerate(self.steps):
+            bit = 1 << index
+            if not (parent.active if step.child else parent.inherited) & bit:
+                continue
+            if step.tag is not None and step.tag != tag:
+                continue
+            if self._accepts(index, step, parent, attrs):
+                active |= bit << 1
+        return Frame(active=active, inherited=parent.inherited | active)
+
+    def matches(self, frame: Frame) -> bool:
+        return bool(frame.active >> len(self.steps) & 1)
+
+    def accepts_text(self, text: str) -> bool:
+        return all(snippet in text for snippet in self.text_contains)
+
+    @staticmethod
+    def _accepts(index: int, step: Step, parent: Frame, attrs: Dict[str, str]) -> bool:
+        for position, predicate in enumerate(step.predicates):
+            if predicate.op != "position":
+                if not predicate.test(attrs):
+                    return False
+                continue
+            if parent.counts is None:
+                parent.counts = {}
+            key = (index, position)
+            seen = parent.counts.get(key, 0) + 1
+            parent.counts[key] = seen
+            if seen != int(predicate.value):
+                return False
+        return True
+
+
+def _css_compound(selector: str, tokens: List[re.Match[str]]) -> Tuple[str | None, List[Predicate]]:
+    tag: str | None = None
+    predicates: List[Predicate] = []
+    for index, token in enumerate(tokens):
+        if token.group("tag"):
+            if index:
+                raise ParseError(f"Unsupported CSS selector: {selector}")
+            name = token.group("tag").lower()
+            tag = None if name == "*" else name
+        elif token.group("cls"):
+            predicates.append(Predicate("~=", "class", token.group("cls"), fold=True))
+        elif token.group("id"):
+            predicates.append(Predicate("=", "id", token.group("id"), fold=True))
+        else:
+            name = token.group("attr").lower()
+            op = token.group("op")
+            if op is None:
+                predicates.append(Predicate("exists", name))
+                continue
+            value = next(v for v in token.group("dq", "sq", "bare") if v is not None)
+            predicates.append(Predicate(op, name, value))  # type: ignore[arg-type]
+    return tag, predicates
+
+
+@lru_cache(maxsize=_SELECTOR_CACHE_SIZE)
+def compile_css(selector: str) -> Selector:
+    """Compile a CSS selector; raise ``ParseError`` when it uses unsupported syntax."""
+
+    source = selector.strip()
+    if not source:
+        raise ParseError("Empty CSS selector")
+    steps: List[Step] = []
+    compound: List[re.Match[str]] = []
+    child = False
+    position = 0
+    while position < len(source):
+        token = _CSS_TOKEN.match(source, position)
+        if token is None:
+            raise ParseError(f"Unsupported CSS selector: {selector}")
+        position = token.end()
+        if token.group("child") is not None or token.group("space") is not None:
+            if not compound:
+                raise ParseError(f"Unsupported CSS selector: {selector}")
+            tag, predicates = _css_compound(selector, compound)
+            steps.append(Step(child, tag, tuple(predicates)))
+            compound = []
+            child = token.group("child") is not None
+            continue
+        compound.append(token)
+    if not compound:
+        raise ParseError(f"Unsupported CSS selector: {selector}")
+    tag, predicates = _css_compound(selector, compound)
+    steps.append(Step(child, tag, tuple(predicates)))
+    return Selector(tuple(steps))
+
+
+def _xpath_predicate(expression: str, match: re.Match[str]) -> Predicate | str:
+    if match.group("position") is not None:
+        if int(match.group("position")) < 1:
+            raise ParseError(f"Unsupported XPath expression: {expression}")
+        return Predicate("position", value=match.group("position"))
+    if match.group("attr") is not None:
+        value: Optional[str] = match.group("dq")
+        if value is None:
+            value = match.group("sq")
+        if value is None:
+            return Predicate("exists", match.group("attr").lower())
+        return Predicate("=", match.group("attr").lower(), value)
+    value = match.group("fdq") if match.group("fdq") is not None else match.group("fsq")
+    if match.group("text") is not None:
+        if match.group("func") != "contains":
+            raise ParseError(f"Unsupported XPath expression: {expression}")
+        return value
+    op: Operator = "*=" if match.group("func") == "contains" else "^="
+    return Predicate(op, match.group("fattr").lower(), value)
+
+
+@lru_cache(maxsize=_SELECTOR_CACHE_SIZE)
+def compile_xpath(expression: str) -> Selector:
+    """Compile an XPath expression; raise ``ParseError`` when it uses unsupported syntax."""
+
+    source = expression.strip()
+    steps: List[Step] = []
+    text_contains: List[str] = []
+    position = 0
+    while position < len(source):
+        step = _XPATH_STEP.match(source, position)
+        if step is None or text_contains:
+            raise ParseError(f"Unsupported XPath expression: {expression}")
+        position = step.end()
+        predicates: List[Predicate] = []
+        while (predicate := _XPATH_PREDICATE.match(source, position)) is not None:
+            position = predicate.end()
+            parsed = _xpath_predicate(expression, predicate)
+            if isinstance(parsed, str):
+                text_contains.append(parsed)
+            elif text_contains:
+                # Text is only known once the element closes, so nothing that
+                # decides the match at the start tag may follow a text test.
+                raise ParseError(f"Unsupported XPath expression: {expression}")
+            else:
+                predicates.append(parsed)
+        name = step.group("tag").lower()
+        tag = None if name == "*" else name
+        steps.append(Step(step.group("axis") == "/", tag, tuple(predicates)))
+    if not steps:
+        raise ParseError(f"Unsupported XPath expression: {expression}")
+    return Selector(tuple(steps), tuple(text_contains))
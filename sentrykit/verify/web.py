@@ -2,45 +2,243 @@
 
 from __future__ import annotations
 
+import codecs
+import http.client
 import time
 import urllib.error
 import urllib.request
-from typing import Final
+import zlib
+from dataclasses import dataclass
+from typing import Any, Final, Generator, Iterator, Tuple
 
 from ..errors import NetworkError
 from ..utils.logging import get_logger
+from .breaker import DEFAULT_BREAKER, CircuitBreaker
 
 _LOGGER = get_logger(__name__)
 
 _DEFAULT_TIMEOUT: Final[float] = 5.0
 _DEFAULT_RETRIES: Final[int] = 2
 _USER_AGENT: Final[str] = "sentrykit/0.1.0"
+_ACCEPT_ENCODING: Final[str] = "gzip, deflate"
+_GZIP_ENCODINGS: Final[frozenset[str]] = frozenset({"gzip", "x-gzip"})
+_DEFAULT_CHARSET: Final[str] = "utf-8"
+_DEFAULT_MAX_BYTES: Final[int] = 8 * 1024 * 1024
+_DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024
+_DEFAULT_CONTENT_TYPES: Final[Tuple[str, ...]] = (
+    "text/",
+    "application/xhtml+xml",
+    "application/xml",
+    "application/json",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class FetchLimits:
+    """Bounds applied to every evidence download.
+
+    Content types ending in ``/`` match as prefixes (``text/`` allows ``text/html``).
+    An empty ``content_types`` tuple disables the allow-list.
+    """
+
+    max_bytes: int = _DEFAULT_MAX_BYTES
+    content_types: Tuple[str, ...] = _DEFAULT_CONTENT_TYPES
+    chunk_size: int = _DEFAULT_CHUNK_SIZE
+
+
+@dataclass(slots=True)
+class FetchStats:
+    """Transfer accounting for a single evidence fetch.
+
+    ``wire_bytes`` counts the body as received; ``decoded_bytes`` counts it after
+    content decoding, so the ratio is the compression gain.
+    """
+
+    content_encoding: str = "identity"
+    charset: str = _DEFAULT_CHARSET
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
 
 
 def _make_request(url: str) -> urllib.request.Request:
-    return urllib.request.Request(url, headers={"User-Agent": _USER_AGENT})
+    return urllib.request.Request(
+        url, headers={"User-Agent": _USER_AGENT, "Accept-Encoding": _ACCEPT_ENCODING}
+    )
 
 
-def fetch_text(url: str, *, timeout: float | None = None) -> str:
-    """Fetch text content from a URL with retries and structured logging."""
+def _charset_of(headers: Any) -> str:
+    charset = headers.get_content_charset() if hasattr(headers, "get_content_charset") else None
+    if not charset:
+        return _DEFAULT_CHARSET
+    try:
+        return codecs.lookup(charset).name
+    except LookupError:
+        return _DEFAULT_CHARSET
+
+
+def _read_raw(response: Any, chunk_size: int, stats: FetchStats) -> Iterator[bytes]:
+    while True:
+        chunk = response.read(chunk_size)
+        if not chunk:
+            return
+        stats.wire_bytes += len(chunk)
+        yield chunk
+
+
+def _is_zlib_header(data: bytes) -> bool:
+    return len(data) >= 2 and data[0] & 0x0F == 8 and ((data[0] << 8) | data[1]) % 31 == 0
+
+
+def _inflate(raw: Iterator[bytes], encoding: str, chunk_size: int) -> Iterator[bytes]:
+    """Decompress a gzip or deflate body without ever holding more than ``chunk_size`` output."""
+
+    decompressor: Any = None
+    for data in raw:
+        if decompressor is None:
+            if encoding in _GZIP_ENCODINGS:
+                wbits = 16 + zlib.MAX_WBITS
+            else:
+                # Servers disagree on whether "deflate" means zlib-wrapped or raw.
+                wbits = zlib.MAX_WBITS if _is_zlib_header(data) else -zlib.MAX_WBITS
+            decompressor = zlib.decompressobj(wbits)
+        pending = data
+        while pending:
+            try:
+                out = decompressor.decompress(pending, chunk_size)
+            except zlib.error as exc:
+                raise NetworkError(f"Corrupt {encoding} response body: {exc}") from exc
+            if out:
+                yield out
+            pending = decompressor.unconsumed_tail
+    if decompressor is not None:
+        tail = decompressor.flush()
+        if tail:
+            yield tail
 
-    timeout_value = timeout or _DEFAULT_TIMEOUT
+
+def _content_type_allowed(header: str | None, allowed: Tuple[str, ...]) -> bool:
+    if not header or not allowed:
+        return True
+    media_type = header.split(";", 1)[0].strip().lower()
+    for entry in allowed:
+        entry = entry.lower()
+        if entry.endswith("/") and media_type.startswith(entry):
+            return True
+        if media_type == entry:
+            return True
+    return False
+
+
+def _open(url: str, timeout: float, breaker: CircuitBreaker) -> Any:
     last_error: Exception | None = None
     for attempt in range(_DEFAULT_RETRIES + 1):
+        breaker.check(url)
         try:
             request = _make_request(url)
-            with urllib.request.urlopen(request, timeout=timeout_value) as response:  # type: ignore[arg-type]
-                status = response.getcode() or 200
-                if status >= 400:
-                    raise NetworkError(f"HTTP {status} for {url}")
-                body = response.read().decode("utf-8", errors="replace")
-                return body
-        except (urllib.error.URLError, urllib.error.HTTPError, NetworkError) as exc:
+            response = urllib.request.urlopen(request, timeout=timeout)
+            status = response.getcode() or 200
+            if status >= 400:
+                response.close()
+                raise urllib.error.HTTPError(url, status, f"HTTP {status}", response.headers, None)
+        except urllib.error.HTTPError as exc:
+            if 400 <= exc.code < 500:
+                breaker.record_client_error(url, f"HTTP {exc.code}")
+                raise NetworkError(f"HTTP {exc.code} for {url}") from exc
+            breaker.record_failure(url)
             last_error = exc
-            _LOGGER.warning(
-                "web_fetch_failed",
-                extra={"_sk_url": url, "_sk_attempt": attempt, "_sk_error": str(exc)},
-            )
-            if attempt < _DEFAULT_RETRIES:
-                time.sleep(0.2 * (attempt + 1))
+        except OSError as exc:
+            breaker.record_failure(url)
+            last_error = exc
+        except Exception:
+            # Anything else (an invalid URL, say) still counts against the host.
+            breaker.record_failure(url)
+            raise
+        else:
+            breaker.record_success(url)
+            return response
+        finally:
+            breaker.end_probe(url)
+        _LOGGER.warning(
+            "web_fetch_failed",
+            extra={"_sk_url": url, "_sk_attempt": attempt, "_sk_error": str(last_error)},
+        )
+        if attempt < _DEFAULT_RETRIES:
+            time.sleep(0.2 * (attempt + 1))
     raise NetworkError(f"Failed to fetch {url}: {last_error}")
+
+
+def stream_text(
+    url: str,
+    *,
+    timeout: float | None = None,
+    limits: FetchLimits | None = None,
+    stats: FetchStats | None = None,
+    breaker: CircuitBreaker | None = None,
+) -> Generator[str, None, None]:
+    """Yield decoded text chunks from a URL, enforcing the byte cap and content-type allow-list.
+
+    gzip and deflate bodies are decompressed incrementally and the text is decoded
+    with the charset from the response headers. The byte cap applies to the
+    decompressed body. Closing the iterator early closes the underlying
+    connection, so callers that stop reading once they have found what they need
+    never download the rest.
+
+    Every attempt goes through ``breaker`` (the process-wide default when
+    omitted), so a failing host or a URL that recently answered 4xx raises
+    :class:`~sentrykit.errors.CircuitOpenError` without touching the network.
+    A connection that fails while the body is read raises
+    :class:`~sentrykit.errors.NetworkError` too.
+    """
+
+    limits = limits or FetchLimits()
+    stats = stats if stats is not None else FetchStats()
+    response = _open(url, timeout or _DEFAULT_TIMEOUT, breaker or DEFAULT_BREAKER)
+    with response:
+        headers = response.headers
+        content_type = headers.get("Content-Type")
+        if not _content_type_allowed(content_type, limits.content_types):
+            raise NetworkError(f"Content type {content_type} not allowed for {url}")
+        stats.content_encoding = (headers.get("Content-Encoding") or "identity").strip().lower()
+        stats.charset = _charset_of(headers)
+        body = _read_raw(response, limits.chunk_size, stats)
+        if stats.content_encoding in _GZIP_ENCODINGS or stats.content_encoding == "deflate":
+            body = _inflate(body, stats.content_encoding, limits.chunk_size)
+        elif stats.content_encoding != "identity":
+            raise NetworkError(f"Unsupported content encoding {stats.content_encoding} for {url}")
+        decoder = codecs.getincrementaldecoder(stats.charset)(errors="replace")
+        try:
+            for chunk in body:
+                stats.decoded_bytes += len(chunk)
+                if stats.decoded_bytes > limits.max_bytes:
+                    raise NetworkError(f"Response for {url} exceeded {limits.max_bytes} bytes")
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+        except (OSError, http.client.HTTPException) as exc:
+            raise NetworkError(f"Failed to read {url}: {exc}") from exc
+        finally:
+            _LOGGER.debug(
+                "web_fetch_complete",
+                extra={
+                    "_sk_url": url,
+                    "_sk_encoding": stats.content_encoding,
+                    "_sk_wire_bytes": stats.wire_bytes,
+                    "_sk_decoded_bytes": stats.decoded_bytes,
+                },
+            )
+
+
+def fetch_text(
+    url: str,
+    *,
+    timeout: float | None = None,
+    limits: FetchLimits | None = None,
+    stats: FetchStats | None = None,
+    breaker: CircuitBreaker | None = None,
+) -> str:
+    """Fetch text content from a URL with retries and structured logging."""
+
+    return "".join(stream_text(url, timeout=timeout, limits=limits, stats=stats, breaker=breaker))
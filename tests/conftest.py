@@ -3,4 +3,36 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sentrykit.models import Claim, RunInput, RunOutput  # noqa: E402
+
+
+class FakeClock:
+    """A monotonic clock the test moves by setting ``now``."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_run(claim: Claim) -> RunInput:
+    """A run whose output makes nothing but ``claim``."""
+
+    return RunInput(
+        goal="",
+        constraints=[],
+        messages=[],
+        contexts=[],
+        tool_calls=[],
+        output=RunOutput(text="", claims=[claim]),
+    )
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
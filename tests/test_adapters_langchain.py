@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import gc
+import types
+import uuid
+
 import pytest
 
 from sentrykit.adapters.langchain import SentryKitCallback
@@ -14,3 +18,74 @@ def test_langchain_callback_blocks_goal_drift() -> None:
     callback.on_chain_start({}, {"goal": "Find Austin internship paying $5,000", "constraints": ["Austin only"]})
     with pytest.raises(PolicyViolationError):
         callback.on_chain_end({"output_text": "Here is a Dallas internship paying $5,500"})
+
+
+def test_langchain_callback_keeps_state_per_root_run() -> None:
+    policy = Policy(block_on={"goal_drift"}, min_pay_threshold=5000)
+    callback = SentryKitCallback(policy, GuardEngine(policy))
+    austin, dallas = uuid.uuid4(), uuid.uuid4()
+    nested, tool = uuid.uuid4(), uuid.uuid4()
+    callback.on_chain_start({}, {"goal": "Find Austin internships"}, run_id=austin)
+    callback.on_chain_start({}, {"goal": "Find Dallas internships"}, run_id=dallas)
+    callback.on_tool_start({}, "search", run_id=tool, parent_run_id=austin)
+    callback.on_chain_start({}, {"input": "Find Dallas roles"}, run_id=nested, parent_run_id=tool)
+    callback.on_tool_end("done", name="shell", run_id=tool, parent_run_id=austin, inputs={"q": "x"})
+
+    # A nested chain ending is not the end of the run, whatever its output says.
+    callback.on_chain_end({"output_text": "A Dallas internship"}, run_id=nested, parent_run_id=tool)
+    callback.on_chain_end({"output_text": "A Dallas internship"}, run_id=dallas)
+    assert list(callback._states) == [austin]
+    assert callback._states[austin].goal == "Find Austin internships"
+    assert [call.name for call in callback._states[austin].tool_calls] == ["shell"]
+
+    with pytest.raises(PolicyViolationError):
+        callback.on_chain_end({"output_text": "A Dallas internship"}, run_id=austin)
+    assert callback._states == {} and callback._roots == {}
+
+
+def test_langchain_callback_nests_chains_under_retriever_and_model_runs() -> None:
+    policy = Policy(block_on={"goal_drift"})
+    callback = SentryKitCallback(policy, GuardEngine(policy))
+    root, retriever, query_chain, llm, chat, parser = (uuid.uuid4() for _ in range(6))
+    callback.on_chain_start({}, {"goal": "Find Austin internships"}, run_id=root)
+    callback.on_retriever_start({}, "austin", run_id=retriever, parent_run_id=root)
+    # A multi-query retriever runs a chain of its own to rewrite the query.
+    callback.on_chain_start(
+        {}, {"question": "austin"}, run_id=query_chain, parent_run_id=retriever
+    )
+    callback.on_llm_start({}, ["rewrite"], run_id=llm, parent_run_id=query_chain)
+    callback.on_chat_model_start({}, [[]], run_id=chat, parent_run_id=root)
+    callback.on_chain_start({}, {"input": "parse"}, run_id=parser, parent_run_id=llm)
+    callback.on_chain_end({"text": "Dallas internships"}, run_id=parser, parent_run_id=llm)
+    callback.on_chain_end(
+        {"text": "Dallas internships"}, run_id=query_chain, parent_run_id=retriever
+    )
+    assert list(callback._states) == [root]
+
+    callback.on_chain_end({"output_text": "An Austin internship"}, run_id=root)
+    assert callback._states == {} and callback._roots == {}
+
+
+def test_langchain_callback_memory_is_bounded_over_sequential_chains() -> None:
+    policy = Policy()
+    callback = SentryKitCallback(policy, GuardEngine(policy))
+    document = types.SimpleNamespace(metadata={"source": "kb"}, page_content="Austin roles " * 20)
+
+    def chain() -> None:
+        root, child = uuid.uuid4(), uuid.uuid4()
+        callback.on_chain_start({}, {"goal": "Find Austin internships"}, run_id=root)
+        callback.on_chain_start({}, {"input": "lookup"}, run_id=child, parent_run_id=root)
+        callback.on_retriever_end([document], run_id=uuid.uuid4(), parent_run_id=child)
+        callback.on_chain_end({"text": "lookup done"}, run_id=child, parent_run_id=root)
+        callback.on_chain_end({"output_text": "An Austin internship"}, run_id=root)
+
+    for _ in range(500):
+        chain()
+    gc.collect()
+    before = len(gc.get_objects())
+    for _ in range(10_000):
+        chain()
+    gc.collect()
+
+    assert callback._states == {} and callback._roots == {}
+    assert len(gc.get_objects()) - before < 100
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
-from sentrykit.checkers.drift import run
+import json
+from pathlib import Path
+
+import pytest
+
+from sentrykit.checkers import drift
+from sentrykit.checkers.drift import BaselineCache, run
+from sentrykit.errors import ParseError
 from sentrykit.models import RunInput, RunOutput
+from sentrykit.utils.gazetteer import Gazetteer
 
 
 BASE_GOAL = "Find Austin internship paying $5,000 per month for Summer 2026"
@@ -34,3 +42,86 @@ def test_drift_pay() -> None:
     findings = run(make_run("Austin internship paying $4,000 per month"), min_pay=5000)
     assert findings
     assert "below threshold" in findings[0].details
+
+
+def test_drift_metro_minor_and_word_boundaries() -> None:
+    findings = run(make_run("Round Rock internship paying $5,500 per month"), min_pay=5000)
+    assert findings[0].severity == "medium"
+    assert findings[0].evidence["classification"] == "minor"
+    # "Dallasite" is not a mention of Dallas.
+    output = "Austin role, team lead is a Dallasite, $5,500 per month"
+    assert not run(make_run(output), min_pay=5000)
+
+
+def test_gazetteer_file_longest_alias_and_metros(tmp_path: Path) -> None:
+    path = tmp_path / "places.json"
+    path.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "locations": [
+                    {"name": "new york", "aliases": ["nyc", "New York, NY"]},
+                    {"name": "york"},
+                    {"name": "jersey city", "metro": "new york"},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    gazetteer = Gazetteer.load(path)
+    assert gazetteer.find("Offices in New York, NY and York.") == {"new york", "york"}
+    assert gazetteer.find("NEW-YORK or nyc") == {"new york"}
+    assert gazetteer.metro_of("jersey city") == "new york"
+
+    def make(output: str) -> RunInput:
+        return RunInput("Find roles in NYC", [], [], [], [], RunOutput(text=output))
+
+    minor = run(make("Jersey City role"), gazetteer=gazetteer)
+    assert minor[0].evidence["offending"] == ["jersey city"]
+    assert minor[0].severity == "medium"
+    assert run(make("York role"), gazetteer=gazetteer)[0].severity == "high"
+
+
+def test_invalid_gazetteer_raises_parse_error(tmp_path: Path) -> None:
+    path = tmp_path / "places.json"
+    path.write_text(
+        json.dumps({"version": 1, "locations": [{"name": "leander", "metro": "austin"}]}),
+        encoding="utf-8",
+    )
+    with pytest.raises(ParseError):
+        Gazetteer.load(path)
+
+
+def test_combined_output_scan_matches_separate_extractors() -> None:
+    samples = [
+        "Austin internship paying $5,500 per month in Summer 2026 at a 120 employees startup",
+        "summer 2026,000 per month",
+        "Fall 2025 monthly stipend; winter 20266 per month; 40+ staff",
+        "midsummer 2027 and autumn  2028, 1,200 people, pays 4000/month",
+        "$3,000 a month then $6,000 per month, 12 employees or 900 staff",
+        "no features here at all",
+    ]
+    gazetteer = Gazetteer.default()
+    for text in samples:
+        features = drift._extract_output(text, gazetteer)
+        assert features.timeframes == drift._extract_timeframes(text)
+        assert features.pay == drift._extract_pay(text)
+        assert features.company_size == drift._extract_company_size(text)
+        assert features.locations == drift._extract_locations(text)
+
+
+def test_baseline_cache_parses_each_goal_once() -> None:
+    baselines = BaselineCache(maxsize=2)
+    outputs = ["Dallas role paying $5,500 per month", "Austin role paying $4,000 per month"]
+    for output in outputs * 50:
+        cached = run(make_run(output), baselines=baselines)
+        assert cached == run(make_run(output))
+    assert len(baselines) == 1
+    assert baselines.stats.misses == 1
+    assert baselines.stats.hits == 99
+
+    other = make_run("Dallas role")
+    other.constraints = ["Company must have 500 employees"]
+    run(other, baselines=baselines)
+    assert len(baselines) == 2
+    assert baselines.get(BASE_GOAL, BASE_CONSTRAINTS, Gazetteer.default()).pay == 5000
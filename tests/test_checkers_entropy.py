@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import math
+import random
+import string
+from collections import Counter
+
+import pytest
+
+from sentrykit.checkers import entropy
+from sentrykit.engine import GuardEngine
+from sentrykit.models import ContextChunk, RunInput, RunOutput
+from sentrykit.policy import Policy
+
+
+def _entropy(value: str) -> float:
+    length = len(value)
+    return -sum(count / length * math.log2(count / length) for count in Counter(value).values())
+
+
+def _run(output: str, context: str = "") -> RunInput:
+    return RunInput(
+        goal="",
+        constraints=[],
+        messages=[],
+        contexts=[ContextChunk(source="retriever", text=context)],
+        tool_calls=[],
+        output=RunOutput(text=output),
+    )
+
+
+def test_flags_unknown_high_entropy_token_with_location() -> None:
+    key = "Zx81QpLm0RtY6vWc2NbK4sHd9FgJ3aEu"
+    findings = entropy.run(_run("all good", f"config token={key} loaded"))
+    assert len(findings) == 1 and findings[0].kind == "high_entropy"
+    evidence = findings[0].evidence
+    assert evidence["source"] == "retriever"
+    assert evidence["offset"] == len("config token=")
+    assert evidence["value"].endswith(key[-4:]) and key not in evidence["value"]
+    assert evidence["entropy"] >= 4.3
+
+
+def test_ignores_prose_identifiers_hex_and_known_secrets() -> None:
+    text = " ".join(
+        [
+            "getUserAccountSettingsByIdentifier2024Version",
+            "the_quick_brown_fox_jumps_over_the_lazy_dog_2",
+            "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
+            "123e4567-e89b-12d3-a456-426614174000",
+            "sk-a1B2c3D4e5F6g7H8i9J0kLmNoPqRsTuV",
+        ]
+    )
+    assert entropy.run(_run(text)) == []
+    assert entropy.run(_run("Zx81QpLm0RtY6vWc2NbK4sHd9FgJ3aEu"), threshold=None) == []
+
+
+def test_sliding_window_matches_recounting() -> None:
+    rng = random.Random(5)
+    alphabets = [string.ascii_letters + string.digits, "abc123", string.hexdigits]
+    for _ in range(300):
+        alphabet = rng.choice(alphabets)
+        token = "".join(rng.choice(alphabet) for _ in range(rng.randint(24, 120)))
+        window = rng.choice([8, 16, 24])
+        threshold = rng.uniform(2.0, 4.5)
+        expected = next(
+            (
+                start
+                for start in range(len(token) - window + 1)
+                if _entropy(token[start : start + window]) >= threshold - 1e-9
+            ),
+            -1,
+        )
+        table = entropy._plogp_table(window)
+        limit = window * (math.log2(window) - threshold) + entropy._EPSILON
+        start, _ = entropy._first_window(token, window, limit, table)
+        assert start == expected
+
+
+def test_vectorized_path_matches_incremental() -> None:
+    pytest.importorskip("numpy")
+    rng = random.Random(9)
+    token = "ab12" * 5000 + "".join(rng.choice(string.ascii_letters) for _ in range(64))
+    table = entropy._plogp_table(32)
+    limit = 32 * (5 - 4.3) + entropy._EPSILON
+    expected = entropy._first_window(token, 32, limit, table)
+    found = entropy._first_window_vectorized(token, 32, limit, table)
+    assert found[0] == expected[0]
+    assert found[1] == pytest.approx(expected[1])
+
+
+def test_policy_configures_thresholds() -> None:
+    policy = Policy.from_dict({"entropy_threshold": None, "entropy_window": 24})
+    assert policy.entropy_threshold is None
+    assert Policy.from_dict(policy.to_dict()).entropy_window == 24
+
+
+def test_blocking_on_data_leak_ignores_high_entropy_tokens() -> None:
+    run = _run("Order id Zx81QpLm0RtY6vWc2NbK4sHd9FgJ3aEu shipped")
+    verdict = GuardEngine(Policy(block_on={"data_leak"}, entropy_threshold=4.3)).evaluate(run)
+    assert [finding.kind for finding in verdict.findings] == ["high_entropy"]
+    assert not verdict.blocked
+    policy = Policy(block_on={"high_entropy"}, entropy_threshold=4.3)
+    assert GuardEngine(policy).evaluate(run).blocked
+
+
+def test_entropy_scan_is_opt_in_and_reports_a_repeated_reply_once() -> None:
+    reply = "Your key is Zx81QpLm0RtY6vWc2NbK4sHd9FgJ3aEu"
+    run = _run(reply)
+    run.messages.append(("assistant", reply))
+    assert GuardEngine(Policy()).evaluate(run).findings == []
+    findings = GuardEngine(Policy(entropy_threshold=4.3)).evaluate(run).findings
+    assert [finding.evidence["source"] for finding in findings] == ["output"]
@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from sentrykit.checkers.hallucination import run
-from sentrykit.models import Claim, Extraction, RunInput, RunOutput
+from sentrykit.models import Claim, ContextChunk, Extraction, RunInput, RunOutput
 
 FIXTURES = Path(__file__).resolve().parent / "fixtures" / "pages"
 
@@ -40,3 +40,27 @@ def test_hallucination_fail() -> None:
     findings = run(_make_run(claim), fetcher=lambda url: html)
     assert findings
     assert findings[0].severity == "high"
+
+
+def test_hallucination_prefers_run_contexts() -> None:
+    html = (FIXTURES / "austin.html").read_text(encoding="utf-8")
+    claim = Claim(
+        statement="Pay is $5,500 per month",
+        evidence_urls=["https://jobs.example.com/austin#pay", "https://jobs.example.com/mirror"],
+        extraction=Extraction(kind="css", pattern="p", must_include="$5,500"),
+    )
+    run_input = _make_run(claim)
+    run_input.contexts.append(ContextChunk(source="https://jobs.example.com/austin/", text=html))
+
+    def offline(url: str) -> str:
+        raise AssertionError(f"unexpected fetch of {url}")
+
+    assert not run(run_input, fetcher=offline)
+
+    claim.evidence_urls = ["https://jobs.example.com/mirror"]
+    mapping = {"https://jobs.example.com/mirror": "https://jobs.example.com/austin/"}
+    assert not run(run_input, fetcher=offline, context_sources=mapping)
+
+    claim.extraction = Extraction(kind="contains", pattern="Pay", must_include="$9,999")
+    findings = run(run_input, fetcher=lambda url: html)
+    assert findings[0].evidence["evidence_paths"] == ["fetcher"]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from sentrykit.engine import GuardEngine
 from sentrykit.models import ContextChunk, Finding, RunInput, RunOutput, ToolCall
 from sentrykit.policy import Policy
@@ -45,3 +47,45 @@ def test_engine_internal_error(monkeypatch) -> None:
     monkeypatch.setattr("sentrykit.checkers.hallucination.run", boom)
     verdict = engine.evaluate(run)
     assert any(f.kind == "internal_error" for f in verdict.findings)
+
+
+def test_engine_caps_findings_per_kind_without_changing_decision(monkeypatch) -> None:
+    leaks = [Finding("data_leak", "medium", f"PII {index}", {"n": index}) for index in range(4999)]
+    leaks.append(Finding("data_leak", "high", "Detected potential secret in output"))
+    monkeypatch.setattr("sentrykit.checkers.leaks.run", lambda run, **_: list(leaks))
+    monkeypatch.setattr(
+        "sentrykit.checkers.drift.run", lambda run, **_: [Finding("goal_drift", "low", "Drift")]
+    )
+    run = RunInput(
+        goal="Test",
+        constraints=[],
+        messages=[],
+        contexts=[],
+        tool_calls=[],
+        output=RunOutput(text=""),
+    )
+
+    uncapped_policy = Policy(block_on={"data_leak:high"}, max_findings_per_kind=None)
+    uncapped = GuardEngine(uncapped_policy).evaluate(run)
+    verdict = GuardEngine(Policy(block_on={"data_leak:high"}, finding_samples=3)).evaluate(run)
+
+    assert verdict.blocked and uncapped.blocked
+    assert verdict.score == uncapped.score
+    assert verdict.reason == uncapped.reason
+    assert len(uncapped.findings) == 5001
+    assert [finding.kind for finding in verdict.findings] == ["data_leak", "goal_drift"]
+    aggregate = verdict.findings[0]
+    assert aggregate.severity == "high"
+    assert aggregate.evidence["count"] == 5000
+    assert aggregate.evidence["overflow"] == 4997
+    assert aggregate.evidence["by_severity"] == {"medium": 4999, "high": 1}
+    samples = aggregate.evidence["samples"]
+    assert [sample["details"] for sample in samples] == ["PII 0", "PII 1", "PII 2"]
+    assert "5000 data_leak findings" in verdict.report.html
+
+
+def test_policy_from_dict_converts_and_validates_finding_cap() -> None:
+    assert Policy.from_dict({"max_findings_per_kind": "25"}).max_findings_per_kind == 25
+    assert Policy.from_dict({"max_findings_per_kind": None}).max_findings_per_kind is None
+    with pytest.raises(ValueError):
+        Policy.from_dict({"max_findings_per_kind": 0})
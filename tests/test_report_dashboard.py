@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import io
+import json
+import re
+import tracemalloc
+from typing import Iterator
+
+from sentrykit.models import Finding, Verdict
+from sentrykit.report.dashboard import DashboardStats, iter_dashboard, write_dashboard
+
+
+class CountingSink:
+    def __init__(self) -> None:
+        self.size = 0
+
+    def writelines(self, lines) -> None:
+        for line in lines:
+            self.size += len(line)
+
+
+def _verdicts(count: int) -> Iterator[Verdict]:
+    for index in range(count):
+        findings = [
+            Finding(kind="goal_drift", severity="medium", details=f"Drift {index % 10}"),
+            Finding(
+                kind="data_leak",
+                severity="high",
+                details="Key AKIA1234567890ABCDEF leaked </script>",
+                evidence={"source": "output"},
+            ),
+        ][: index % 3]
+        yield Verdict(
+            blocked=bool(findings),
+            reason=f"run {index % 10}",
+            score=float(index % 7),
+            findings=findings,
+        )
+
+
+def test_dashboard_paginates_aggregates_and_embeds_findings() -> None:
+    stats = DashboardStats(top=3)
+    buffer = io.StringIO()
+    write_dashboard(_verdicts(25), buffer, page_size=10, stats=stats, title="Nightly <audit>")
+    page = buffer.getvalue()
+
+    assert page.count("<section class='page'") == 3
+    assert page.count("<section class='page' hidden>") == 2
+    assert "Nightly &lt;audit&gt;" in page
+    assert stats.runs == 25 and stats.blocked == 16 and stats.findings == 24
+    assert stats.by_kind == {"goal_drift": 16, "data_leak": 8}
+    assert [number for number, *_ in stats.top_offenders()] == [7, 14, 21]
+
+    payloads = re.findall(r"<script type='application/json'>(.*?)</script>", page)
+    assert len(payloads) == 25
+    kind, severity, details, evidence = json.loads(payloads[2])[1]
+    assert (kind, severity, evidence) == ("data_leak", "high", {"source": "output"})
+    assert details.endswith("CDEF leaked </script>")
+    assert "AKIA1234567890ABCDEF" not in page
+
+
+def test_dashboard_streams_in_constant_memory() -> None:
+    peaks = []
+    for count in (500, 5_000):
+        sink = CountingSink()
+        tracemalloc.start()
+        sink.writelines(iter_dashboard(_verdicts(count)))
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        assert sink.size > count * 100
+    assert peaks[1] < 128 * 1024
+    assert peaks[1] < peaks[0] * 2
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import io
+import tracemalloc
+from pathlib import Path
+
+from sentrykit.models import Finding, Verdict
+from sentrykit.report import html
+
+
+class CountingSink:
+    def __init__(self) -> None:
+        self.size = 0
+
+    def writelines(self, lines) -> None:
+        for line in lines:
+            self.size += len(line)
+
+
+def _verdict(count: int) -> Verdict:
+    findings = [
+        Finding(
+            kind="data_leak",
+            severity="high",
+            details=f"Secret {index % 10} <AKIA1234567890ABCDEF>",
+            evidence={"index": index, "sources": ["output", "context"]},
+        )
+        for index in range(count)
+    ]
+    return Verdict(blocked=True, reason="data_leak", score=float(count), findings=findings)
+
+
+def test_streamed_report_matches_render(tmp_path: Path) -> None:
+    verdict = _verdict(3)
+    report = html.render(verdict)
+    assert "AKIA1234567890ABCDEF" not in report.html
+    assert "&lt;" in report.html
+
+    buffer = io.StringIO()
+    html.write(verdict, buffer)
+    assert buffer.getvalue() == report.html
+    html.write(verdict, tmp_path / "report.html")
+    assert (tmp_path / "report.html").read_text(encoding="utf-8") == report.html
+
+    empty = html.render(Verdict(blocked=False, reason="No findings", score=0.0, findings=[]))
+    assert "<p>No findings.</p>" in empty.html and "{{" not in empty.html
+
+
+def test_streamed_report_memory_is_independent_of_findings() -> None:
+    peaks = []
+    for count in (500, 5_000):
+        verdict = _verdict(count)
+        sink = CountingSink()
+        tracemalloc.start()
+        html.write(verdict, sink)  # type: ignore[arg-type]
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        assert sink.size > count * 100
+    assert peaks[1] < 64 * 1024
+    assert peaks[1] < peaks[0] * 2
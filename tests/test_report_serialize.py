@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from sentrykit.errors import ParseError
+from sentrykit.models import Finding, Verdict
+from sentrykit.report import serialize
+
+
+def _verdicts() -> list[Verdict]:
+    verdicts = [
+        Verdict(blocked=False, reason="No findings", score=0.0, findings=[]),
+        Verdict(
+            blocked=True,
+            reason="data_leak; custom_check",
+            score=1.5,
+            findings=[
+                Finding("data_leak", "high", "Secret in output", {"pattern": "aws_access_key"}),
+                Finding("custom_check", "low", "Zürich ≠ Austin", {"nested": {"a": [1, 2]}}),
+                Finding("goal_drift", "medium", "x" * 5_000),
+            ],
+        ),
+    ]
+    # Enough distinct strings to need multi-byte intern references.
+    verdicts += [
+        Verdict(
+            blocked=True,
+            reason=f"reason {index}",
+            score=float(index),
+            findings=[Finding("data_leak", "high", f"detail {index}", {"index": index})],
+        )
+        for index in range(300)
+    ]
+    return verdicts
+
+
+def test_ndjson_round_trip(tmp_path: Path) -> None:
+    verdicts = _verdicts()
+    path = tmp_path / "verdicts.ndjson"
+    assert serialize.write_ndjson(verdicts, path) == len(verdicts)
+    assert list(serialize.read_ndjson(path)) == verdicts
+    with pytest.raises(ParseError):
+        list(serialize.read_ndjson(io.StringIO('{"blocked": true}\n')))
+
+
+def test_binary_round_trip_is_compact(tmp_path: Path) -> None:
+    verdicts = _verdicts() * 2
+    path = tmp_path / "verdicts.skvd"
+    assert serialize.write_binary(verdicts, path) == len(verdicts)
+    assert list(serialize.read_binary(path)) == verdicts
+
+    decoded = list(serialize.read_binary(path))
+    decoded[-1].findings[0].evidence["index"] = -1
+    assert verdicts[-1].findings[0].evidence["index"] == 299
+
+    ndjson = io.StringIO()
+    serialize.write_ndjson(verdicts, ndjson)
+    assert path.stat().st_size * 2 < len(ndjson.getvalue().encode("utf-8"))
+
+
+def test_binary_interned_findings_keep_evidence_types() -> None:
+    findings = [
+        Finding("goal_drift", "medium", "Pay below minimum threshold", {"min_pay": value})
+        for value in (1, 1.0, True, "1", None, 1)
+    ]
+    findings.append(Finding("goal_drift", "medium", "Pay below minimum threshold", {}))
+    verdicts = [Verdict(True, "goal_drift", 1.0, findings)] * 2
+    buffer = io.BytesIO()
+    serialize.write_binary(verdicts, buffer)
+    decoded = list(serialize.read_binary(io.BytesIO(buffer.getvalue())))
+    assert decoded == verdicts
+    for verdict in decoded:
+        values = [finding.evidence.get("min_pay", "-") for finding in verdict.findings]
+        assert [type(value) for value in values] == [int, float, bool, str, type(None), int, str]
+
+
+def test_binary_reader_rejects_bad_streams() -> None:
+    buffer = io.BytesIO()
+    serialize.write_binary(_verdicts()[:2], buffer)
+    data = buffer.getvalue()
+    with pytest.raises(ParseError):
+        list(serialize.read_binary(io.BytesIO(data[:-3])))
+    with pytest.raises(ParseError):
+        list(serialize.read_binary(io.BytesIO(b"JUNK" + data)))
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from sentrykit import GuardEngine, Policy
+from sentrykit.errors import ParseError
+from sentrykit.models import ContextChunk, RunInput, RunOutput
+from sentrykit.utils.fingerprints import SecretFingerprints
+
+VAULT = {
+    "prod/db-password": "Tr0ub4dor&3-prod-db",
+    "prod/api-token": "q8ZfW2LmX5vR0nTb7YcK1pHs",
+    "shared/passphrase": "correct horse battery staple",
+}
+
+
+def test_scan_finds_exact_secrets_at_their_offsets(tmp_path: Path) -> None:
+    path = tmp_path / "fingerprints.json"
+    SecretFingerprints.from_secrets(VAULT).save(path)
+    stored = path.read_text(encoding="utf-8")
+    assert not any(secret in stored for secret in VAULT.values())
+
+    fingerprints = SecretFingerprints.load(path)
+    text = (
+        "login with Tr0ub4dor&3-prod-db, token=q8ZfW2LmX5vR0nTb7YcK1pHs; "
+        "remember: correct horse battery staple. Near misses: q8ZfW2LmX5vR0nTb7YcK1pHS "
+        "and correct horse battery stapler-free"
+    )
+    found = sorted(fingerprints.scan(text), key=lambda hit: hit[1])
+    assert found == [
+        ("prod/db-password", text.index("Tr0ub4dor")),
+        ("prod/api-token", text.index("q8ZfW2")),
+        ("shared/passphrase", text.index("correct horse")),
+        ("shared/passphrase", text.rindex("correct horse")),
+    ]
+
+
+def test_scan_crosses_chunk_boundaries(monkeypatch: pytest.MonkeyPatch) -> None:
+    from sentrykit.utils import fingerprints as module
+
+    monkeypatch.setattr(module, "_CHUNK", 7)
+    fingerprints = SecretFingerprints.from_secrets(VAULT, salt=b"fixed salt")
+    text = "x" * 13 + VAULT["prod/api-token"] + "y" * 5 + VAULT["shared/passphrase"]
+    assert sorted(fingerprints.scan(text)) == [
+        ("prod/api-token", 13),
+        ("shared/passphrase", 13 + 24 + 5),
+    ]
+
+
+def test_invalid_fingerprint_file_raises_parse_error(tmp_path: Path) -> None:
+    path = tmp_path / "fingerprints.json"
+    path.write_text(json.dumps({"version": 99, "salt": "00", "fingerprints": []}))
+    with pytest.raises(ParseError):
+        SecretFingerprints.load(path)
+
+
+def test_engine_reports_known_secret_by_fingerprint_only() -> None:
+    engine = GuardEngine(
+        Policy(block_on={"data_leak:high"}),
+        secret_fingerprints=SecretFingerprints.from_secrets(VAULT),
+    )
+    run = RunInput(
+        goal="",
+        constraints=[],
+        messages=[],
+        contexts=[ContextChunk(source="retriever", text="db pass is Tr0ub4dor&3-prod-db")],
+        tool_calls=[],
+        output=RunOutput(text="All done."),
+    )
+    verdict = engine.evaluate(run)
+    assert verdict.blocked
+    known = [finding for finding in verdict.findings if "fingerprint" in finding.evidence]
+    assert [finding.evidence for finding in known] == [
+        {"fingerprint": "prod/db-password", "source": "retriever", "offset": 11}
+    ]
+    assert "Tr0ub4dor" not in verdict.report.html  # type: ignore[union-attr]
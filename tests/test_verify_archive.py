@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from conftest import make_run
+from sentrykit import GuardEngine, Policy
+from sentrykit.errors import NetworkError
+from sentrykit.models import Claim, Extraction, RunInput
+from sentrykit.verify.archive import EvidenceArchive
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "pages"
+
+
+def _make_run(url: str) -> RunInput:
+    claim = Claim(
+        statement="Pay is $5,500 per month",
+        evidence_urls=[url],
+        extraction=Extraction(kind="css", pattern="p", must_include="$5,500"),
+    )
+    return make_run(claim)
+
+
+def test_record_then_replay_offline(tmp_path: Path) -> None:
+    url = "https://jobs.example.com/austin"
+    html = (FIXTURES / "austin.html").read_text(encoding="utf-8")
+    policy = Policy(block_on={"hallucination"})
+    path = tmp_path / "evidence.skar"
+
+    with EvidenceArchive(path) as archive:
+        recorder = archive.recorder(lambda _: html)
+        assert not GuardEngine(policy, evidence_fetcher=recorder).evaluate(_make_run(url)).blocked
+        assert url in archive
+
+    with EvidenceArchive(path) as archive:
+        replayer = archive.replayer()
+        assert replayer(url) == html
+        assert not GuardEngine(policy, evidence_fetcher=replayer).evaluate(_make_run(url)).blocked
+        with pytest.raises(NetworkError):
+            replayer("https://jobs.example.com/unknown")
+
+
+def test_latest_record_wins_and_torn_tail_is_dropped(tmp_path: Path) -> None:
+    path = tmp_path / "evidence.skar"
+    with EvidenceArchive(path) as archive:
+        archive.record("https://a.example.com", "first")
+        archive.record("https://a.example.com", "second ünïcode")
+    with open(path, "ab") as handle:
+        handle.write(b"\x05\x00\x00\x00partial")
+
+    with EvidenceArchive(path) as archive:
+        assert len(archive) == 1
+        assert archive.get("https://a.example.com") == "second ünïcode"
+        archive.record("https://b.example.com", "third")
+
+    with EvidenceArchive(path) as archive:
+        assert sorted(archive.urls()) == ["https://a.example.com", "https://b.example.com"]
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import io
+import urllib.error
+import urllib.request
+from email.message import Message
+
+import pytest
+
+from conftest import FakeClock
+from sentrykit.checkers.hallucination import run
+from sentrykit.errors import CircuitOpenError, NetworkError
+from sentrykit.models import Claim, Extraction, RunInput, RunOutput
+from sentrykit.verify import web
+from sentrykit.verify.breaker import DEFAULT_BREAKER, CircuitBreaker
+
+
+@pytest.fixture
+def attempts(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+
+    def fake_urlopen(request: urllib.request.Request, timeout: float) -> None:
+        calls.append(request.full_url)
+        if "missing" in request.full_url:
+            raise urllib.error.HTTPError(
+                request.full_url, 404, "Not Found", None, None  # type: ignore[arg-type]
+            )
+        raise urllib.error.URLError("connection refused")
+
+    monkeypatch.setattr(web.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(web.time, "sleep", lambda _: None)
+    return calls
+
+
+def test_breaker_opens_and_half_opens(attempts: list[str], clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=10.0, clock=clock)
+
+    with pytest.raises(CircuitOpenError):
+        web.fetch_text("https://down.example.com/a", breaker=breaker)
+    assert len(attempts) == 2
+    assert breaker.is_open("https://down.example.com/b")
+
+    with pytest.raises(CircuitOpenError):
+        web.fetch_text("https://down.example.com/b", breaker=breaker)
+    assert len(attempts) == 2
+
+    clock.now = 11.0
+    with pytest.raises(CircuitOpenError):
+        web.fetch_text("https://down.example.com/b", breaker=breaker)
+    assert len(attempts) == 3
+
+    breaker.record_success("https://down.example.com/")
+    assert not breaker.is_open("https://down.example.com/")
+
+
+def test_negative_cache_short_circuits_client_errors(
+    attempts: list[str], clock: FakeClock
+) -> None:
+    breaker = CircuitBreaker(negative_ttl=5.0, clock=clock)
+    url = "https://ok.example.com/missing"
+
+    with pytest.raises(NetworkError, match="HTTP 404"):
+        web.fetch_text(url, breaker=breaker)
+    with pytest.raises(CircuitOpenError):
+        web.fetch_text(url, breaker=breaker)
+    assert attempts == [url]
+
+    clock.now = 6.0
+    with pytest.raises(NetworkError, match="HTTP 404"):
+        web.fetch_text(url, breaker=breaker)
+    assert len(attempts) == 2
+
+
+def test_hallucination_reports_circuit_open(attempts: list[str]) -> None:
+    url = "https://offline.example.com/listing"
+    claim = Claim(
+        statement="Pay is $5,500",
+        evidence_urls=[url],
+        extraction=Extraction(kind="contains", pattern="Pay", must_include="$5,500"),
+    )
+    run_input = RunInput(
+        goal="",
+        constraints=[],
+        messages=[],
+        contexts=[],
+        tool_calls=[],
+        output=RunOutput(text="", claims=[claim, claim]),
+    )
+    try:
+        for _ in range(DEFAULT_BREAKER.failure_threshold):
+            DEFAULT_BREAKER.record_failure(url)
+        findings = run(run_input)
+    finally:
+        DEFAULT_BREAKER.reset()
+    assert not attempts
+    assert all(f.evidence["errors"][0].startswith("fetch_error:circuit_open") for f in findings)
+
+
+def test_unexpected_probe_error_does_not_wedge_the_circuit(
+    monkeypatch: pytest.MonkeyPatch,
+    clock: FakeClock,
+) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=10.0, clock=clock)
+    url = "https://flaky.example.com/a"
+    breaker.record_failure(url)
+
+    def invalid(request: urllib.request.Request, timeout: float) -> None:
+        raise ValueError("invalid URL")
+
+    monkeypatch.setattr(web.urllib.request, "urlopen", invalid)
+    clock.now = 11.0
+    with pytest.raises(ValueError):
+        web.fetch_text(url, breaker=breaker)
+
+    class Response(io.BytesIO):
+        headers = Message()
+
+        def getcode(self) -> int:
+            return 200
+
+    monkeypatch.setattr(web.urllib.request, "urlopen", lambda request, timeout: Response(b"ok"))
+    clock.now = 22.0
+    assert web.fetch_text(url, breaker=breaker) == "ok"
+    assert not breaker.is_open(url)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from conftest import FakeClock, make_run
+from sentrykit.checkers.hallucination import run
+from sentrykit.errors import SandboxError
+from sentrykit.models import Claim, Extraction
+from sentrykit.utils.cache import LRUCache
+from sentrykit.verify.cache import EvidenceCache
+from sentrykit.verify.extract import compile_extraction
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "pages"
+
+
+def test_lru_cache_bounds_and_expires(clock: FakeClock) -> None:
+    cache: LRUCache[str, int] = LRUCache(2, ttl=10.0, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("c") == 3
+    clock.now = 11.0
+    assert cache.get("b") is None
+    assert cache.stats.evictions == 1
+    assert cache.stats.expirations == 1
+    assert cache.stats.hits == 1
+
+
+def test_repeat_claims_hit_document_and_result_caches() -> None:
+    html = (FIXTURES / "austin.html").read_text(encoding="utf-8")
+    fetched: list[str] = []
+
+    def fetcher(url: str) -> str:
+        fetched.append(url)
+        return html
+
+    claim = Claim(
+        statement="Pay is $5,500 per month",
+        evidence_urls=["https://jobs.example.com/austin"],
+        extraction=Extraction(kind="css", pattern="p", must_include="$5,500"),
+    )
+    cache = EvidenceCache()
+    for _ in range(3):
+        assert not run(make_run(claim), fetcher=fetcher, cache=cache)
+    assert fetched == ["https://jobs.example.com/austin"]
+    stats = cache.stats()
+    assert stats["documents"].hits == 2
+    assert stats["results"].hits == 2
+    assert stats["results"].misses == 1
+
+
+def test_changed_document_misses_results_without_dropping_shared_ones(clock: FakeClock) -> None:
+    cache = EvidenceCache(document_ttl=300.0, result_ttl=3600.0, clock=clock)
+    plan = compile_extraction(Extraction(kind="contains", pattern="Pay", must_include="$5,500"))
+    old = cache.documents.put("https://jobs.example.com/a", "Pay: $5,500")
+    mirror = cache.documents.put("https://mirror.example.com/a", "Pay: $5,500")
+    assert cache.results.verify(old, plan)
+
+    new = cache.documents.put("https://jobs.example.com/a", "Pay: $4,000")
+    assert not cache.results.verify(new, plan)
+    assert cache.results.stats.misses == 2
+    # Results are keyed by content, so another URL with the old content still hits,
+    # and outlive the document entry that produced them.
+    assert cache.results.verify(mirror, plan)
+    clock.now = 600.0
+    assert cache.documents.get("https://mirror.example.com/a") is None
+    assert cache.results.verify(mirror, plan)
+    assert cache.results.stats.hits == 2
+
+
+def test_sandbox_failures_are_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = EvidenceCache()
+    plan = compile_extraction(Extraction(kind="regex", pattern=r"\$5,500"), regex_guard="sandbox")
+    document = cache.documents.put("https://jobs.example.com/a", "Pay: $5,500")
+    outcomes = iter([SandboxError("Regex exceeded 1.00s time budget"), True])
+
+    def flaky(text: str) -> bool:
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(type(plan), "verify", lambda self, text: flaky(text))
+    with pytest.raises(SandboxError):
+        cache.results.verify(document, plan)
+    assert len(cache.results) == 0
+    assert cache.results.verify(document, plan)
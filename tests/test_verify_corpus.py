@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from conftest import make_run
+from sentrykit import GuardEngine, Policy
+from sentrykit.errors import NetworkError
+from sentrykit.models import Claim, Extraction
+from sentrykit.verify.corpus import EvidenceCorpus
+
+
+def test_corpus_builds_incrementally_and_survives_reopen(tmp_path: Path) -> None:
+    with EvidenceCorpus(tmp_path) as corpus:
+        corpus.add("https://ref.example.com/a", "Austin analyst role pays $5,500 per month")
+        corpus.commit()
+        corpus.add("https://ref.example.com/b", "Dallas role pays $4,000 per month")
+        assert corpus.search("PAYS $5,500") == ["https://ref.example.com/a"]
+        both = ["https://ref.example.com/a", "https://ref.example.com/b"]
+        assert corpus.search("per month") == both
+
+    with EvidenceCorpus(tmp_path) as corpus:
+        assert len(corpus) == 2
+        assert corpus.search("$4,000") == ["https://ref.example.com/b"]
+        corpus.add("https://ref.example.com/a", "Role withdrawn")
+        corpus.compact()
+        assert corpus.search("$5,500") == []
+        assert corpus.search("withdrawn") == ["https://ref.example.com/a"]
+        assert len(list(tmp_path.glob("segment-*.idx"))) == 1
+
+        fetch = corpus.fetcher()
+        assert fetch("https://ref.example.com/b").startswith("Dallas")
+        with pytest.raises(NetworkError):
+            fetch("https://ref.example.com/missing")
+
+
+def test_corpus_reindexes_documents_replaced_after_last_commit(tmp_path: Path) -> None:
+    corpus = EvidenceCorpus(tmp_path)
+    corpus.add("https://ref.example.com/a", "Austin analyst role pays $5,500 per month")
+    corpus.commit()
+    corpus.add("https://ref.example.com/a", "Role withdrawn")
+    # Reopen without committing, as after a crash.
+    with EvidenceCorpus(tmp_path) as reopened:
+        assert reopened.search("withdrawn") == ["https://ref.example.com/a"]
+        assert reopened.search("$5,500") == []
+
+
+def _offline(url: str) -> str:
+    raise NetworkError(f"offline: {url}")
+
+
+def test_engine_ignores_corpus_matches_unless_corpus_search_is_enabled(tmp_path: Path) -> None:
+    uncited = Claim(
+        statement="The Austin role pays $5,500 per month",
+        evidence_urls=[],
+        extraction=Extraction(kind="contains", pattern="pays $5,500"),
+    )
+    contradicted = Claim(
+        statement="The Austin role pays $5,500 per month",
+        evidence_urls=["https://ref.example.com/b"],
+        extraction=Extraction(kind="contains", pattern="pays $5,500"),
+    )
+    with EvidenceCorpus(tmp_path) as corpus:
+        corpus.add("https://ref.example.com/a", "Austin analyst role pays $5,500 per month")
+        corpus.add("https://ref.example.com/b", "Austin analyst role pays $4,000 per month")
+        engine = GuardEngine(
+            Policy(block_on={"hallucination"}), evidence_fetcher=_offline, evidence_corpus=corpus
+        )
+        assert engine.evaluate(make_run(uncited)).blocked
+        verdict = engine.evaluate(make_run(contradicted))
+    assert verdict.blocked
+    assert verdict.findings[0].evidence["evidence_paths"] == ["corpus"]
+
+
+def test_engine_verifies_contains_claims_against_corpus(tmp_path: Path) -> None:
+    policy = Policy(block_on={"hallucination"}, corpus_search=True)
+    supported = Claim(
+        statement="The Austin role pays $5,500 per month",
+        evidence_urls=[],
+        extraction=Extraction(kind="contains", pattern="pays $5,500"),
+    )
+    unsupported = Claim(
+        statement="The Austin role pays $9,000 per month",
+        evidence_urls=["https://jobs.example.com/austin"],
+        extraction=Extraction(kind="contains", pattern="pays $9,000"),
+    )
+    with EvidenceCorpus(tmp_path) as corpus:
+        corpus.add("https://ref.example.com/a", "Austin analyst role pays $5,500 per month")
+        engine = GuardEngine(policy, evidence_fetcher=_offline, evidence_corpus=corpus)
+        assert not engine.evaluate(make_run(supported)).blocked
+        verdict = engine.evaluate(make_run(unsupported))
+    assert verdict.blocked
+    evidence = verdict.findings[0].evidence
+    assert evidence["evidence_paths"] == ["fetcher", "corpus_search"]
+    assert evidence["errors"][-1] == "corpus_miss"
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from sentrykit.errors import ParseError
+from sentrykit.models import Extraction
+from sentrykit.verify.extract import compile_extraction, extract_css, extract_xpath
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "pages"
+
+
+def test_compile_extraction_is_memoized_and_hashable() -> None:
+    first = compile_extraction(Extraction(kind="css", pattern="span.pay", must_include="$5,500"))
+    second = compile_extraction(Extraction(kind="css", pattern="span.pay", must_include="$5,500"))
+    assert first is second
+    assert len({first, second}) == 1
+
+
+def test_regex_plans_key_on_their_guard_and_budget() -> None:
+    extraction = Extraction(kind="regex", pattern=r"\$5,500")
+    plans = {
+        compile_extraction(extraction),
+        compile_extraction(extraction, regex_guard="off"),
+        compile_extraction(extraction, regex_budget=2.0),
+    }
+    assert len(plans) == 3
+    assert compile_extraction(extraction) in plans
+
+
+@pytest.mark.parametrize(
+    "extraction",
+    [
+        Extraction(kind="contains", pattern="Pay", must_include="$5,500"),
+        Extraction(kind="regex", pattern=r"\$5,500 per month"),
+        Extraction(kind="css", pattern="body", must_include="$5,500"),
+        Extraction(kind="xpath", pattern="//body", must_include="$5,500"),
+    ],
+    ids=lambda extraction: extraction.kind,
+)
+def test_compiled_plan_verifies_document(extraction: Extraction) -> None:
+    html = (FIXTURES / "austin.html").read_text(encoding="utf-8")
+    plan = compile_extraction(extraction)
+    assert plan.verify(html)
+    assert plan.verify_stream(iter([html[:50], html[50:]]))
+
+
+def test_compile_extraction_rejects_unknown_kind() -> None:
+    with pytest.raises(ParseError):
+        compile_extraction(Extraction(kind="jsonpath", pattern="$.pay"))  # type: ignore[arg-type]
+
+
+def test_collector_handles_deep_nesting_and_limits() -> None:
+    depth = 400
+    html = "<div>" * depth + "<span class='pay'>$5,500</span> monthly" + "</div>" * depth
+    assert extract_css(html, "span.pay") == "$5,500"
+    assert extract_css(html, "div").startswith("$5,500 monthly")
+    assert extract_css("<p>Pay<br>is <b>$5,500</b>", "p") == "Pay is $5,500"
+    with pytest.raises(ParseError):
+        extract_css(html, "span.pay", max_depth=100)
+    with pytest.raises(ParseError):
+        extract_css(html, "span.pay", max_text=4)
+
+
+LISTINGS = (
+    "<html><body><div class='job main' data-id='job-42'><h2>Analyst</h2>"
+    "<ul><li>Remote</li><li class='pay'>$5,500</li><li>Austin</li></ul></div>"
+    "<div class='other'><ul><li>Dallas</li><li>$4,000</li></ul></div></body></html>"
+)
+
+
+@pytest.mark.parametrize(
+    ("selector", "expected"),
+    [
+        ("div.job li", "Remote $5,500 Austin"),
+        ("div.job > ul > li.pay", "$5,500"),
+        ("[data-id^=job] h2", "Analyst"),
+        ("div[class*=oth] li", "Dallas $4,000"),
+        ("div[data-id] > li", None),
+    ],
+)
+def test_css_combinators_and_attribute_operators(selector: str, expected: str | None) -> None:
+    if expected is None:
+        with pytest.raises(ParseError):
+            extract_css(LISTINGS, selector)
+    else:
+        assert extract_css(LISTINGS, selector) == expected
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected"),
+    [
+        ("//ul/li[2]", "$5,500 $4,000"),
+        ("//div[contains(@class, 'other')]//li[1]", "Dallas"),
+        ("//div[starts-with(@data-id, 'job')]/h2", "Analyst"),
+        ("//li[contains(., '$5,500')]", "$5,500"),
+        ("/html/body/div[2]/ul/li[last]", None),
+    ],
+)
+def test_xpath_contains_and_positional_predicates(expression: str, expected: str | None) -> None:
+    if expected is None:
+        with pytest.raises(ParseError):
+            extract_xpath(LISTINGS, expression)
+    else:
+        assert extract_xpath(LISTINGS, expression) == expected
+
+
+def test_selector_plans_verify_streamed_chunks() -> None:
+    extraction = Extraction(kind="css", pattern="div.job li.pay", must_include="$5,500")
+    plan = compile_extraction(extraction)
+    chunks = [LISTINGS[index : index + 7] for index in range(0, len(LISTINGS), 7)]
+    assert plan.verify_stream(iter(chunks))
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from sentrykit import GuardEngine, Policy
+from sentrykit.adapters.langchain import SentryKitCallback
+from sentrykit.models import Claim, Extraction
+from sentrykit.verify.cache import EvidenceCache
+from sentrykit.verify.prefetch import EvidencePrefetcher, find_urls
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "pages"
+
+
+def test_find_urls_walks_nested_values() -> None:
+    value = {"query": "see https://jobs.example.com/a.", "refs": [("https://b.example.com/x",)]}
+    assert list(find_urls(value)) == ["https://jobs.example.com/a", "https://b.example.com/x"]
+
+
+def test_prefetcher_bounds_pending_and_domains() -> None:
+    release = threading.Event()
+
+    def slow_fetch(url: str) -> str:
+        release.wait(5)
+        return url
+
+    cache = EvidenceCache()
+    prefetcher = EvidencePrefetcher(
+        cache, fetcher=slow_fetch, max_workers=1, max_pending=2, allowed_domains={"example.com"}
+    )
+    try:
+        assert prefetcher.submit("https://example.com/1")
+        assert not prefetcher.submit("https://example.com/1")
+        assert prefetcher.submit("https://example.com/2")
+        assert not prefetcher.submit("https://example.com/3")
+        assert not prefetcher.submit("https://other.org/1")
+        assert prefetcher.dropped == 1
+        release.set()
+        prefetcher.wait(5)
+        assert len(cache.documents) == 2
+    finally:
+        prefetcher.close()
+
+
+def test_langchain_callback_prefetches_tool_urls() -> None:
+    html = (FIXTURES / "austin.html").read_text(encoding="utf-8")
+    url = "https://jobs.example.com/austin/123"
+    fetched: list[str] = []
+
+    def fetch(target: str) -> str:
+        fetched.append(target)
+        return html
+
+    def offline(target: str) -> str:
+        raise AssertionError(f"evaluation refetched {target}")
+
+    policy = Policy(block_on={"hallucination"})
+    cache = EvidenceCache()
+    engine = GuardEngine(policy, evidence_cache=cache, evidence_fetcher=offline)
+    prefetcher = EvidencePrefetcher(cache, fetcher=fetch, allowed_domains={"jobs.example.com"})
+    callback = SentryKitCallback(policy, engine, prefetcher=prefetcher)
+    try:
+        callback.on_chain_start({}, {"goal": "Find Austin internships"})
+        callback.on_tool_end("done", name="job_scraper", inputs={"url": url})
+        claim = Claim(
+            statement="Pay is $5,500 per month",
+            evidence_urls=[url],
+            extraction=Extraction(kind="css", pattern="p", must_include="$5,500"),
+        )
+        callback.on_chain_end({"output_text": "Austin role paying $5,500", "claims": [claim]})
+    finally:
+        prefetcher.close()
+    assert fetched == [url]
+    assert cache.documents.stats.hits == 1
+
+
+def test_prefetcher_without_allow_list_fetches_nothing() -> None:
+    fetched: list[str] = []
+    prefetcher = EvidencePrefetcher(EvidenceCache(), fetcher=lambda url: fetched.append(url) or "")
+    try:
+        assert prefetcher.submit_all({"output": "see https://internal.example/admin"}) == 0
+        prefetcher.wait(5)
+    finally:
+        prefetcher.close()
+    assert fetched == []
+
+
+def test_langchain_root_run_waits_only_for_its_own_prefetches() -> None:
+    release = threading.Event()
+
+    def fetch(url: str) -> str:
+        if "slow" in url:
+            release.wait(10)
+        return ""
+
+    policy = Policy()
+    cache = EvidenceCache()
+    engine = GuardEngine(policy, evidence_cache=cache)
+    prefetcher = EvidencePrefetcher(cache, fetcher=fetch, allowed_domains={"jobs.example.com"})
+    callback = SentryKitCallback(policy, engine, prefetcher=prefetcher, prefetch_wait=10)
+    fast, slow = uuid.uuid4(), uuid.uuid4()
+    try:
+        callback.on_chain_start({}, {"goal": "Find Austin internships"}, run_id=fast)
+        callback.on_chain_start({}, {"goal": "Find Austin internships"}, run_id=slow)
+        callback.on_tool_end(
+            "https://jobs.example.com/slow", name="scraper", run_id=uuid.uuid4(), parent_run_id=slow
+        )
+        callback.on_tool_end(
+            "https://jobs.example.com/fast", name="scraper", run_id=uuid.uuid4(), parent_run_id=fast
+        )
+        started = time.perf_counter()
+        callback.on_chain_end({"output_text": "An Austin internship"}, run_id=fast)
+        assert time.perf_counter() - started < 5
+    finally:
+        release.set()
+        prefetcher.close()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from conftest import make_run
+from sentrykit.checkers.hallucination import run
+from sentrykit.errors import ParseError, SandboxError
+from sentrykit.models import Claim, Extraction
+from sentrykit.verify.safe_regex import RegexSandbox, check_pattern
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "regex"
+
+
+def _patterns(name: str) -> list[str]:
+    lines = (FIXTURES / name).read_text(encoding="utf-8").splitlines()
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+@pytest.mark.parametrize("pattern", _patterns("pathological.txt"))
+def test_pathological_patterns_are_rejected(pattern: str) -> None:
+    with pytest.raises(ParseError, match="Unsafe regular expression"):
+        check_pattern(pattern)
+
+
+@pytest.mark.parametrize("pattern", _patterns("safe.txt"))
+def test_claim_patterns_are_accepted(pattern: str) -> None:
+    check_pattern(pattern)
+
+
+def test_delimited_repeats_verify_under_the_default_guard() -> None:
+    claim = Claim(
+        statement="The team has 1,200 employees",
+        evidence_urls=["https://jobs.example.com/a"],
+        extraction=Extraction(kind="regex", pattern=r"(\d+,)*\d+ employees"),
+    )
+    evidence = "Acme has 1,200 employees in Austin"
+    assert run(make_run(claim), fetcher=lambda url: evidence) == []
+
+
+def test_rejected_pattern_surfaces_as_parse_error_finding() -> None:
+    claim = Claim(
+        statement="Pay is listed",
+        evidence_urls=["https://jobs.example.com/a"],
+        extraction=Extraction(kind="regex", pattern=r"(\w+\s?)+$"),
+    )
+    findings = run(make_run(claim), fetcher=lambda url: "word " * 40 + "!")
+    assert findings[0].evidence["errors"][0].startswith("parse_error:Unsafe regular expression")
+
+
+def test_sandbox_kills_runaway_search_and_recovers() -> None:
+    sandbox = RegexSandbox(budget=0.5)
+    try:
+        with pytest.raises(ParseError, match="time budget"):
+            sandbox.search(r"(a+)+$", "a" * 64 + "!")
+        assert sandbox.search(r"\$[0-9,]+", "Pay: $5,500", budget=10.0) == (5, 11)
+    finally:
+        sandbox.close()
+
+
+def test_sandbox_budget_excludes_worker_startup() -> None:
+    sandbox = RegexSandbox()
+    try:
+        assert sandbox.search("abc", "xxabc", budget=0.05) == (2, 5)
+        with pytest.raises(SandboxError, match="time budget"):
+            sandbox.search(r"(a+)+$", "a" * 64 + "!", budget=0.2)
+        # The restarted worker's startup must not eat into this tight budget.
+        assert sandbox.search("abc", "xxabc", budget=0.05) == (2, 5)
+    finally:
+        sandbox.close()
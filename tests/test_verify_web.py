@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import gzip
+import http.client
+import io
+import zlib
+from email.message import Message
+from pathlib import Path
+
+import pytest
+
+from conftest import make_run
+from sentrykit.checkers.hallucination import run
+from sentrykit.errors import NetworkError
+from sentrykit.models import Claim, Extraction
+from sentrykit.verify import extract
+from sentrykit.verify import web
+from sentrykit.verify.web import FetchLimits, FetchStats, fetch_text, stream_text
+
+
+class FakeResponse(io.BytesIO):
+    def __init__(self, body: bytes, headers: dict[str, str]) -> None:
+        super().__init__(body)
+        self.headers = Message()
+        for key, value in headers.items():
+            self.headers[key] = value
+
+    def getcode(self) -> int:
+        return 200
+
+
+def _serve(monkeypatch: pytest.MonkeyPatch, body: bytes, headers: dict[str, str]) -> list[object]:
+    requests: list[object] = []
+
+    def fake_urlopen(request: object, timeout: float) -> FakeResponse:
+        requests.append(request)
+        return FakeResponse(body, headers)
+
+    monkeypatch.setattr(web.urllib.request, "urlopen", fake_urlopen)
+    return requests
+
+
+def test_contains_stream_stops_at_first_hit() -> None:
+    consumed: list[str] = []
+
+    def chunks():
+        for piece in ["Pay is $5,", "500 per month", "unreachable"]:
+            consumed.append(piece)
+            yield piece
+
+    assert extract.contains_stream(chunks(), "$5,500")
+    assert consumed == ["Pay is $5,", "500 per month"]
+
+
+def test_regex_stream_matches_across_boundary() -> None:
+    chunks = iter(["Salary: $5,", "500 per month. Apply now"])
+    text = extract.extract_regex_stream(chunks, r"\$[0-9,]+ per month")
+    assert text == "$5,500 per month"
+
+
+def test_stream_text_enforces_byte_cap(tmp_path: Path) -> None:
+    page = tmp_path / "big.txt"
+    page.write_text("x" * 5000, encoding="utf-8")
+    with pytest.raises(NetworkError):
+        fetch_text(page.as_uri(), limits=FetchLimits(max_bytes=1000, chunk_size=256))
+
+
+def test_stream_text_rejects_disallowed_content_type(tmp_path: Path) -> None:
+    page = tmp_path / "blob.bin"
+    page.write_bytes(b"\x00\x01")
+    with pytest.raises(NetworkError):
+        list(stream_text(page.as_uri(), limits=FetchLimits(content_types=("text/",))))
+
+
+def test_streaming_claim_terminates_before_cap(tmp_path: Path) -> None:
+    page = tmp_path / "listing.txt"
+    page.write_text("Pay is $5,500 per month\n" + "filler " * 20000, encoding="utf-8")
+    claim = Claim(
+        statement="Pay is $5,500 per month",
+        evidence_urls=[page.as_uri()],
+        extraction=Extraction(kind="contains", pattern="Pay", must_include="$5,500"),
+    )
+    limits = FetchLimits(max_bytes=4096, chunk_size=1024)
+    assert not run(make_run(claim), stream=True, limits=limits)
+    findings = run(make_run(claim), limits=limits)
+    assert findings and "exceeded" in findings[0].evidence["errors"][0]
+
+
+def test_fetch_text_decompresses_gzip(monkeypatch: pytest.MonkeyPatch) -> None:
+    page = "<p>Pay is $5,500 per month</p>" * 200
+    requests = _serve(
+        monkeypatch,
+        gzip.compress(page.encode("utf-8")),
+        {"Content-Type": "text/html; charset=utf-8", "Content-Encoding": "gzip"},
+    )
+    stats = FetchStats()
+    limits = FetchLimits(chunk_size=64)
+    assert fetch_text("https://example.com/job", stats=stats, limits=limits) == page
+    accept = requests[0].get_header("Accept-encoding")  # type: ignore[attr-defined]
+    assert accept == "gzip, deflate"
+    assert stats.content_encoding == "gzip"
+    assert stats.decoded_bytes == len(page)
+    assert stats.wire_bytes < stats.decoded_bytes
+
+
+@pytest.mark.parametrize("wbits", [zlib.MAX_WBITS, -zlib.MAX_WBITS])
+def test_fetch_text_decompresses_deflate_and_decodes_charset(
+    monkeypatch: pytest.MonkeyPatch, wbits: int
+) -> None:
+    page = "Café salary £5,500"
+    compressor = zlib.compressobj(wbits=wbits)
+    body = compressor.compress(page.encode("latin-1")) + compressor.flush()
+    _serve(
+        monkeypatch,
+        body,
+        {"Content-Type": "text/plain; charset=iso-8859-1", "Content-Encoding": "deflate"},
+    )
+    assert fetch_text("https://example.com/job") == page
+
+
+def test_byte_cap_applies_to_decompressed_body(monkeypatch: pytest.MonkeyPatch) -> None:
+    _serve(monkeypatch, gzip.compress(b"a" * 100_000), {"Content-Encoding": "gzip"})
+    with pytest.raises(NetworkError):
+        fetch_text(
+            "https://example.com/bomb", limits=FetchLimits(max_bytes=10_000, chunk_size=1024)
+        )
+
+
+@pytest.mark.parametrize(
+    "error", [TimeoutError("timed out"), http.client.IncompleteRead(b"partial", 100)]
+)
+def test_stream_text_wraps_errors_while_reading_body(
+    monkeypatch: pytest.MonkeyPatch, error: Exception
+) -> None:
+    class BrokenResponse(FakeResponse):
+        def read(self, size: int | None = -1) -> bytes:
+            if self.tell():
+                raise error
+            return super().read(4)
+
+    monkeypatch.setattr(
+        web.urllib.request,
+        "urlopen",
+        lambda request, timeout: BrokenResponse(b"Pay is $5,500", {"Content-Type": "text/plain"}),
+    )
+    with pytest.raises(NetworkError, match="Failed to read"):
+        fetch_text("https://example.com/flaky")